@@ -6,7 +6,7 @@ import asyncio
 from typing import Optional, Dict, Any
 
 from utils.llm_client import LLMClient
-from config.credentials_manager import CredentialsManager
+from config.credentials_manager import CredentialsManager, get_credentials_manager
 from ai.agent import run_agent
 from rich.console import Console
 from rich.markdown import Markdown
@@ -58,7 +58,7 @@ def run_full_ai_assistant():
     console.print("Type [bold]'exit'[/bold] or [bold]'quit'[/bold] to return to the main menu.\n")
     
     # Initialize credentials manager
-    credentials_manager = CredentialsManager()
+    credentials_manager = get_credentials_manager()
     aws_credentials = credentials_manager.get_aws_credentials()
     
     if not aws_credentials or not aws_credentials.get("access_key") or not aws_credentials.get("secret_key"):
@@ -1,5 +1,6 @@
 import logging
 import os
+import re
 import uuid
 import time
 from typing import Dict, List, Optional, Any, Union
@@ -9,11 +10,14 @@ from starlette.responses import JSONResponse
 
 from utils.task_tracker import TaskTracker
 from utils.llm_client import LLMClient
-from config.credentials_manager import CredentialsManager
+from config.credentials_manager import get_credentials_manager
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# OPENAI_API_KEY assignment in a .env file
+_OPENAI_KEY_RE = re.compile(r'OPENAI_API_KEY=(.+)')
+
 # Create router
 router = APIRouter()
 
@@ -66,14 +70,13 @@ async def get_llm_client():
     
     # If not found in environment, try credentials manager
     if not openai_key:
-        credentials_manager = CredentialsManager()
+        credentials_manager = get_credentials_manager()
         openai_key = credentials_manager.get_openai_key()
     
     if not openai_key:
         # One last attempt - read the .env file directly
         try:
             from pathlib import Path
-            import re
             
             env_paths = [
                 Path(".env"),
@@ -85,7 +88,7 @@ async def get_llm_client():
                 if env_path.exists():
                     logger.info(f"Reading .env file directly from {env_path}")
                     env_content = env_path.read_text()
-                    key_match = re.search(r'OPENAI_API_KEY=(.+)', env_content)
+                    key_match = _OPENAI_KEY_RE.search(env_content)
                     
                     if key_match:
                         openai_key = key_match.group(1).strip()
@@ -107,7 +110,7 @@ async def get_llm_client():
     logger.info(f"Using OpenAI API key: {masked_key}")
     
     # Create LLM client with key
-    credentials_manager = CredentialsManager()
+    credentials_manager = get_credentials_manager()
     return LLMClient(api_key=openai_key, credentials_manager=credentials_manager)
 
 @router.post("/agent/tasks", response_model=AgentTaskResponse, tags=["Agent"])
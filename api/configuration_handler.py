@@ -7,7 +7,7 @@ from fastapi import HTTPException
 from pydantic import BaseModel
 from typing import Dict, Any, List, Optional
 
-from config.credentials_manager import CredentialsManager
+from config.credentials_manager import get_credentials_manager
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -22,7 +22,7 @@ class ConfigurationModel(BaseModel):
 
 class ConfigurationHandler:
     def __init__(self):
-        self.credentials_manager = CredentialsManager()
+        self.credentials_manager = get_credentials_manager()
         
     def update_env_file(self, updates):
         """Update the .env file with new values."""
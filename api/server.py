@@ -3,7 +3,6 @@ import subprocess
 import threading
 import time
 import os
-import ssl
 import uuid
 from fastapi import FastAPI, HTTPException, Depends, Header, Request, Response, APIRouter
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -253,9 +252,9 @@ async def status():
     Returns information about the server's running state, host address, and port.
     """
     # Check for missing required configurations
-    from config.credentials_manager import CredentialsManager
+    from config.credentials_manager import get_credentials_manager
     from utils.task_tracker import TaskTracker
-    credentials_manager = CredentialsManager()
+    credentials_manager = get_credentials_manager()
     
     missing_configs = []
     
@@ -353,8 +352,8 @@ async def health_check():
     
     # Check HuggingFace API access
     try:
-        from config.credentials_manager import CredentialsManager
-        credentials_manager = CredentialsManager()
+        from config.credentials_manager import get_credentials_manager
+        credentials_manager = get_credentials_manager()
         _, huggingface_token = credentials_manager.get_huggingface_credentials()
         
         if huggingface_token:
@@ -389,9 +388,9 @@ async def health_check():
     # Check OpenAI API access
     try:
         from utils.llm_client import LLMClient
-        from config.credentials_manager import CredentialsManager
+        from config.credentials_manager import get_credentials_manager
         
-        creds_manager = CredentialsManager()
+        creds_manager = get_credentials_manager()
         llm_client = LLMClient(credentials_manager=creds_manager)
         
         if llm_client.api_key:
@@ -480,9 +479,9 @@ async def generate_dataset(
         # Import necessary components
         from .content_fetcher import ContentFetcher
         from huggingface.dataset_creator import DatasetCreator
-        from config.credentials_manager import CredentialsManager
+        from config.credentials_manager import get_credentials_manager
 
-        credentials_manager = CredentialsManager()
+        credentials_manager = get_credentials_manager()
 
         # Get GitHub credentials
         _username, _token = credentials_manager.get_github_credentials()
@@ -501,14 +500,20 @@ async def generate_dataset(
                 data=None,
             )
 
-        content_fetcher = ContentFetcher(github_token=_token)
         dataset_creator = DatasetCreator(huggingface_token=huggingface_token)
+        if not dataset_creator.validate_token():
+            return ApiResponse(
+                success=False,
+                message="HuggingFace token was rejected. Please update your credentials.",
+                data=None,
+            )
+        content_fetcher = ContentFetcher(github_token=_token, github_tokens=credentials_manager.get_github_tokens())
 
         # Process by source type
         if request.source_type.lower() == "organization":
             # Silent progress callback for API mode
             def progress_callback(percent, message=None):
-                logger.info(f"Progress: {percent:.0f}% - {message if message else ''}")
+                logger.info("Progress: %.0f%% - %s", percent, message or "")
 
             logger.info(f"Fetching repositories from organization: {request.source_name}")
             repos = content_fetcher.fetch_org_repositories(
@@ -558,7 +563,7 @@ async def generate_dataset(
         elif request.source_type.lower() == "repository":
             # Silent progress callback for API mode
             def progress_callback(percent, message=None):
-                logger.info(f"Progress: {percent:.0f}% - {message if message else ''}")
+                logger.info("Progress: %.0f%% - %s", percent, message or "")
 
             logger.info(f"Creating dataset from repository: {request.source_name}")
             result = dataset_creator.create_dataset_from_repository(
@@ -605,9 +610,9 @@ async def modify_dataset(
     try:
         # Import necessary components
         from huggingface.dataset_manager import DatasetManager
-        from config.credentials_manager import CredentialsManager
+        from config.credentials_manager import get_credentials_manager
 
-        credentials_manager = CredentialsManager()
+        credentials_manager = get_credentials_manager()
         _, huggingface_token = credentials_manager.get_huggingface_credentials()
 
         if not huggingface_token:
@@ -732,42 +737,25 @@ def start_server(api_key, host="0.0.0.0", port=8080, use_https=False, cert_file=
         server_status.host = host
         server_status.port = port
         
+        protocol = "https" if use_https else "http"
+        logger.info(f"Starting {protocol.upper()} FastAPI server on {host}:{port}")
+        logger.info(f"OpenAPI Schema available at: {protocol}://{host}:{port}/openapi.json")
+        logger.info(f"API Documentation available at: {protocol}://{host}:{port}/docs")
+        
+        # uvicorn loads the certificate chain itself when given the files
+        ssl_options = {}
         if use_https:
-            # Configure SSL context
-            ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
-            ssl_context.load_cert_chain(cert_file, key_file)
-            
-            # Log HTTPS server details
-            logger.info(f"Starting HTTPS FastAPI server on {host}:{port}")
-            logger.info(f"OpenAPI Schema available at: https://{host}:{port}/openapi.json")
-            logger.info(f"API Documentation available at: https://{host}:{port}/docs")
-            
-            
-            # Run with SSL context
-            uvicorn.run(
-                app, 
-                host=host, 
-                port=port, 
-                log_level="info",
-                ssl_certfile=cert_file,
-                ssl_keyfile=key_file
-            )
+            ssl_options = {"ssl_certfile": cert_file, "ssl_keyfile": key_file}
         else:
-            # Log HTTP server details
-            logger.info(f"Starting HTTP FastAPI server on {host}:{port}")
-            logger.info(f"OpenAPI Schema available at: http://{host}:{port}/openapi.json")
-            logger.info(f"API Documentation available at: http://{host}:{port}/docs")
-            
-                
             logger.warning("Running in HTTP mode. Consider using HTTPS for production deployments.")
-            
-            # Run without SSL
-            uvicorn.run(
-                app, 
-                host=host, 
-                port=port, 
-                log_level="info"
-            )
+        
+        uvicorn.run(
+            app, 
+            host=host, 
+            port=port, 
+            log_level="info",
+            **ssl_options
+        )
     
     if server_status.running:
         logger.warning("Server is already running")
@@ -858,8 +846,8 @@ async def chat_with_ai(request: dict):
             llm_client = LLMClient(api_key=api_key)
         else:
             # Use the server's configured API key
-            from config.credentials_manager import CredentialsManager
-            credentials_manager = CredentialsManager()
+            from config.credentials_manager import get_credentials_manager
+            credentials_manager = get_credentials_manager()
             openai_key = credentials_manager.get_openai_key()
             
             if not openai_key:
@@ -960,9 +948,9 @@ async def crawl_website(
     try:
         # Import necessary components
         from huggingface.dataset_creator import DatasetCreator
-        from config.credentials_manager import CredentialsManager
+        from config.credentials_manager import get_credentials_manager
         
-        credentials_manager = CredentialsManager()
+        credentials_manager = get_credentials_manager()
         
         # Get HuggingFace credentials
         hf_username, huggingface_token = credentials_manager.get_huggingface_credentials()
@@ -978,7 +966,7 @@ async def crawl_website(
         
         # Progress callback for logging
         def progress_callback(percent, message=None):
-            logger.info(f"Progress: {percent:.0f}% - {message if message else ''}")
+            logger.info("Progress: %.0f%% - %s", percent, message or "")
         
         # Create dataset from URL
         result = dataset_creator.create_dataset_from_url(
@@ -1140,10 +1128,10 @@ async def get_neo4j_info():
     """Get Neo4j connection information (uri and username only, not password)."""
     try:
         # Import credentials manager
-        from config.credentials_manager import CredentialsManager
+        from config.credentials_manager import get_credentials_manager
         
         # Get Neo4j credentials (sensitive info will be filtered)
-        credentials_manager = CredentialsManager()
+        credentials_manager = get_credentials_manager()
         neo4j_creds = credentials_manager.get_neo4j_credentials()
         
         if not neo4j_creds:
@@ -1220,7 +1208,7 @@ async def manage_knowledge_graph(
             
             if success:
                 # Initialize schema on the new graph
-                graph_store = GraphStore(graph_name=request.graph_name)
+                graph_store.use_graph(request.graph_name)
                 graph_store.initialize_schema()
                 
                 return ApiResponse(
@@ -1245,7 +1233,7 @@ async def manage_knowledge_graph(
                 )
             
             # Get statistics for the specified graph
-            graph_store = GraphStore(graph_name=request.graph_name)
+            graph_store.use_graph(request.graph_name)
             stats = graph_store.get_statistics()
             
             if stats:
@@ -2,7 +2,7 @@
 
 import os
 import logging
-from config.credentials_manager import CredentialsManager
+from config.credentials_manager import get_credentials_manager
 from utils.env_loader import load_environment_variables
 
 # Setup logging
@@ -28,7 +28,7 @@ def main():
     
     # Step 3: Check using credentials manager
     logger.info("Step 3: Checking using credentials manager")
-    credentials_manager = CredentialsManager()
+    credentials_manager = get_credentials_manager()
     creds_key = credentials_manager.get_openai_key()
     
     if creds_key:
@@ -41,7 +41,7 @@ def main():
     logger.info("Step 4: Checking .env file directly")
     try:
         from pathlib import Path
-        import re
+        from utils.env_loader import read_env_file
         
         env_paths = [
             Path(".env"),
@@ -51,14 +51,13 @@ def main():
         
         env_key_found = False
         for env_path in env_paths:
-            if env_path.exists():
+            env_values = read_env_file(env_path)
+            if env_values is not None:
                 logger.info(f"Reading .env file at {env_path.absolute()}")
-                env_content = env_path.read_text()
-                key_match = re.search(r'OPENAI_API_KEY=(.+)', env_content)
+                dotenv_key = env_values.get("OPENAI_API_KEY")
                 
-                if key_match:
-                    env_key = key_match.group(1).strip()
-                    masked_key = env_key[:4] + "..." + env_key[-4:] if len(env_key) > 8 else "***"
+                if dotenv_key:
+                    masked_key = dotenv_key[:4] + "..." + dotenv_key[-4:] if len(dotenv_key) > 8 else "***"
                     logger.info(f"Found OpenAI API key in .env file: {masked_key}")
                     env_key_found = True
                     break
@@ -1,46 +1,73 @@
 import json
 import os
-import sys
+import stat
 import logging
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from config.settings import CONFIG_DIR
-from utils.env_loader import load_environment_variables
+from utils.env_loader import load_environment_variables, read_env_file
+from utils import json_io
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
-# Global keyring status
-HAS_KEYRING = False
-KEYRING_CHECKED = False
+# config.json holds credentials, so it is readable and writable by the owner only
+_CONFIG_FILE_MODE = stat.S_IRUSR | stat.S_IWUSR
+
+# Config keys whose values are masked when the config is logged
+_SENSITIVE_CONFIG_KEYS = frozenset({
+    "huggingface_token", "openapi_key", "openai_key",
+    "neo4j_password", "neo4j_uri", "neo4j_username", "github_token", "github_tokens",
+    "aws_access_key", "aws_secret_key",
+})
+
+# Keyring backends block on IPC (D-Bus, Keychain), so multi-key lookups
+# run on this shared pool instead of one after another
+_keyring_executor = None
+_keyring_executor_lock = threading.Lock()
+
+
+def _get_keyring_executor():
+    """Get or create the thread pool used for concurrent keyring reads."""
+    global _keyring_executor
+    with _keyring_executor_lock:
+        if _keyring_executor is None:
+            _keyring_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="keyring")
+        return _keyring_executor
+
+
+# Serialises the first keyring probe so concurrent callers don't repeat it
+_keyring_lock = threading.Lock()
+
 
 def check_keyring():
-    """Check if keyring is available and working."""
-    global HAS_KEYRING, KEYRING_CHECKED
-    
-    if KEYRING_CHECKED:
-        return HAS_KEYRING
-        
+    """Check once per process whether keyring is available and working."""
+    # Fast path once the probe has run; otherwise wait for the thread running it
+    if _probe_keyring.cache_info().currsize:
+        return _probe_keyring()
+    with _keyring_lock:
+        return _probe_keyring()
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_keyring():
+    """Import keyring and verify a backend works. Call check_keyring() instead."""
     try:
         import keyring
-        # Check for and install keyrings.alt as fallback if needed
+        # keyrings.alt provides a fallback backend; it is not installed automatically
         try:
             import keyrings.alt
             logger.info("keyrings.alt is available as a fallback")
         except ImportError:
-            try:
-                import pip
-                logger.info("Installing keyrings.alt as a fallback keyring backend")
-                import subprocess
-                subprocess.check_call([sys.executable, "-m", "pip", "install", "keyrings.alt"])
-                import keyrings.alt
-            except Exception as e:
-                logger.warning(f"Could not install keyrings.alt: {e}")
+            logger.info("keyrings.alt not installed; run 'pip install keyrings.alt' for a fallback keyring backend")
                 
         # Test that keyring actually works (not just importable)
         try:
             keyring.get_keyring()
-            HAS_KEYRING = True
             logger.info("Keyring is available and will be used for storing credentials")
+            return True
         except Exception as e:
             # Try to set a fallback keyring
             try:
@@ -48,8 +75,8 @@ def check_keyring():
                 keyring.set_keyring(file.PlaintextKeyring())
                 # Verify the fallback works
                 keyring.get_keyring()
-                HAS_KEYRING = True
                 logger.info("Using PlaintextKeyring as fallback for storing credentials")
+                return True
             except Exception as fallback_error:
                 # Both main and fallback keyring failed
                 logger.warning(f"Keyring module found but not usable: {e}")
@@ -59,8 +86,7 @@ def check_keyring():
         # Keyring module not installed
         logger.warning("Keyring module not found, will store credentials in config file")
     
-    KEYRING_CHECKED = True
-    return HAS_KEYRING
+    return False
 
 
 class CredentialsManager:
@@ -77,42 +103,158 @@ class CredentialsManager:
     AWS_ACCESS_KEY = "aws_access_key"
     AWS_SECRET_KEY = "aws_secret_key"
     AWS_REGION_KEY = "aws_region"
+    # Keyring entries that are always read together
+    NEO4J_KEYRING_KEYS = (NEO4J_URI_KEY, NEO4J_USER_KEY, NEO4J_PASSWORD_KEY)
+    AWS_KEYRING_KEYS = (AWS_ACCESS_KEY, AWS_SECRET_KEY, AWS_REGION_KEY)
+    # OS environment variables the lookups read live, so changing one
+    # at runtime invalidates the cached credential
+    NEO4J_ENV_NAMES = ("NEO4J_URI", "NEO4J_USER", "NEO4J_PASSWORD")
+    AWS_ENV_NAMES = ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_REGION", "AWS_DEFAULT_REGION")
     CONFIG_FILE = CONFIG_DIR / "config.json"
+    # Plain-string path for the hot stat/open calls, which skip pathlib's wrappers
+    _CONFIG_PATH = str(CONFIG_FILE)
     
     # Default settings
     DEFAULT_SERVER_PORT = 8080
     DEFAULT_TEMP_DIR = str(Path(os.path.expanduser("~/.othertales_homework/temp")))
     DEFAULT_AWS_REGION = "us-east-1"
 
+    # Whether _extract_usernames_from_env() has already run in this process
+    _env_extracted = False
+    # Whether _ensure_config_file_exists() has already found or created the file
+    _config_file_checked = False
+
     def __init__(self):
+        # Guards the caches below; re-entrant because lookups call _load_config()
+        # while holding it
+        self._cache_lock = threading.RLock()
+        # Credential lookups cached against the config file's mtime: name -> (mtime, value).
+        # Set up first because _save_config() may run during construction.
+        self._credentials_cache = {}
+        # Parsed config.json and the mtime it was read at
+        self._config_cache = None
+        self._config_cache_mtime = None
+        # Bytes of the last config this instance wrote, to skip identical rewrites
+        self._last_written = None
+        self._last_written_mtime = None
         self._ensure_config_file_exists()
-        # Load environment variables
-        self.env_vars = load_environment_variables()
+        # Load environment variables, keyed by lowercase name so each lookup is a single probe
+        self.env_vars = {name.lower(): value for name, value in load_environment_variables().items()}
         # Extract usernames from tokens if available
         self._extract_usernames_from_env()
-        # Check keyring availability
-        self.has_keyring = check_keyring()
-        
-        if self.has_keyring:
+        # Keyring is checked on first credential access; cleared if it starts failing
+        self._keyring_enabled = True
+        # Keyring values read or written this session: key -> value
+        self._keyring_cache = {}
+
+    @functools.cached_property
+    def keyring(self):
+        """The keyring module, imported on first use, or None if it is unavailable."""
+        if check_keyring():
             import keyring
-            self.keyring = keyring
-        else:
-            self.keyring = None
+            return keyring
+        return None
+
+    @property
+    def has_keyring(self):
+        """Whether credentials can be stored in and read from the keyring."""
+        return self._keyring_enabled and self.keyring is not None
+
+    @has_keyring.setter
+    def has_keyring(self, value):
+        self._keyring_enabled = value
+
+    def _keyring_get_many(self, *keys):
+        """
+        Read several keyring entries, in one Secret Service search where possible.
+
+        Other backends are queried concurrently, one entry per thread.
+        
+        Args:
+            *keys: Keyring usernames under SERVICE_NAME
+            
+        Returns:
+            list: The stored values in the order of keys (None where missing)
+        """
+        with self._cache_lock:
+            missing = [key for key in keys if key not in self._keyring_cache]
+            if len(missing) > 1:
+                try:
+                    entries = self._secret_service_entries()
+                except Exception as e:
+                    logger.debug("Secret Service bulk read failed, reading entries one by one: %s", e)
+                    entries = None
+                if entries is not None:
+                    # Every entry under SERVICE_NAME came back, so absent keys are unset
+                    for key, value in entries.items():
+                        self._keyring_cache.setdefault(key, value)
+                    for key in missing:
+                        self._keyring_cache.setdefault(key, None)
+                else:
+                    values = _get_keyring_executor().map(
+                        lambda key: self.keyring.get_password(self.SERVICE_NAME, key), missing
+                    )
+                    self._keyring_cache.update(zip(missing, values))
+            elif missing:
+                self._keyring_get(missing[0])
+            return [self._keyring_cache[key] for key in keys]
+
+    def _secret_service_entries(self):
+        """
+        Read every entry stored under SERVICE_NAME with a single Secret Service search.
+
+        Returns:
+            dict: Keyring username -> value, or None if the backend is not Secret Service
+        """
+        from keyring.backends import SecretService
+        backend = self.keyring.get_keyring()
+        if not isinstance(backend, SecretService.Keyring):
+            return None
+        entries = {}
+        # keyring stores each password with "service" and "username" attributes
+        for item in backend.get_preferred_collection().search_items({"service": self.SERVICE_NAME}):
+            if item.is_locked():
+                item.unlock()
+            username = item.get_attributes().get("username")
+            if username and username not in entries:
+                entries[username] = item.get_secret().decode("utf-8")
+        return entries
+
+    def _keyring_get(self, key):
+        """Read a keyring entry, reusing the value already read this session."""
+        with self._cache_lock:
+            if key not in self._keyring_cache:
+                self._keyring_cache[key] = self.keyring.get_password(self.SERVICE_NAME, key)
+            return self._keyring_cache[key]
+
+    def _keyring_set(self, key, value):
+        """Store a keyring entry and remember it for later reads."""
+        with self._cache_lock:
+            self._keyring_cache.pop(key, None)
+            self.keyring.set_password(self.SERVICE_NAME, key, value)
+            self._keyring_cache[key] = value
 
     def _ensure_config_file_exists(self):
         """Ensure the configuration file exists with default values."""
+        if CredentialsManager._config_file_checked:
+            return
         if not self.CONFIG_FILE.exists():
             default_config = {
                 "huggingface_username": "",
                 "server_port": self.DEFAULT_SERVER_PORT,
                 "temp_dir": self.DEFAULT_TEMP_DIR
             }
-            self.CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-            self.CONFIG_FILE.write_text(json.dumps(default_config, indent=2))
+            # Written like any other save: atomically and owner-only
+            self._save_config(default_config)
             logger.info(f"Created default configuration file at {self.CONFIG_FILE}")
+        CredentialsManager._config_file_checked = True
 
     def _extract_usernames_from_env(self):
         """Try to update usernames in config if we have tokens in env variables."""
+        # The environment is loaded once per process, so later instances have nothing to add
+        if CredentialsManager._env_extracted:
+            return
+        CredentialsManager._env_extracted = True
         try:
             config = self._load_config()
             updated = False
@@ -140,7 +282,7 @@ class CredentialsManager:
             # Try to use keyring if available
             if self.has_keyring:
                 try:
-                    self.keyring.set_password(self.SERVICE_NAME, self.HUGGINGFACE_KEY, token)
+                    self._keyring_set(self.HUGGINGFACE_KEY, token)
                     logger.info("Saved HuggingFace token to keyring")
                 except Exception as e:
                     logger.warning(f"Keyring save failed, storing in config file: {e}")
@@ -157,36 +299,118 @@ class CredentialsManager:
             logger.error(f"Failed to save HuggingFace credentials: {e}")
             return False
 
-    def get_huggingface_credentials(self):
-        """Get HuggingFace credentials with environment variable fallback."""
-        config = self._load_config()
-        username = config.get("huggingface_username", "")
-        token = None
+    def _config_mtime(self):
+        """Return the config file's modification time, or None if it is missing."""
+        try:
+            return os.stat(self._CONFIG_PATH).st_mtime_ns
+        except OSError:
+            return None
+
+    def _cached_lookup(self, name, reader, env_names=()):
+        """
+        Return reader()'s result, reusing it until the config file or environment changes.
+
+        Keyring and .env lookups are comparatively slow, so each credential is
+        read once per version of the config file and of the OS environment
+        variables the reader consults. Saving any setting clears the cache, and
+        so does setting one of env_names in os.environ at runtime.
+
+        Args:
+            name (str): Cache key for the credential
+            reader (callable): Function that reads the credential
+            env_names (tuple): OS environment variables reader() checks
+
+        Returns:
+            The credential value
+        """
+        # Held while reading so concurrent callers wait for one lookup
+        # instead of each querying keyring and .env
+        with self._cache_lock:
+            version = (self._config_mtime(), tuple(os.environ.get(env_name) for env_name in env_names))
+            cached = self._credentials_cache.get(name)
+            if cached and cached[0] == version:
+                return cached[1]
+
+            value = reader()
+            # Taken after reading, since readers may export .env values into os.environ
+            version = (self._config_mtime(), tuple(os.environ.get(env_name) for env_name in env_names))
+            self._credentials_cache[name] = (version, value)
+            return value
+
+    def _resolve(self, label, sources):
+        """
+        Return the first non-empty value from an ordered list of sources.
+
+        Args:
+            label (str): Credential name for log messages
+            sources (list): (source name, callable) pairs in priority order
+
+        Returns:
+            The first truthy value a source produced, or None
+        """
+        for source, read in sources:
+            value = read()
+            if value:
+                logger.debug("Using %s from %s", label, source)
+                return value
+        return None
+
+    def _keyring_values(self, *keys):
+        """
+        Read keyring entries for _resolve(), turning the keyring off if it fails.
+
+        Args:
+            *keys: Keyring usernames under SERVICE_NAME
 
-        # Try to get token from keyring if available
+        Returns:
+            list: The stored values in the order of keys (None where unavailable)
+        """
         if self.has_keyring:
             try:
-                token = self.keyring.get_password(self.SERVICE_NAME, self.HUGGINGFACE_KEY)
-                if token:
-                    logger.debug("Retrieved HuggingFace token from keyring")
+                return self._keyring_get_many(*keys)
             except Exception as e:
                 logger.warning(f"Error accessing keyring: {e}")
                 # Don't retry keyring operations for this session
-                global HAS_KEYRING
-                HAS_KEYRING = False
                 self.has_keyring = False
+        return [None] * len(keys)
 
-        # If not found in keyring, try config file
-        if not token and "huggingface_token" in config:
-            token = config.get("huggingface_token")
-            logger.debug("Using HuggingFace token from config file")
+    def _export_from_dotenv(self, name):
+        """Read a value from .env and export it so later lookups find it in os.environ."""
+        value = self._get_dotenv().get(name)
+        if value:
+            os.environ[name] = value
+        return value
 
-        # If still not found, check environment variable
-        if not token and self.env_vars.get("huggingface_token"):
-            token = self.env_vars.get("huggingface_token")
-            logger.debug("Using HuggingFace token from environment variables")
+    @staticmethod
+    def _neo4j_credentials(uri, username, password):
+        """Build a Neo4j credentials dict if all three parts are set."""
+        if uri and username and password:
+            return {"uri": uri, "username": username, "password": password}
+        return None
+
+    def _aws_credentials(self, access_key, secret_key, region):
+        """Build an AWS credentials dict if both keys are set."""
+        if access_key and secret_key:
+            return {
+                "access_key": access_key,
+                "secret_key": secret_key,
+                "region": region or self.DEFAULT_AWS_REGION
+            }
+        return None
 
-        return username, token
+    def get_huggingface_credentials(self):
+        """Get HuggingFace credentials, cached until the config file changes."""
+        return self._cached_lookup("huggingface", self._read_huggingface_credentials)
+
+    def _read_huggingface_credentials(self):
+        """Read HuggingFace credentials with environment variable fallback."""
+        config = self._load_config()
+        token = self._resolve("HuggingFace token", [
+            ("keyring", lambda: self._keyring_values(self.HUGGINGFACE_KEY)[0]),
+            ("config file", lambda: config.get("huggingface_token")),
+            ("environment variables", lambda: self.env_vars.get("huggingface_token")),
+        ])
+        return config.get("huggingface_username", ""), token
         
     def save_openapi_key(self, key):
         """Save OpenAPI API key."""
@@ -196,7 +420,7 @@ class CredentialsManager:
             # Try to use keyring if available
             if self.has_keyring:
                 try:
-                    self.keyring.set_password(self.SERVICE_NAME, self.OPENAPI_KEY, key)
+                    self._keyring_set(self.OPENAPI_KEY, key)
                     logger.info("Saved OpenAPI key to keyring")
                 except Exception as e:
                     logger.warning(f"Keyring save failed, storing in config file: {e}")
@@ -213,37 +437,24 @@ class CredentialsManager:
             return False
 
     def get_openapi_key(self):
-        """Get OpenAPI API key."""
-        config = self._load_config()
-        key = None
-
-        # Try to get key from keyring if available
-        if self.has_keyring:
-            try:
-                key = self.keyring.get_password(self.SERVICE_NAME, self.OPENAPI_KEY)
-                if key:
-                    logger.debug("Retrieved OpenAPI key from keyring")
-            except Exception as e:
-                logger.warning(f"Error accessing keyring: {e}")
-                # Don't retry keyring operations for this session
-                global HAS_KEYRING
-                HAS_KEYRING = False
-                self.has_keyring = False
-
-        # If not found in keyring, try config file
-        if not key and "openapi_key" in config:
-            key = config.get("openapi_key")
-            logger.debug("Using OpenAPI key from config file")
+        """Get OpenAPI API key, cached until the config file changes."""
+        return self._cached_lookup("openapi", self._read_openapi_key)
 
-        # If still not found, check environment variable
-        if not key and self.env_vars.get("openapi_key"):
-            key = self.env_vars.get("openapi_key")
-            logger.debug("Using OpenAPI key from environment variables")
-
-        return key
+    def _read_openapi_key(self):
+        """Read OpenAPI API key."""
+        config = self._load_config()
+        return self._resolve("OpenAPI key", [
+            ("keyring", lambda: self._keyring_values(self.OPENAPI_KEY)[0]),
+            ("config file", lambda: config.get("openapi_key")),
+            ("environment variables", lambda: self.env_vars.get("openapi_key")),
+        ])
         
     def get_server_port(self):
-        """Get configured server port."""
+        """Get configured server port, cached until the config file changes."""
+        return self._cached_lookup("server_port", self._read_server_port)
+
+    def _read_server_port(self):
+        """Read configured server port."""
         config = self._load_config()
         return config.get("server_port", self.DEFAULT_SERVER_PORT)
     
@@ -287,9 +498,9 @@ class CredentialsManager:
             # Try to use keyring if available
             if self.has_keyring:
                 try:
-                    self.keyring.set_password(self.SERVICE_NAME, self.NEO4J_URI_KEY, uri)
-                    self.keyring.set_password(self.SERVICE_NAME, self.NEO4J_USER_KEY, username)
-                    self.keyring.set_password(self.SERVICE_NAME, self.NEO4J_PASSWORD_KEY, password)
+                    self._keyring_set(self.NEO4J_URI_KEY, uri)
+                    self._keyring_set(self.NEO4J_USER_KEY, username)
+                    self._keyring_set(self.NEO4J_PASSWORD_KEY, password)
                     logger.info("Saved Neo4j credentials to keyring")
                 except Exception as e:
                     logger.warning(f"Keyring save failed, storing in config file: {e}")
@@ -311,98 +522,33 @@ class CredentialsManager:
             return False
     
     def get_neo4j_credentials(self):
-        """Get Neo4j database credentials."""
+        """Get Neo4j database credentials, cached until the config file or its environment variables change."""
+        return self._cached_lookup("neo4j", self._read_neo4j_credentials, self.NEO4J_ENV_NAMES)
+
+    def _read_neo4j_credentials(self):
+        """Read Neo4j database credentials."""
         config = self._load_config()
-        uri = None
-        username = None
-        password = None
-        
-        # First check environment variables as these are often most up-to-date
-        env_uri = os.environ.get("NEO4J_URI")
-        env_user = os.environ.get("NEO4J_USER")
-        env_pass = os.environ.get("NEO4J_PASSWORD")
-        
-        if env_uri and env_user and env_pass:
-            logger.info(f"Retrieved Neo4j credentials from environment variables: {env_user}@{env_uri}")
-            return {
-                "uri": env_uri,
-                "username": env_user,
-                "password": env_pass
-            }
-        
-        # Try to get credentials from keyring if available
-        if self.has_keyring:
-            try:
-                uri = self.keyring.get_password(self.SERVICE_NAME, self.NEO4J_URI_KEY)
-                username = self.keyring.get_password(self.SERVICE_NAME, self.NEO4J_USER_KEY)
-                password = self.keyring.get_password(self.SERVICE_NAME, self.NEO4J_PASSWORD_KEY)
-                if uri and username and password:
-                    logger.info(f"Retrieved Neo4j credentials from keyring: {username}@{uri}")
-                    return {
-                        "uri": uri,
-                        "username": username,
-                        "password": password
-                    }
-            except Exception as e:
-                logger.warning(f"Error accessing keyring for Neo4j credentials: {e}")
-                # Don't retry keyring operations for this session
-                global HAS_KEYRING
-                HAS_KEYRING = False
-                self.has_keyring = False
-        
-        # If not found in keyring, try config file
-        if "neo4j_uri" in config and "neo4j_username" in config and "neo4j_password" in config:
-            uri = config.get("neo4j_uri")
-            username = config.get("neo4j_username")
-            password = config.get("neo4j_password")
-            if uri and username and password:
-                logger.info(f"Retrieved Neo4j credentials from config file: {username}@{uri}")
-                return {
-                    "uri": uri,
-                    "username": username,
-                    "password": password
-                }
-        
-        # If still not found, check environment variables in env_vars (from .env file)
-        uri = self.env_vars.get("neo4j_uri") or self.env_vars.get("NEO4J_URI")
-        username = self.env_vars.get("neo4j_username") or self.env_vars.get("NEO4J_USER")
-        password = self.env_vars.get("neo4j_password") or self.env_vars.get("NEO4J_PASSWORD")
-        if uri and username and password:
-            logger.info(f"Retrieved Neo4j credentials from .env file: {username}@{uri}")
-            return {
-                "uri": uri,
-                "username": username,
-                "password": password
-            }
-        
-        # As a last resort, check .env file directly
-        try:
-            env_file = Path(".env")
-            if env_file.exists():
-                logger.info("Checking .env file directly for Neo4j credentials")
-                env_content = env_file.read_text()
-                import re
-                uri_match = re.search(r'NEO4J_URI=(.+)', env_content)
-                user_match = re.search(r'NEO4J_USER=(.+)', env_content)
-                pass_match = re.search(r'NEO4J_PASSWORD=(.+)', env_content)
-                
-                if uri_match and user_match and pass_match:
-                    uri = uri_match.group(1).strip()
-                    username = user_match.group(1).strip()
-                    password = pass_match.group(1).strip()
-                    
-                    if uri and username and password:
-                        logger.info(f"Found Neo4j credentials directly in .env file: {username}@{uri}")
-                        return {
-                            "uri": uri,
-                            "username": username,
-                            "password": password
-                        }
-        except Exception as e:
-            logger.warning(f"Error reading .env file directly: {e}")
-        
-        logger.warning("Neo4j credentials not found in any location")
-        return None
+        env_vars = self.env_vars
+        dotenv_names = self.NEO4J_ENV_NAMES
+        
+        # Each source must supply all three values; environment variables are
+        # checked first as these are often most up-to-date
+        credentials = self._resolve("Neo4j credentials", [
+            ("OS environment variables", lambda: self._neo4j_credentials(
+                *(os.environ.get(name) for name in dotenv_names))),
+            ("keyring", lambda: self._neo4j_credentials(*self._keyring_values(*self.NEO4J_KEYRING_KEYS))),
+            ("config file", lambda: self._neo4j_credentials(
+                config.get("neo4j_uri"), config.get("neo4j_username"), config.get("neo4j_password"))),
+            ("loaded environment variables", lambda: self._neo4j_credentials(
+                env_vars.get("neo4j_uri"), env_vars.get("neo4j_user"), env_vars.get("neo4j_password"))),
+            (".env file", lambda: self._neo4j_credentials(
+                *(self._get_dotenv().get(name) for name in dotenv_names))),
+        ])
+        if credentials:
+            logger.debug("Using Neo4j credentials for %s@%s", credentials["username"], credentials["uri"])
+        else:
+            logger.warning("Neo4j credentials not found in any location")
+        return credentials
         
     def save_openai_key(self, key):
         """Save OpenAI API key."""
@@ -412,7 +558,7 @@ class CredentialsManager:
             # Try to use keyring if available
             if self.has_keyring:
                 try:
-                    self.keyring.set_password(self.SERVICE_NAME, self.OPENAI_KEY, key)
+                    self._keyring_set(self.OPENAI_KEY, key)
                     logger.info("Saved OpenAI key to keyring")
                 except Exception as e:
                     logger.warning(f"Keyring save failed, storing in config file: {e}")
@@ -429,64 +575,22 @@ class CredentialsManager:
             return False
     
     def get_openai_key(self):
-        """Get OpenAI API key."""
+        """Get OpenAI API key, cached until the config file or its environment variables change."""
+        return self._cached_lookup("openai", self._read_openai_key, ("OPENAI_API_KEY",))
+
+    def _read_openai_key(self):
+        """Read OpenAI API key."""
         config = self._load_config()
-        key = None
-        
-        # Try to get key from environment variable first (highest priority)
-        env_key = os.environ.get("OPENAI_API_KEY")
-        if env_key:
-            logger.info("Using OpenAI key from OS environment variables")
-            return env_key
-        
-        # Try to get key from our loaded env vars
-        env_var_key = self.env_vars.get("openai_api_key")
-        if env_var_key:
-            logger.info("Using OpenAI key from loaded environment variables")
-            return env_var_key
-        
-        # Try to get key from keyring if available
-        if self.has_keyring:
-            try:
-                key = self.keyring.get_password(self.SERVICE_NAME, self.OPENAI_KEY)
-                if key:
-                    logger.info("Retrieved OpenAI key from keyring")
-                    return key
-            except Exception as e:
-                logger.warning(f"Error accessing keyring: {e}")
-                # Don't retry keyring operations for this session
-                global HAS_KEYRING
-                HAS_KEYRING = False
-                self.has_keyring = False
-        
-        # If not found in keyring, try config file
-        if "openai_key" in config:
-            key = config.get("openai_key")
-            if key:
-                logger.info("Using OpenAI key from config file")
-                return key
-        
-        # As a last resort, check .env file directly
-        try:
-            env_file = Path(".env")
-            if env_file.exists():
-                logger.info("Checking .env file directly for OpenAI API key")
-                env_content = env_file.read_text()
-                import re
-                key_match = re.search(r'OPENAI_API_KEY=(.+)', env_content)
-                
-                if key_match:
-                    key = key_match.group(1).strip()
-                    if key:
-                        logger.info("Found OpenAI API key directly in .env file")
-                        # Set it in the environment so it's available for future calls
-                        os.environ["OPENAI_API_KEY"] = key
-                        return key
-        except Exception as e:
-            logger.warning(f"Error reading .env file directly: {e}")
-        
-        logger.warning("OpenAI API key not found in any location")
-        return None
+        key = self._resolve("OpenAI key", [
+            ("OS environment variables", lambda: os.environ.get("OPENAI_API_KEY")),
+            ("loaded environment variables", lambda: self.env_vars.get("openai_api_key")),
+            ("keyring", lambda: self._keyring_values(self.OPENAI_KEY)[0]),
+            ("config file", lambda: config.get("openai_key")),
+            (".env file", lambda: self._export_from_dotenv("OPENAI_API_KEY")),
+        ])
+        if not key:
+            logger.warning("OpenAI API key not found in any location")
+        return key
 
     def save_github_token(self, token):
         """Save GitHub token."""
@@ -496,7 +600,7 @@ class CredentialsManager:
             # Try to use keyring if available
             if self.has_keyring:
                 try:
-                    self.keyring.set_password(self.SERVICE_NAME, self.GITHUB_KEY, token)
+                    self._keyring_set(self.GITHUB_KEY, token)
                     logger.info("Saved GitHub token to keyring")
                 except Exception as e:
                     logger.warning(f"Keyring save failed, storing in config file: {e}")
@@ -513,74 +617,71 @@ class CredentialsManager:
             return False
     
     def get_github_token(self):
-        """Get GitHub token."""
+        """Get GitHub token, cached until the config file or its environment variables change."""
+        return self._cached_lookup("github", self._read_github_token, ("GITHUB_TOKEN",))
+
+    def _read_github_token(self):
+        """Read GitHub token."""
         config = self._load_config()
-        token = None
-        
-        # First check environment variable (highest priority)
-        env_token = os.environ.get("GITHUB_TOKEN")
-        if env_token:
-            logger.info("Using GitHub token from OS environment variables")
-            return env_token
-        
-        # Try to get token from our loaded env vars
-        env_var_token = self.env_vars.get("github_token") or self.env_vars.get("GITHUB_TOKEN")
-        if env_var_token:
-            logger.info("Using GitHub token from loaded environment variables")
-            return env_var_token
-        
-        # Try to get token from keyring if available
-        if self.has_keyring:
-            try:
-                token = self.keyring.get_password(self.SERVICE_NAME, self.GITHUB_KEY)
-                if token:
-                    logger.info("Retrieved GitHub token from keyring")
-                    return token
-            except Exception as e:
-                logger.warning(f"Error accessing keyring: {e}")
-                # Don't retry keyring operations for this session
-                global HAS_KEYRING
-                HAS_KEYRING = False
-                self.has_keyring = False
-        
-        # If not found in keyring, try config file
-        if "github_token" in config:
-            token = config.get("github_token")
-            if token:
-                logger.info("Using GitHub token from config file")
-                return token
-        
-        # As a last resort, check .env file directly
-        try:
-            env_file = Path(".env")
-            if env_file.exists():
-                logger.info("Checking .env file directly for GitHub token")
-                env_content = env_file.read_text()
-                import re
-                token_match = re.search(r'GITHUB_TOKEN=(.+)', env_content)
-                
-                if token_match:
-                    token = token_match.group(1).strip()
-                    if token:
-                        logger.info("Found GitHub token directly in .env file")
-                        # Set it in the environment so it's available for future calls
-                        os.environ["GITHUB_TOKEN"] = token
-                        return token
-        except Exception as e:
-            logger.warning(f"Error reading .env file directly: {e}")
-        
-        logger.warning("GitHub token not found in any location")
-        return None
+        token = self._resolve("GitHub token", [
+            ("OS environment variables", lambda: os.environ.get("GITHUB_TOKEN")),
+            ("loaded environment variables",
+             lambda: self.env_vars.get("github_token")),
+            ("keyring", lambda: self._keyring_values(self.GITHUB_KEY)[0]),
+            ("config file", lambda: config.get("github_token")),
+            (".env file", lambda: self._export_from_dotenv("GITHUB_TOKEN")),
+        ])
+        if not token:
+            logger.warning("GitHub token not found in any location")
+        return token
+
+    def get_github_tokens(self):
+        """
+        Get every configured GitHub token for use as a rotating pool.
+
+        The primary token from get_github_token() comes first, followed by
+        comma-separated tokens in GITHUB_TOKENS and the config file's
+        "github_tokens" list.
+
+        Returns:
+            list: Distinct tokens in priority order (may be empty)
+        """
+        tokens = [self.get_github_token()]
+
+        env_tokens = os.environ.get("GITHUB_TOKENS") or self.env_vars.get("github_tokens") or ""
+        tokens.extend(token.strip() for token in env_tokens.split(","))
+
+        config_tokens = self._load_config().get("github_tokens", [])
+        if isinstance(config_tokens, list):
+            tokens.extend(config_tokens)
+
+        return list(dict.fromkeys(token for token in tokens if token))
+
+    def _get_dotenv(self):
+        """
+        Parse ./.env into a dict, re-reading it only when its mtime changes.
+        
+        Returns:
+            dict: Variable name -> value, empty if there is no .env file
+        """
+        return read_env_file(".env") or {}
 
     def _load_config(self):
-        """Load configuration from file."""
-        try:
-            if self.CONFIG_FILE.exists():
-                return json.loads(self.CONFIG_FILE.read_text())
-            return {"huggingface_username": ""}
-        except Exception as e:
-            logger.error(f"Failed to load config: {e}")
+        """Load configuration from file, re-parsing it only when its mtime changes."""
+        mtime = self._config_mtime()
+        if mtime is None:
             return {"huggingface_username": ""}
+        with self._cache_lock:
+            if self._config_cache is None or mtime != self._config_cache_mtime:
+                try:
+                    with open(self._CONFIG_PATH, "rb") as f:
+                        self._config_cache = json_io.loads(f.read())
+                    self._config_cache_mtime = mtime
+                except Exception as e:
+                    logger.error(f"Failed to load config: {e}")
+                    return {"huggingface_username": ""}
+            # Callers edit the returned dict before saving it, so hand out a copy
+            return dict(self._config_cache)
 
     def save_aws_credentials(self, access_key, secret_key, region=None):
         """Save AWS credentials."""
@@ -593,9 +694,9 @@ class CredentialsManager:
             # Try to use keyring if available
             if self.has_keyring:
                 try:
-                    self.keyring.set_password(self.SERVICE_NAME, self.AWS_ACCESS_KEY, access_key)
-                    self.keyring.set_password(self.SERVICE_NAME, self.AWS_SECRET_KEY, secret_key)
-                    self.keyring.set_password(self.SERVICE_NAME, self.AWS_REGION_KEY, region)
+                    self._keyring_set(self.AWS_ACCESS_KEY, access_key)
+                    self._keyring_set(self.AWS_SECRET_KEY, secret_key)
+                    self._keyring_set(self.AWS_REGION_KEY, region)
                     logger.info("Saved AWS credentials to keyring")
                 except Exception as e:
                     logger.warning(f"Keyring save failed, storing in config file: {e}")
@@ -623,108 +724,46 @@ class CredentialsManager:
             return False
             
     def get_aws_credentials(self):
-        """Get AWS credentials."""
+        """Get AWS credentials, cached until the config file or its environment variables change."""
+        return self._cached_lookup("aws", self._read_aws_credentials, self.AWS_ENV_NAMES)
+
+    def _read_aws_credentials(self):
+        """Read AWS credentials."""
         config = self._load_config()
-        access_key = None
-        secret_key = None
-        region = self.DEFAULT_AWS_REGION
-        
-        # First check environment variables (highest priority)
-        env_access_key = os.environ.get("AWS_ACCESS_KEY_ID")
-        env_secret_key = os.environ.get("AWS_SECRET_ACCESS_KEY")
-        env_region = os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION")
-        
-        if env_access_key and env_secret_key:
-            logger.info("Using AWS credentials from OS environment variables")
-            return {
-                "access_key": env_access_key,
-                "secret_key": env_secret_key,
-                "region": env_region or region
-            }
-        
-        # Try to get credentials from our loaded env vars
-        env_var_access_key = self.env_vars.get("aws_access_key_id") or self.env_vars.get("AWS_ACCESS_KEY_ID")
-        env_var_secret_key = self.env_vars.get("aws_secret_access_key") or self.env_vars.get("AWS_SECRET_ACCESS_KEY")
-        env_var_region = self.env_vars.get("aws_region") or self.env_vars.get("AWS_REGION") or self.env_vars.get("AWS_DEFAULT_REGION")
-        
-        if env_var_access_key and env_var_secret_key:
-            logger.info("Using AWS credentials from loaded environment variables")
-            return {
-                "access_key": env_var_access_key,
-                "secret_key": env_var_secret_key,
-                "region": env_var_region or region
-            }
-        
-        # Try to get credentials from keyring if available
-        if self.has_keyring:
-            try:
-                access_key = self.keyring.get_password(self.SERVICE_NAME, self.AWS_ACCESS_KEY)
-                secret_key = self.keyring.get_password(self.SERVICE_NAME, self.AWS_SECRET_KEY)
-                keyring_region = self.keyring.get_password(self.SERVICE_NAME, self.AWS_REGION_KEY)
-                
-                if access_key and secret_key:
-                    logger.info("Retrieved AWS credentials from keyring")
-                    return {
-                        "access_key": access_key,
-                        "secret_key": secret_key,
-                        "region": keyring_region or region
-                    }
-            except Exception as e:
-                logger.warning(f"Error accessing keyring: {e}")
-                # Don't retry keyring operations for this session
-                global HAS_KEYRING
-                HAS_KEYRING = False
-                self.has_keyring = False
-        
-        # If not found in keyring, try config file
-        if "aws_access_key" in config and "aws_secret_key" in config:
-            access_key = config.get("aws_access_key")
-            secret_key = config.get("aws_secret_key")
-            config_region = config.get("aws_region")
-            
-            if access_key and secret_key:
-                logger.info("Using AWS credentials from config file")
-                return {
-                    "access_key": access_key,
-                    "secret_key": secret_key,
-                    "region": config_region or region
-                }
-        
-        # As a last resort, check .env file directly
-        try:
-            env_file = Path(".env")
-            if env_file.exists():
-                logger.info("Checking .env file directly for AWS credentials")
-                env_content = env_file.read_text()
-                import re
-                
-                access_key_match = re.search(r'AWS_ACCESS_KEY_ID=(.+)', env_content)
-                secret_key_match = re.search(r'AWS_SECRET_ACCESS_KEY=(.+)', env_content)
-                region_match = re.search(r'AWS_REGION=(.+)', env_content) or re.search(r'AWS_DEFAULT_REGION=(.+)', env_content)
-                
-                if access_key_match and secret_key_match:
-                    access_key = access_key_match.group(1).strip()
-                    secret_key = secret_key_match.group(1).strip()
-                    if region_match:
-                        region = region_match.group(1).strip()
-                    
-                    if access_key and secret_key:
-                        logger.info("Found AWS credentials directly in .env file")
-                        # Set them in the environment so they're available for future calls
-                        os.environ["AWS_ACCESS_KEY_ID"] = access_key
-                        os.environ["AWS_SECRET_ACCESS_KEY"] = secret_key
-                        os.environ["AWS_REGION"] = region
-                        
-                        return {
-                            "access_key": access_key,
-                            "secret_key": secret_key,
-                            "region": region
-                        }
-        except Exception as e:
-            logger.warning(f"Error reading .env file directly: {e}")
-        
-        logger.warning("AWS credentials not found in any location")
-        return None
+        env_vars = self.env_vars
+        
+        def from_dotenv():
+            dotenv = self._get_dotenv()
+            credentials = self._aws_credentials(
+                dotenv.get("AWS_ACCESS_KEY_ID"),
+                dotenv.get("AWS_SECRET_ACCESS_KEY"),
+                dotenv.get("AWS_REGION") or dotenv.get("AWS_DEFAULT_REGION"),
+            )
+            if credentials:
+                # Set them in the environment so they're available for future calls
+                os.environ["AWS_ACCESS_KEY_ID"] = credentials["access_key"]
+                os.environ["AWS_SECRET_ACCESS_KEY"] = credentials["secret_key"]
+                os.environ["AWS_REGION"] = credentials["region"]
+            return credentials
+        
+        # Access and secret key must come from the same source; region is optional
+        credentials = self._resolve("AWS credentials", [
+            ("OS environment variables", lambda: self._aws_credentials(
+                os.environ.get("AWS_ACCESS_KEY_ID"),
+                os.environ.get("AWS_SECRET_ACCESS_KEY"),
+                os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION"))),
+            ("loaded environment variables", lambda: self._aws_credentials(
+                env_vars.get("aws_access_key_id"),
+                env_vars.get("aws_secret_access_key"),
+                env_vars.get("aws_region") or env_vars.get("aws_default_region"))),
+            ("keyring", lambda: self._aws_credentials(*self._keyring_values(*self.AWS_KEYRING_KEYS))),
+            ("config file", lambda: self._aws_credentials(
+                config.get("aws_access_key"), config.get("aws_secret_key"), config.get("aws_region"))),
+            (".env file", from_dotenv),
+        ])
+        if not credentials:
+            logger.warning("AWS credentials not found in any location")
+        return credentials
 
     def _save_config(self, config):
         """Save configuration to file with basic security measures."""
@@ -732,30 +771,63 @@ class CredentialsManager:
             # Create parent directory with secure permissions if needed
             self.CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
             
-            # Filter out sensitive data before logging
-            safe_config = config.copy()
-            sensitive_keys = [
-                "huggingface_token", "openapi_key", "openai_key",
-                "neo4j_password", "neo4j_uri", "neo4j_username", "github_token",
-                "aws_access_key", "aws_secret_key"
-            ]
-            for key in sensitive_keys:
-                if key in safe_config:
-                    safe_config[key] = "*****"
-                    
-            logger.debug(f"Saving configuration: {json.dumps(safe_config)}")
-            
-            # Write config file with restricted permissions
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
-            
-            # Try to set file permissions to owner only (0600) on Unix systems
-            try:
-                import stat
-                os.chmod(self.CONFIG_FILE, stat.S_IRUSR | stat.S_IWUSR)
-                logger.debug(f"Set restricted permissions on {self.CONFIG_FILE}")
-            except Exception as e:
-                logger.warning(f"Could not set secure permissions on config file: {e}")
-                
+            with self._cache_lock:
+                # Callers save after every credential change, including keyring-only
+                # ones, so cached lookups are stale even if the file is not rewritten
+                self._credentials_cache.clear()
+
+                data = json_io.dumps(config)
+
+                # Nothing to do if this exact content is what we last wrote and the
+                # file hasn't been touched since
+                if data == self._last_written and self._config_mtime() == self._last_written_mtime:
+                    logger.debug("Configuration unchanged; not rewriting config file")
+                    return
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    # Filter out sensitive data before logging
+                    safe_config = {
+                        key: "*****" if key in _SENSITIVE_CONFIG_KEYS else value
+                        for key, value in config.items()
+                    }
+                    logger.debug("Saving configuration: %s", json.dumps(safe_config))
+
+                # Write to a temporary file created owner-only (0600), then swap it in
+                # atomically so readers never see a partially written config
+                tmp_file = self._CONFIG_PATH + ".tmp"
+                fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, _CONFIG_FILE_MODE)
+                with os.fdopen(fd, "wb") as f:
+                    # The create mode is ignored if a stale temp file was left behind;
+                    # fix it through the open descriptor rather than a path-based chmod
+                    os.fchmod(fd, _CONFIG_FILE_MODE)
+                    f.write(data)
+                os.replace(tmp_file, self._CONFIG_PATH)
+
+                # The saved dict is now the current config
+                self._last_written = data
+                self._last_written_mtime = self._config_mtime()
+                self._config_cache = dict(config)
+                self._config_cache_mtime = self._last_written_mtime
+
         except Exception as e:
-            logger.error(f"Failed to save config: {e}")
\ No newline at end of file
+            logger.error(f"Failed to save config: {e}")
+
+
+# Process-wide instance so every caller shares the config, keyring and lookup caches
+_credentials_manager = None
+_credentials_manager_lock = threading.Lock()
+
+
+def get_credentials_manager():
+    """
+    Get or create the shared CredentialsManager.
+
+    Returns:
+        CredentialsManager: The process-wide instance
+    """
+    global _credentials_manager
+    with _credentials_manager_lock:
+        if _credentials_manager is None:
+            _credentials_manager = CredentialsManager()
+        return _credentials_manager
+
@@ -8,6 +8,7 @@ CACHE_DIR = APP_DIR / "cache"
 LOG_DIR = APP_DIR / "logs"
 CONFIG_DIR = APP_DIR / "config"
 TEMP_DIR = APP_DIR / "temp"  # For temporary files during dataset creation
+HF_CACHE_DIR = CACHE_DIR / "huggingface"  # Default HF_HOME, reused across runs
 
 # Configuration validation settings
 CONFIG_VALIDATION = {
@@ -77,6 +78,9 @@ DOWNLOAD_RETRIES = 5  # Specific retry count for file downloads
 
 # GitHub API settings
 GITHUB_API_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+GITHUB_GRAPHQL_BATCH_SIZE = 100  # Blob lookups aliased into a single GraphQL request
+GITHUB_DOWNLOAD_WORKERS = 8  # Concurrent REST file downloads, well under GitHub's secondary limits
 GITHUB_MAX_RETRIES = 3
 GITHUB_TIMEOUT = 30
 GITHUB_DEFAULT_BRANCH = "main"
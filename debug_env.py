@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 
 import os
-import json
 import logging
 from pathlib import Path
 import sys
+from utils.env_loader import read_env_file
+from utils import json_io
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -13,22 +14,20 @@ logger = logging.getLogger("debug_env")
 def check_env_file():
     """Check if .env file exists and is readable."""
     env_file = Path(".env")
+    values = read_env_file(env_file)
     
-    if not env_file.exists():
+    if values is None:
         logger.error(f".env file not found at {env_file.absolute()}")
         return False
     
     try:
-        content = env_file.read_text()
-        logger.info(f".env file exists with size {len(content)} bytes")
+        logger.info(f".env file exists with size {env_file.stat().st_size} bytes")
         
-        # Count number of lines with key-value pairs
-        lines = [line.strip() for line in content.split('\n') if '=' in line and not line.strip().startswith('#')]
-        logger.info(f"Found {len(lines)} environment variables in .env file")
+        # Count the key-value pairs
+        logger.info(f"Found {len(values)} environment variables in .env file")
         
         # Check for OPENAI_API_KEY specifically (without revealing it)
-        has_openai_key = any(line.startswith('OPENAI_API_KEY=') for line in lines)
-        if has_openai_key:
+        if "OPENAI_API_KEY" in values:
             logger.info("OPENAI_API_KEY found in .env file")
         else:
             logger.warning("OPENAI_API_KEY not found in .env file")
@@ -81,7 +80,9 @@ def debug_dotenv_loading():
         logger.info("Testing dotenv.load_dotenv() function")
         
         env_file = Path(".env")
-        if not env_file.exists():
+        # Parsed once: a missing file comes back as None, and the dict serves the fallback below
+        env_values = read_env_file(env_file)
+        if env_values is None:
             logger.error(f".env file not found at {env_file.absolute()}")
             return
         
@@ -97,12 +98,9 @@ def debug_dotenv_loading():
             
             # Try reading directly
             try:
-                content = env_file.read_text()
-                import re
-                key_match = re.search(r'OPENAI_API_KEY=(.+)', content)
+                key = env_values.get("OPENAI_API_KEY")
                 
-                if key_match:
-                    key = key_match.group(1).strip()
+                if key:
                     logger.info(f"Found OPENAI_API_KEY in .env file: {key[:4]}...{key[-4:]}")
                 else:
                     logger.error("Could not find OPENAI_API_KEY pattern in .env file")
@@ -126,30 +124,36 @@ def check_config_file():
         
         found = False
         for config_path in paths:
-            if config_path.exists():
-                logger.info(f"Found config file at {config_path}")
+            # Read directly; a missing file is skipped without a separate exists() check
+            try:
+                data = config_path.read_bytes()
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.error(f"Error reading config file {config_path}: {e}")
+                continue
+            logger.info(f"Found config file at {config_path}")
+            
+            # Check content
+            try:
+                config = json_io.loads(data)
                 
-                # Read and check content
-                try:
-                    with open(config_path, 'r') as f:
-                        config = json.load(f)
-                    
-                    # Check for relevant keys (without revealing sensitive values)
-                    keys = list(config.keys())
-                    logger.info(f"Config file contains keys: {', '.join(keys)}")
-                    
-                    # Check specifically for OpenAI key
-                    if "openai_key" in config:
-                        key = config["openai_key"]
-                        masked_key = "..." if len(key) < 8 else f"{key[:4]}...{key[-4:]}"
-                        logger.info(f"Found openai_key in config: {masked_key}")
-                    else:
-                        logger.warning("No openai_key found in config")
-                        
-                    found = True
+                # Check for relevant keys (without revealing sensitive values)
+                keys = list(config.keys())
+                logger.info(f"Config file contains keys: {', '.join(keys)}")
+                
+                # Check specifically for OpenAI key
+                if "openai_key" in config:
+                    key = config["openai_key"]
+                    masked_key = "..." if len(key) < 8 else f"{key[:4]}...{key[-4:]}"
+                    logger.info(f"Found openai_key in config: {masked_key}")
+                else:
+                    logger.warning("No openai_key found in config")
                     
-                except Exception as e:
-                    logger.error(f"Error reading config file {config_path}: {e}")
+                found = True
+                
+            except Exception as e:
+                logger.error(f"Error reading config file {config_path}: {e}")
         
         if not found:
             logger.warning("No config files found")
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 
 import os
-from pathlib import Path
 import re
+from pathlib import Path
+from utils.env_loader import read_env_file
+
+# Lines whose value must be masked in the content preview
+_SECRET_LINE_RE = re.compile(r"key|token|password|secret", re.IGNORECASE)
 
 def main():
     """Directly check .env file for OpenAI API key."""
@@ -17,14 +21,13 @@ def main():
     
     env_key_found = False
     for env_path in env_paths:
-        if env_path.exists():
+        env_values = read_env_file(env_path)
+        if env_values is not None:
             print(f"Found .env file at {env_path.absolute()}")
             try:
-                env_content = env_path.read_text()
-                key_match = re.search(r'OPENAI_API_KEY=(.+)', env_content)
+                env_key = env_values.get("OPENAI_API_KEY")
                 
-                if key_match:
-                    env_key = key_match.group(1).strip()
+                if env_key:
                     masked_key = env_key[:4] + "..." + env_key[-4:] if len(env_key) > 8 else "***"
                     print(f"Found OpenAI API key in .env file: {masked_key}")
                     
@@ -37,14 +40,13 @@ def main():
                 else:
                     print(f"No OpenAI API key pattern found in {env_path}")
                     # Show some content for debugging (without showing any secrets)
-                    lines = env_content.split("\n")
+                    lines = env_path.read_text().split("\n")
                     safe_lines = []
                     for line in lines:
-                        if line.strip() and not any(secret in line.lower() for secret in ["key", "token", "password", "secret"]):
+                        if line.strip() and not _SECRET_LINE_RE.search(line):
                             safe_lines.append(line)
                         elif line.strip():
-                            key_name = line.split("=")[0] if "=" in line else line
-                            safe_lines.append(f"{key_name}=*****")
+                            safe_lines.append(f"{line.partition('=')[0]}=*****")
                     print(f"Content structure preview: {len(lines)} lines total")
                     print("\n".join(safe_lines[:5]) + ("\n..." if len(safe_lines) > 5 else ""))
             except Exception as e:
@@ -1,8 +1,27 @@
 """
 GitHub API integration module for othertales homework.
 """
+import importlib
 
-# Make imports easier by exposing key classes
-from .client import GitHubClient, GitHubAPIError, RateLimitError
-from .repository import RepositoryFetcher
-from .content_fetcher import ContentFetcher
\ No newline at end of file
+# Make imports easier by exposing key classes. They are loaded on first access
+# (PEP 562) so that importing one submodule, e.g. github.client, doesn't also
+# pull in the repository and content fetchers.
+_LAZY_ATTRS = {
+    "GitHubClient": ".client",
+    "GitHubAPIError": ".client",
+    "RateLimitError": ".client",
+    "RepositoryFetcher": ".repository",
+    "ContentFetcher": ".content_fetcher",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
@@ -1,4 +1,5 @@
 import time
+import json
 import logging
 import requests
 import random
@@ -8,14 +9,22 @@ from pathlib import Path
 from requests.exceptions import RequestException, ConnectionError, ReadTimeout
 from http.client import RemoteDisconnected
 from urllib3.exceptions import ProtocolError
-# Ensure local import takes precedence over any installed packages
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Ensure local import takes precedence over any installed packages (only once)
+_project_root = str(Path(__file__).parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 from config.settings import (
     GITHUB_API_URL,
+    GITHUB_GRAPHQL_URL,
     GITHUB_MAX_RETRIES,
     GITHUB_TIMEOUT,
     GITHUB_DOWNLOAD_RETRIES,
+    RELEVANT_FOLDERS,
+    IGNORED_DIRS,
+    TEXT_FILE_EXTENSIONS,
+    MAX_FILE_SIZE_MB,
 )
+from github.etag_cache import get_etag_cache
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +64,7 @@ class GitHubClient:
     # Instance-level lock for this specific client
     # Class-level rate limiting with thread safety
 
-    def __init__(self, token=None):
+    def __init__(self, token=None, session=None, etag_cache=None, token_pool=None):
         # Initialize class variables if not already done
         self._initialize_class_vars()
         
@@ -65,7 +74,12 @@ class GitHubClient:
         if token:
             # GitHub API accepts both formats but "Bearer" is more modern and standard OAuth format
             self.headers["Authorization"] = f"Bearer {token}"
-        self.session = requests.Session()
+        # Reuse a shared pooled session when given so connections stay alive across clients
+        self.session = session if session is not None else requests.Session()
+        # Cache of ETags/bodies used to send conditional requests
+        self.etag_cache = etag_cache if etag_cache is not None else get_etag_cache()
+        # Optional pool of extra tokens; requests rotate through it when set
+        self.token_pool = token_pool
         # Create an instance-level lock for this specific client
         self.request_lock = threading.RLock()
 
@@ -74,6 +88,14 @@ class GitHubClient:
         url = f"{GITHUB_API_URL}/{endpoint.lstrip('/')}"
         retries = 0
 
+        # Send If-None-Match for previously seen URLs; a 304 reply is free of rate-limit cost
+        cache_key = requests.Request("GET", url, params=params).prepare().url
+        cached = self.etag_cache.get(cache_key) if self.etag_cache else None
+        headers = dict(self.headers, **{"If-None-Match": cached[0]}) if cached else self.headers
+
+        # Each pooled token brings its own hourly quota
+        requests_per_hour = GitHubClient.requests_per_hour * (len(self.token_pool) if self.token_pool else 1)
+
         # Check hourly rate limit - use class-level lock for shared state
         with GitHubClient._class_lock:
             current_time = time.time()
@@ -86,10 +108,8 @@ class GitHubClient:
                 logger.debug("Resetting hourly rate limit counter")
 
             # If we're approaching the limit, slow down dramatically
-            if GitHubClient.current_requests > (GitHubClient.requests_per_hour * 0.9):
-                remaining_limit = (
-                    GitHubClient.requests_per_hour - GitHubClient.current_requests
-                )
+            if GitHubClient.current_requests > (requests_per_hour * 0.9):
+                remaining_limit = requests_per_hour - GitHubClient.current_requests
                 if remaining_limit <= 10:
                     wait_time = max((3600 - elapsed_since_hour_start), 60)
                     logger.warning(
@@ -121,9 +141,12 @@ class GitHubClient:
                     GitHubClient.current_requests += 1
 
             try:
+                token, request_headers = self._auth_headers(headers)
                 response = self.session.get(
-                    url, headers=self.headers, params=params, timeout=GITHUB_TIMEOUT
+                    url, headers=request_headers, params=params, timeout=GITHUB_TIMEOUT
                 )
+                if self.token_pool:
+                    self.token_pool.update(token, response.headers)
 
                 # Check remaining rate limit
                 remaining = int(response.headers.get("X-RateLimit-Remaining", "1"))
@@ -136,7 +159,13 @@ class GitHubClient:
                         GitHubClient.min_request_interval, 2.0
                     )
 
-                if response.status_code == 200:
+                if response.status_code == 304 and cached:
+                    logger.debug(f"Not modified, using cached response for {cache_key}")
+                    return json.loads(cached[1])
+                elif response.status_code == 200:
+                    etag = response.headers.get("ETag")
+                    if etag and self.etag_cache:
+                        self.etag_cache.set(cache_key, etag, response.text)
                     return response.json()
                 elif (
                     response.status_code == 403
@@ -198,6 +227,69 @@ class GitHubClient:
 
         raise GitHubAPIError("Maximum retries reached")
 
+    def _auth_headers(self, headers):
+        """
+        Pick the token for the next request.
+
+        Args:
+            headers (dict): Base request headers
+
+        Returns:
+            tuple: (token, headers) with Authorization set from the token pool,
+                   or the client's own token and unchanged headers without a pool
+        """
+        if not self.token_pool:
+            return self.token, headers
+        token = self.token_pool.next_token()
+        return token, dict(headers, Authorization=f"Bearer {token}")
+
+    def graphql(self, query, variables=None):
+        """
+        Run a query against the GitHub GraphQL API.
+
+        Args:
+            query (str): GraphQL query document
+            variables (dict, optional): Query variables
+
+        Returns:
+            dict: The "data" member of the response
+
+        Raises:
+            GitHubAPIError: If the request fails or the response contains errors
+        """
+        if not self.token:
+            raise GitHubAPIError("GitHub GraphQL API requires an authentication token")
+
+        with GitHubClient._class_lock:
+            GitHubClient.current_requests += 1
+
+        try:
+            token, headers = self._auth_headers(self.headers)
+            response = self.session.post(
+                GITHUB_GRAPHQL_URL,
+                headers=headers,
+                json={"query": query, "variables": variables or {}},
+                timeout=GITHUB_TIMEOUT,
+            )
+        except RequestException as e:
+            logger.error(f"GraphQL request error: {e}")
+            raise GitHubAPIError(f"Failed to connect to GitHub GraphQL API: {e}")
+        if self.token_pool:
+            self.token_pool.update(token, response.headers)
+
+        if response.status_code == 403 and "rate limit" in response.text.lower():
+            raise RateLimitError("GitHub GraphQL API rate limit exceeded. Please try again later.")
+        if response.status_code != 200:
+            raise GitHubAPIError(
+                f"GitHub GraphQL API error: {response.status_code} - {response.text[:200]}"
+            )
+
+        payload = response.json()
+        if payload.get("errors"):
+            messages = "; ".join(error.get("message", "Unknown error") for error in payload["errors"])
+            raise GitHubAPIError(f"GitHub GraphQL API error: {messages}")
+        return payload.get("data") or {}
+
     def get_organization_repos(self, org_name, page=1, per_page=100):
         """Get repositories for a GitHub organization."""
         logger.info(f"Fetching repositories for organization: {org_name}")
@@ -281,7 +373,6 @@ class GitHubClient:
                     current_path = current_path[part]
             
             # Check if this is a relevant folder
-            from config.settings import RELEVANT_FOLDERS
             path_parts = path.split("/") if path else []
             is_relevant = any(part.lower() in RELEVANT_FOLDERS for part in path_parts)
             if is_relevant:
@@ -292,7 +383,6 @@ class GitHubClient:
                 result["total_files"] += 1
                 if item["type"] == "dir":
                     # Skip ignored directories
-                    from config.settings import IGNORED_DIRS
                     if item["name"] in IGNORED_DIRS:
                         continue
                         
@@ -321,7 +411,6 @@ class GitHubClient:
                     # Check if file is in a relevant folder
                     if is_relevant:
                         # Check file type
-                        from config.settings import TEXT_FILE_EXTENSIONS, MAX_FILE_SIZE_MB
                         if (any(item["name"].lower().endswith(ext) for ext in TEXT_FILE_EXTENSIONS) and
                             item["size"] / 1024 / 1024 <= MAX_FILE_SIZE_MB):
                             result["relevant_files"] += 1
@@ -377,10 +466,18 @@ class GitHubClient:
                     download_timeout = (
                         GITHUB_TIMEOUT * 2
                     )  # Double timeout for downloads
+                    download_url = content_data["download_url"]
+                    cached = self.etag_cache.get(download_url) if self.etag_cache else None
+                    download_headers = {"If-None-Match": cached[0]} if cached else None
                     response = self.session.get(
-                        content_data["download_url"], timeout=download_timeout
+                        download_url, headers=download_headers, timeout=download_timeout
                     )
+                    if response.status_code == 304 and cached:
+                        return cached[1]
                     response.raise_for_status()
+                    etag = response.headers.get("ETag")
+                    if etag and self.etag_cache:
+                        self.etag_cache.set(download_url, etag, response.text)
                     return response.text
                 except (
                     ConnectionError,
@@ -5,17 +5,25 @@ import signal
 import time
 import sys
 from pathlib import Path
-# Ensure local import takes precedence over any installed packages
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from github.repository import RepositoryFetcher
+# Ensure local import takes precedence over any installed packages (only once)
+_project_root = str(Path(__file__).parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+from github.client import GitHubClient, GitHubAPIError
+from github.token_pool import TokenPool
+from github.repository import RepositoryFetcher, _REPO_URL_RE, _org_name_from_url
+from config.settings import GITHUB_GRAPHQL_BATCH_SIZE, GITHUB_DOWNLOAD_WORKERS
 from utils.performance import async_process
 from utils.task_tracker import TaskTracker
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
 import threading
 
 logger = logging.getLogger(__name__)
 
+# Organization name pattern, compiled once
+_ORG_NAME_RE = re.compile(r"^[\w.-]+$")
+
 # Global executor for background tasks
 _global_executor = None
 
@@ -48,9 +56,18 @@ for sig in (signal.SIGINT, signal.SIGTERM):
 class ContentFetcher:
     """Fetches and organizes repository content."""
 
-    def __init__(self, github_token=None):
-        self.repo_fetcher = RepositoryFetcher(github_token=github_token)
+    def __init__(self, github_token=None, session=None, github_tokens=None):
+        # Several tokens spread organization-wide fetches across their separate rate limits
+        github_tokens = [token for token in (github_tokens or []) if token]
+        github_token = github_token or (github_tokens[0] if github_tokens else None)
+        client = None
+        if len(set(github_tokens)) > 1:
+            client = GitHubClient(
+                token=github_token, session=session, token_pool=TokenPool(github_tokens)
+            )
+        self.repo_fetcher = RepositoryFetcher(github_token=github_token, client=client, session=session)
         self.github_token = github_token
+        self.session = session
         # Create GitHub client using the proper authentication
         self.github_client = self.repo_fetcher.client
         self.task_tracker = TaskTracker()
@@ -242,15 +259,14 @@ class ContentFetcher:
         try:
             # Check if this is an organization URL by examining the pattern
             is_org_url = False
-            match = re.match(r"https?://github\.com/([^/]+)/?$", repo_url)
+            org_name = _org_name_from_url(repo_url)
             # Validate organization name if matched
-            if match and not re.match(r"^[\w.-]+$", match.group(1)):
+            if org_name and not _ORG_NAME_RE.match(org_name):
                 raise ValueError(f"Invalid GitHub organization name in URL: {repo_url}")
                 
-            if match:
+            if org_name:
                 # No second path segment - this is an organization URL
                 is_org_url = True
-                org_name = match.group(1)
                 logger.info(f"Detected GitHub organization URL: {repo_url}")
                 
                 if progress_callback:
@@ -321,7 +337,7 @@ class ContentFetcher:
                     
                     # Fetch content for this repository
                     try:
-                        file_content = self.repo_fetcher.fetch_relevant_content(
+                        file_content = self._fetch_relevant_content(
                             owner, repo_name, branch, repo_progress_callback,
                             _cancellation_event=_cancellation_event,
                             max_files=repo_max_files,
@@ -394,8 +410,9 @@ class ContentFetcher:
             branch = repo_info["default_branch"]
             
             # Fetch actual file content rather than just repo metadata
-            file_content = self.repo_fetcher.fetch_relevant_content(
-                owner, repo_name, branch, progress_callback, 
+            file_content = self._fetch_relevant_content(
+                owner, repo_name, branch, progress_callback,
+                _cancellation_event=_cancellation_event,
                 max_files=max_files,
                 ai_instructions=ai_instructions
             )
@@ -413,7 +430,7 @@ class ContentFetcher:
             return file_content
         except Exception as e:
             # Check if this is an organization URL
-            is_org_url = bool(re.match(r"https?://github\.com/([^/]+)/?$", repo_url))
+            is_org_url = bool(_org_name_from_url(repo_url))
             if is_org_url:
                 logger.error(f"Failed to fetch organization repositories from {repo_url}: {e}")
                 if progress_callback:
@@ -424,6 +441,180 @@ class ContentFetcher:
                     progress_callback(100, f"Error: {str(e)}")
             raise
 
+    def _fetch_relevant_content(self, owner, repo, branch, progress_callback=None,
+                                _cancellation_event=None, max_files=None, ai_instructions=None):
+        """
+        Fetch relevant content from a repository, batching file downloads through GraphQL.
+        
+        The repository structure is scanned as usual, then the text of every relevant
+        file is requested in aliased GraphQL batches instead of one REST call per file.
+        Files GraphQL cannot return as text (binary, truncated or LFS blobs) are
+        downloaded over REST.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch to fetch
+            progress_callback: Function to call with progress updates
+            _cancellation_event: Event that can be set to cancel the operation
+            max_files: Maximum number of files to fetch (optional limit)
+            ai_instructions: AI-guided instructions for repository fetching (optional)
+            
+        Returns:
+            List of content files
+        """
+        # GraphQL requires an authenticated client; otherwise use the REST flow
+        if not self.github_token or not branch:
+            return self.repo_fetcher.fetch_relevant_content(
+                owner, repo, branch, progress_callback,
+                _cancellation_event=_cancellation_event,
+                max_files=max_files,
+                ai_instructions=ai_instructions
+            )
+            
+        try:
+            if progress_callback:
+                progress_callback(5)
+                
+            repo_structure = self.github_client.scan_repository_structure(owner, repo, branch)
+            
+            if _cancellation_event and _cancellation_event.is_set():
+                logger.info(f"Operation cancelled after scanning repository structure for {owner}/{repo}")
+                return []
+                
+            if progress_callback:
+                progress_callback(15)
+                
+            repo_cache_dir = self.repo_fetcher.cache_dir / owner / repo
+            repo_cache_dir.mkdir(parents=True, exist_ok=True)
+            
+            file_items = []
+            for path in repo_structure["relevant_paths"]:
+                file_items.extend(self.repo_fetcher._identify_files_to_download(
+                    repo_structure, path, owner, repo, branch, repo_cache_dir
+                ))
+            file_items = self.repo_fetcher._limit_files(file_items, max_files)
+            
+            if not file_items:
+                logger.warning(f"No relevant files found in {owner}/{repo}")
+                return []
+                
+            if progress_callback:
+                progress_callback(20)
+                
+            file_texts = self._fetch_via_graphql(owner, repo, branch, [item["path"] for item in file_items])
+        except GitHubAPIError as e:
+            logger.warning(f"GraphQL fetch failed for {owner}/{repo}, falling back to REST: {e}")
+            return self.repo_fetcher.fetch_relevant_content(
+                owner, repo, branch, progress_callback,
+                _cancellation_event=_cancellation_event,
+                max_files=max_files,
+                ai_instructions=ai_instructions
+            )
+            
+        downloaded_files = []
+        rest_items = []
+        for item in file_items:
+            text = file_texts.get(item["path"])
+            if text is None:
+                rest_items.append(item)
+                continue
+                
+            local_path = Path(item["local_path"])
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            local_path.write_text(text, encoding="utf-8", errors="replace")
+            downloaded_files.append({
+                "name": item["name"],
+                "path": item["path"],
+                "local_path": item["local_path"],
+                "repo": f"{owner}/{repo}",
+                "branch": branch,
+                "size": len(text),
+            })
+            
+        logger.info(
+            f"Fetched {len(downloaded_files)} files from {owner}/{repo} via GraphQL, "
+            f"{len(rest_items)} left for REST download"
+        )
+        
+        if progress_callback:
+            progress_callback(25 + 65 * len(downloaded_files) / len(file_items))
+            
+        if rest_items:
+            # Remaining downloads are I/O bound, so run them concurrently over the shared session
+            with ThreadPoolExecutor(max_workers=GITHUB_DOWNLOAD_WORKERS) as executor:
+                futures = {
+                    executor.submit(
+                        self.repo_fetcher._download_single_file,
+                        owner, repo, item["path"], branch, item["local_path"]
+                    ): item
+                    for item in rest_items
+                }
+                
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    if _cancellation_event and _cancellation_event.is_set():
+                        logger.info(f"Operation cancelled during file download for {owner}/{repo}")
+                        for pending in futures:
+                            pending.cancel()
+                        return downloaded_files
+                        
+                    path = futures[future]["path"]
+                    try:
+                        result = future.result()
+                        if result:
+                            downloaded_files.append(result)
+                    except Exception as e:
+                        logger.error(f"Error downloading file {path}: {e}")
+                        
+                    if progress_callback:
+                        done = len(file_items) - len(rest_items) + completed
+                        progress_callback(25 + 65 * done / len(file_items), path)
+                        
+        if progress_callback:
+            progress_callback(95)
+            
+        return downloaded_files
+        
+    def _fetch_via_graphql(self, owner, repo, branch, paths):
+        """
+        Fetch the text of many repository files with batched GraphQL queries.
+        
+        Each path becomes an aliased ``object(expression: "branch:path")`` lookup,
+        so up to GITHUB_GRAPHQL_BATCH_SIZE files cost a single round trip.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch to read from
+            paths: File paths within the repository
+            
+        Returns:
+            dict: Mapping of path to file text. Binary, truncated and missing
+            blobs are omitted so the caller can fetch them over REST.
+        """
+        file_texts = {}
+        for start in range(0, len(paths), GITHUB_GRAPHQL_BATCH_SIZE):
+            batch = paths[start:start + GITHUB_GRAPHQL_BATCH_SIZE]
+            declarations = ", ".join(f"$e{i}: String!" for i in range(len(batch)))
+            selections = "\n".join(
+                f"    f{i}: object(expression: $e{i}) {{ ... on Blob {{ text isBinary isTruncated }} }}"
+                for i in range(len(batch))
+            )
+            query = (
+                f"query($owner: String!, $name: String!, {declarations}) {{\n"
+                f"  repository(owner: $owner, name: $name) {{\n{selections}\n  }}\n}}"
+            )
+            variables = {"owner": owner, "name": repo}
+            variables.update({f"e{i}": f"{branch}:{path}" for i, path in enumerate(batch)})
+            
+            repository = self.github_client.graphql(query, variables).get("repository") or {}
+            for i, path in enumerate(batch):
+                blob = repository.get(f"f{i}")
+                if blob and blob.get("text") is not None and not blob.get("isBinary") and not blob.get("isTruncated"):
+                    file_texts[path] = blob["text"]
+                    
+        return file_texts
+
     def _start_status_display(self, task_id=None):
         """
         Start a background thread to display download status in the console.
@@ -503,10 +694,8 @@ class ContentFetcher:
         """
         if isinstance(repo_data, str):
             # Check if this is an organization URL
-            org_match = re.match(r"https?://github\.com/([^/]+)/?$", repo_data)
-            if org_match:
+            if _org_name_from_url(repo_data):
                 # This is an organization URL - fetch all repositories
-                org_name = org_match.group(1)
                 logger.info(f"Detected GitHub organization URL: {repo_data}")
                 
                 # Fetch repositories from organization and process them
@@ -520,7 +709,7 @@ class ContentFetcher:
                 return content_files
                 
             # Handle single repository URL
-            match = re.match(r"https?://github\.com/([^/]+)/([^/]+)", repo_data)
+            match = _REPO_URL_RE.match(repo_data)
             if not match:
                 raise ValueError(f"Invalid GitHub repository URL: {repo_data}")
             owner, repo = match.groups()
@@ -625,7 +814,7 @@ class ContentFetcher:
             raise ValueError(f"Organization name must be a non-empty string, got: {org_name}")
         
         # Regular expression to validate organization name format
-        if not re.match(r'^[\w.-]+$', org_name):
+        if not _ORG_NAME_RE.match(org_name):
             raise ValueError(f"Invalid organization name format: {org_name}")
             
         task_id = None
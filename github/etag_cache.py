@@ -0,0 +1,88 @@
+import logging
+import sqlite3
+import threading
+import sys
+from pathlib import Path
+# Ensure local import takes precedence over any installed packages (only once)
+_project_root = str(Path(__file__).parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+from config.settings import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+ETAG_CACHE_FILE = CACHE_DIR / "github_etags.sqlite"
+
+
+class ETagCache:
+    """SQLite-backed store of GitHub response bodies keyed by URL and ETag.
+
+    Conditional requests answered with 304 Not Modified do not count against
+    GitHub's primary rate limit, so repeated fetches of an unchanged repository
+    are served from this cache at almost no cost.
+    """
+
+    def __init__(self, db_path=ETAG_CACHE_FILE):
+        self.db_path = Path(db_path)
+        self.lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS etags ("
+                "url TEXT PRIMARY KEY, etag TEXT NOT NULL, body TEXT NOT NULL)"
+            )
+
+    def get(self, url):
+        """
+        Look up the cached entry for a URL.
+
+        Args:
+            url (str): Full request URL including query string
+
+        Returns:
+            tuple: (etag, body) or None if the URL has not been cached
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT etag, body FROM etags WHERE url = ?", (url,)
+            ).fetchone()
+        return row
+
+    def set(self, url, etag, body):
+        """
+        Store the ETag and body returned for a URL.
+
+        Args:
+            url (str): Full request URL including query string
+            etag (str): ETag header value from the response
+            body (str): Response body text
+        """
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO etags (url, etag, body) VALUES (?, ?, ?)",
+                (url, etag, body),
+            )
+
+
+# Shared cache used by every GitHubClient in the process
+_etag_cache = None
+_etag_cache_lock = threading.Lock()
+
+
+def get_etag_cache():
+    """
+    Get or create the shared ETag cache.
+
+    Returns:
+        ETagCache: The shared cache, or None if it could not be opened
+    """
+    global _etag_cache
+    with _etag_cache_lock:
+        if _etag_cache is None:
+            try:
+                _etag_cache = ETagCache()
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Could not open GitHub ETag cache: {e}")
+                return None
+        return _etag_cache
@@ -5,8 +5,10 @@ import logging
 import sys
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
-# Ensure local import takes precedence over any installed packages
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Ensure local import takes precedence over any installed packages (only once)
+_project_root = str(Path(__file__).parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 from github.client import GitHubClient, GitHubAPIError
 from config.settings import (
     RELEVANT_FOLDERS,
@@ -19,6 +21,34 @@ from config.settings import (
 
 logger = logging.getLogger(__name__)
 
+# GitHub URL patterns, compiled once
+_REPO_URL_RE = re.compile(r"https?://github\.com/([^/]+)/([^/]+)")
+_GITHUB_URL_PREFIXES = ("https://github.com/", "http://github.com/")
+
+
+def _org_name_from_url(url):
+    """
+    Return the organization name if url is a bare organization URL.
+
+    Plain string checks are enough here; an organization URL has exactly one
+    path segment, optionally followed by a single slash.
+
+    Args:
+        url (str): GitHub URL
+
+    Returns:
+        str: The organization name, or None for any other URL
+    """
+    for prefix in _GITHUB_URL_PREFIXES:
+        if url.startswith(prefix):
+            path = url[len(prefix):]
+            if path.endswith("/"):
+                path = path[:-1]
+            if path and "/" not in path:
+                return path
+            return None
+    return None
+
 
 class DownloadQueue:
     """Manages a queue of files to download with progress tracking."""
@@ -169,17 +199,18 @@ class RepositoryFetcher:
         priority_content (list): Keywords or patterns to prioritize
     """
 
-    def __init__(self, github_token=None, client=None):
+    def __init__(self, github_token=None, client=None, session=None):
         """Initialize the repository fetcher.
 
         Args:
             github_token (str, optional): GitHub token for authentication
             client (GitHubClient, optional): Existing GitHub client to use
+            session (requests.Session, optional): Shared HTTP session for the client
             
         Raises:
             GitHubAPIError: If there's an error authenticating with GitHub
         """
-        self.client = client if client is not None else GitHubClient(token=github_token)
+        self.client = client if client is not None else GitHubClient(token=github_token, session=session)
         self.cache_dir = CACHE_DIR
         self.download_queue = DownloadQueue()  # Initialize download queue
         
@@ -229,14 +260,12 @@ class RepositoryFetcher:
     def fetch_single_repo(self, repo_url):
         """Fetch a single repository from its URL."""
         # Check if this is an organization URL (no second path part)
-        org_match = re.match(r"https?://github\.com/([^/]+)/?$", repo_url)
-        if org_match:
+        if _org_name_from_url(repo_url):
             # This is an organization URL
-            org_name = org_match.group(1)
             raise ValueError(f"Organization URL detected: {repo_url}. Use fetch_organization_repos instead")
             
         # Parse owner and repo from URL
-        match = re.match(r"https?://github\.com/([^/]+)/([^/]+)", repo_url)
+        match = _REPO_URL_RE.match(repo_url)
         if not match:
             raise ValueError(f"Invalid GitHub repository URL: {repo_url}")
 
@@ -656,6 +685,36 @@ class RepositoryFetcher:
         
         return files_to_download
         
+    def _limit_files(self, file_items, max_files):
+        """
+        Trim a list of file items to max_files, keeping priority content first.
+        
+        Args:
+            file_items (list): File items from _identify_files_to_download
+            max_files (int, optional): Maximum number of files to keep
+            
+        Returns:
+            list: The trimmed list of file items
+        """
+        if max_files is None or max_files <= 0 or len(file_items) <= max_files:
+            return file_items
+            
+        # Sort by priority if we have priority_content settings
+        if self.priority_content:
+            # Utility function to score a file based on priority keywords
+            def priority_score(file_item):
+                score = 0
+                path = file_item.get("path", "").lower()
+                for i, keyword in enumerate(self.priority_content):
+                    if keyword.lower() in path:
+                        # Higher priority for earlier keywords in the list
+                        score += (len(self.priority_content) - i)
+                return score
+                
+            file_items = sorted(file_items, key=priority_score, reverse=True)
+            
+        return file_items[:max_files]
+        
     def _download_queued_files(self, owner, repo, branch, progress_callback=None, _cancellation_event=None, max_files=None):
         """
         Download all files in the queue with progress tracking.
@@ -702,23 +761,7 @@ class RepositoryFetcher:
                 logger.info(f"Limiting download to {max_files} files based on AI guidance")
                 # Trim the queue to respect max_files
                 if len(queue.queue) > max_files:
-                    # Sort queue by priority if we have priority_content settings
-                    if self.priority_content:
-                        # Utility function to score a file based on priority keywords
-                        def priority_score(file_item):
-                            score = 0
-                            path = file_item.get("path", "").lower()
-                            for i, keyword in enumerate(self.priority_content):
-                                if keyword.lower() in path:
-                                    # Higher priority for earlier keywords in the list
-                                    score += (len(self.priority_content) - i)
-                            return score
-                            
-                        # Sort queue by priority score
-                        queue.queue.sort(key=priority_score, reverse=True)
-                        
-                    # Trim queue to max_files
-                    queue.queue = queue.queue[:max_files]
+                    queue.queue = self._limit_files(queue.queue, max_files)
                     queue.total_files = len(queue.queue)
                     logger.info(f"Queue trimmed to {len(queue.queue)} files based on max_files limit")
             
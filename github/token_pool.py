@@ -0,0 +1,77 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Tokens with fewer remaining requests than this are rested until their reset time
+MIN_REMAINING_REQUESTS = 100
+
+
+class TokenPool:
+    """Round-robin pool of GitHub tokens that tracks each token's rate limit.
+
+    Every authenticated token has its own hourly quota, so spreading requests
+    across several tokens raises the effective limit by the number of tokens.
+    """
+
+    def __init__(self, tokens):
+        """
+        Initialize the pool.
+
+        Args:
+            tokens (list): GitHub tokens to rotate through
+        """
+        # Drop empty entries and duplicates while keeping the configured order
+        self.tokens = list(dict.fromkeys(token for token in tokens if token))
+        if not self.tokens:
+            raise ValueError("TokenPool requires at least one GitHub token")
+        self.remaining = {token: None for token in self.tokens}
+        self.reset_at = {token: 0 for token in self.tokens}
+        self._index = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def next_token(self):
+        """
+        Get the next token that still has quota left.
+
+        Returns:
+            str: A token with at least MIN_REMAINING_REQUESTS remaining, or the
+                 token whose limit resets soonest if every token is exhausted
+        """
+        with self._lock:
+            now = time.time()
+            for _ in range(len(self.tokens)):
+                token = self.tokens[self._index]
+                self._index = (self._index + 1) % len(self.tokens)
+                remaining = self.remaining[token]
+                if remaining is None or remaining >= MIN_REMAINING_REQUESTS or self.reset_at[token] <= now:
+                    return token
+
+            token = min(self.tokens, key=lambda t: self.reset_at[t])
+            logger.warning(
+                f"All {len(self.tokens)} GitHub tokens are low on quota; "
+                f"next reset in {max(self.reset_at[token] - now, 0):.0f}s"
+            )
+            return token
+
+    def update(self, token, headers):
+        """
+        Record the rate-limit state GitHub reported for a token.
+
+        Args:
+            token (str): Token the request was made with
+            headers (Mapping): Response headers
+        """
+        if token not in self.remaining:
+            return
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        with self._lock:
+            if remaining is not None:
+                self.remaining[token] = int(remaining)
+            if reset is not None:
+                self.reset_at[token] = int(reset)
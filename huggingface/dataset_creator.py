@@ -1,26 +1,93 @@
 import logging
 import json
+import shutil
+import tempfile
 from pathlib import Path
 from datetime import datetime
 from datasets import Dataset, Features, Value, Pdf
-from huggingface_hub import HfApi
+from huggingface_hub import HfApi, configure_http_backend
+from huggingface.dataset_manager import DatasetManager
 from processors.file_processor import FileProcessor
 from processors.metadata_generator import MetadataGenerator
-from utils.performance import distributed_process
+from utils.performance import distributed_process, throttle_progress
 from utils.task_tracker import TaskTracker
+from utils.retry import call_with_backoff
 
 logger = logging.getLogger(__name__)
 
+# Upload Arrow shards in bounded chunks so large datasets never sit in one buffer
+PUSH_MAX_SHARD_SIZE = "500MB"
+# Minimum seconds between task-file progress writes at the same percentage
+TASK_PROGRESS_WRITE_INTERVAL = 0.5
+
 
 class DatasetCreator:
     """Create HuggingFace datasets from repository content."""
 
-    def __init__(self, huggingface_token=None):
+    def __init__(self, huggingface_token=None, session=None):
         self.token = huggingface_token
+        self.session = session
+        if session is not None:
+            # Route huggingface_hub traffic through the shared pooled session
+            configure_http_backend(backend_factory=lambda: session)
         self.file_processor = FileProcessor()
         self.metadata_generator = MetadataGenerator()
         self.api = HfApi() if huggingface_token else None
+        self.username = None  # Resolved lazily from whoami() and reused
         self.task_tracker = TaskTracker()
+        # Cache directory the last streamed dataset was built in, removed once it is pushed
+        self._build_dir = None
+
+    def _task_progress_writer(self, task_id):
+        """
+        Build a progress callback that records progress in the task file.
+
+        Each update rewrites the task's JSON file, so writes are limited to one
+        every TASK_PROGRESS_WRITE_INTERVAL seconds, plus one per percent of progress.
+        Final states are written by complete_task()/cancel_task().
+
+        Args:
+            task_id (str): Task to update
+
+        Returns:
+            callable: Called as callback(percent, message=None)
+        """
+        def write_progress(percent, message=None):
+            self.task_tracker.update_task_progress(
+                task_id,
+                percent,
+                stage=message,
+                stage_progress=percent
+            )
+        return throttle_progress(write_progress, interval=TASK_PROGRESS_WRITE_INTERVAL)
+
+    def validate_token(self):
+        """
+        Check the HuggingFace token against the Hub before any expensive work.
+
+        Resolves and caches the account's username as a side effect so later
+        repository lookups do not need another whoami() call.
+
+        Returns:
+            bool: Whether the token was accepted by the Hub
+        """
+        if not self.token:
+            logger.error("HuggingFace token not provided")
+            return False
+        try:
+            self.username = call_with_backoff(self.api.whoami, self.token)["name"]
+            return True
+        except Exception as e:
+            logger.error(f"HuggingFace token validation failed: {e}")
+            return False
+
+    def _get_repo_id(self, dataset_name):
+        """Return the fully qualified 'username/dataset_name' repository id."""
+        if "/" in dataset_name:
+            return dataset_name
+        if not self.username:
+            self.username = call_with_backoff(self.api.whoami, self.token)["name"]
+        return f"{self.username}/{dataset_name}"
 
     def create_dataset(
         self,
@@ -33,7 +100,7 @@ class DatasetCreator:
         """Create a HuggingFace dataset from file data.
         
         Args:
-            file_data_list (list): List of file data dictionaries
+            file_data_list (iterable): File data dictionaries
             dataset_name (str): Name for the dataset
             description (str, optional): Description for the dataset
             source_info (str, optional): Source information
@@ -42,10 +109,26 @@ class DatasetCreator:
         Returns:
             Dataset: The created dataset or None if creation fails
         """
+        # File entries only hold paths and metadata; the text is read later
+        file_data_list = list(file_data_list)
         logger.info(
             f"Creating dataset '{dataset_name}' from {len(file_data_list)} files"
         )
 
+        if not file_data_list:
+            logger.error("No files were successfully processed for the dataset")
+            return None
+
+        # PDFs may need the Pdf feature, which is only known after processing,
+        # so they keep the in-memory path. Everything else is streamed.
+        if not any(
+            Path(item.get("local_path", "")).suffix.lower() == ".pdf"
+            for item in file_data_list
+        ):
+            return self._create_streamed_dataset(
+                file_data_list, dataset_name, description, source_info, progress_callback
+            )
+
         # Process files
         processed_files = self.file_processor.process_files(file_data_list)
 
@@ -120,12 +203,7 @@ class DatasetCreator:
                     {"text": Value("string"), "metadata": Value("string")}
                 )
 
-            # Save dataset metadata
-            metadata_dir = Path(f"./dataset_metadata/{dataset_name}")
-            metadata_dir.mkdir(parents=True, exist_ok=True)
-
-            with open(metadata_dir / "metadata.json", "w") as f:
-                json.dump(dataset_metadata, f, indent=2)
+            self._save_dataset_metadata(dataset_name, dataset_metadata)
 
             logger.info(
                 f"Dataset '{dataset_name}' created successfully with {len(processed_files)} entries"
@@ -139,6 +217,92 @@ class DatasetCreator:
             logger.error(f"Error creating dataset: {e}")
             raise
 
+    def _generate_text_rows(self, file_data_list):
+        """Yield one dataset row per file, reading each file as it is needed."""
+        for file_data in file_data_list:
+            item = self.file_processor.process_file(file_data)
+            yield {
+                "text": item.get("text", ""),
+                "metadata": json.dumps(item["metadata"]),
+            }
+
+    def _create_streamed_dataset(
+        self, file_data_list, dataset_name, description, source_info, progress_callback
+    ):
+        """Build a text dataset by streaming rows into Arrow shards on disk.
+
+        Args:
+            file_data_list (list): File data dictionaries with local paths
+            dataset_name (str): Name for the dataset
+            description (str, optional): Description for the dataset
+            source_info (str, optional): Source information
+            progress_callback (callable, optional): Function to call with progress updates
+
+        Returns:
+            Dataset: The created dataset or None if creation fails
+        """
+        features = Features({"text": Value("string"), "metadata": Value("string")})
+        # Build in a fresh directory rather than HF_DATASETS_CACHE: the rows come
+        # from files that change between runs, so the Arrow copy is never reused
+        # and would otherwise accumulate there. It is removed after the push.
+        self._cleanup_build_dir()
+        self._build_dir = tempfile.mkdtemp(prefix="dataset_build_")
+        try:
+            dataset = Dataset.from_generator(
+                self._generate_text_rows,
+                features=features,
+                gen_kwargs={"file_data_list": file_data_list},
+                cache_dir=self._build_dir,
+            )
+        except Exception as e:
+            logger.error(f"Error creating dataset: {e}")
+            self._cleanup_build_dir()
+            raise
+
+        if len(dataset) == 0:
+            logger.error("No files were successfully processed for the dataset")
+            self._cleanup_build_dir()
+            return None
+
+        dataset_metadata = self.metadata_generator.generate_dataset_metadata(
+            source_info or dataset_name, len(dataset)
+        )
+        if description:
+            dataset_metadata["description"] = description
+        dataset_metadata["repository_structure"] = (
+            self.metadata_generator.generate_repo_structure_metadata(file_data_list)
+        )
+
+        dataset.info.description = dataset_metadata["description"]
+        dataset.info.license = "Unknown"  # Set appropriate license if known
+        dataset.info.features = features
+
+        self._save_dataset_metadata(dataset_name, dataset_metadata)
+
+        logger.info(
+            f"Dataset '{dataset_name}' created successfully with {len(dataset)} entries"
+        )
+
+        if progress_callback:
+            progress_callback(100)
+
+        return dataset
+
+    def _cleanup_build_dir(self):
+        """Remove the directory the last streamed dataset was built in, if any."""
+        if self._build_dir:
+            # ignore_errors: on Windows the Arrow files stay locked while mapped
+            shutil.rmtree(self._build_dir, ignore_errors=True)
+            self._build_dir = None
+
+    def _save_dataset_metadata(self, dataset_name, dataset_metadata):
+        """Write the dataset metadata to ./dataset_metadata/<dataset_name>/metadata.json."""
+        metadata_dir = Path(f"./dataset_metadata/{dataset_name}")
+        metadata_dir.mkdir(parents=True, exist_ok=True)
+
+        with open(metadata_dir / "metadata.json", "w") as f:
+            json.dump(dataset_metadata, f, indent=2)
+
     def push_to_hub(self, dataset, repo_name, private=True, progress_callback=None, commit_message=None):
         """Push a dataset to the HuggingFace Hub.
         
@@ -158,9 +322,12 @@ class DatasetCreator:
 
         try:
             logger.info(f"Pushing dataset to HuggingFace Hub: {repo_name}")
-            # Check if the repo exists
+            # Check if the repo exists with a single lookup rather than listing every dataset
             try:
-                repo_exists = any(repo.id == repo_name for repo in self.api.list_datasets(author=self.api.whoami(self.token)["name"]))
+                repo_exists = call_with_backoff(
+                    self.api.repo_exists,
+                    self._get_repo_id(repo_name), repo_type="dataset", token=self.token
+                )
             except Exception:
                 repo_exists = False
                 
@@ -168,12 +335,14 @@ class DatasetCreator:
             # If commit_message is not provided, generate a default one
             commit_message = commit_message or ("Update dataset" if repo_exists else "Upload dataset")
             
-            # Push the dataset to the HuggingFace Hub
-            dataset.push_to_hub(
+            # Push the dataset to the HuggingFace Hub, retrying on rate limits
+            call_with_backoff(
+                dataset.push_to_hub,
                 repo_name, 
                 token=self.token, 
                 private=private if not repo_exists else None,
-                commit_message=commit_message
+                commit_message=commit_message,
+                max_shard_size=PUSH_MAX_SHARD_SIZE
             )
             
             logger.info(f"Dataset successfully pushed to {repo_name}")
@@ -201,7 +370,7 @@ class DatasetCreator:
         Create a dataset and push it to the HuggingFace Hub.
         
         Args:
-            file_data_list: List of file data to include in the dataset
+            file_data_list: Iterable of file data to include in the dataset
             dataset_name: Name for the dataset
             description: Dataset description
             source_info: Source information
@@ -251,8 +420,7 @@ class DatasetCreator:
                 if update_existing:
                     try:
                         # Check if dataset exists
-                        username = self.api.whoami()["name"]
-                        repo_url = f"{username}/{dataset_name}"
+                        repo_url = self._get_repo_id(dataset_name)
                         
                         # Try to get dataset info to check if it exists
                         existing = self.api.repo_info(repo_id=repo_url, repo_type="dataset")
@@ -264,11 +432,17 @@ class DatasetCreator:
                 success = self.push_to_hub(
                     dataset, dataset_name, private, push_progress, commit_message=message
                 )
+                if success:
+                    # A new or updated dataset makes cached listings stale
+                    DatasetManager.clear_list_cache()
                 return success, dataset
             return False, None
         except Exception as e:
             logger.error(f"Error in create_and_push_dataset: {e}")
             return False, None
+        finally:
+            # The Arrow build copy has been uploaded (or is useless); don't keep it on disk
+            self._cleanup_build_dir()
 
     def create_dataset_from_repository(
         self, repo_url, dataset_name, description, progress_callback=None, _cancellation_event=None,
@@ -306,14 +480,11 @@ class DatasetCreator:
             )
         
         # Wrapper for progress callback that also updates task tracking
+        _track_progress = self._task_progress_writer(task_id)
+        
         def _progress_callback(percent, message=None):
             # Update task progress
-            self.task_tracker.update_task_progress(
-                task_id, 
-                percent,
-                stage=message,
-                stage_progress=percent
-            )
+            _track_progress(percent, message)
             # Call original callback
             progress_callback(percent, message)
         
@@ -442,14 +613,11 @@ class DatasetCreator:
             )
         
         # Wrapper for progress callback that also updates task tracking
+        _track_progress = self._task_progress_writer(task_id)
+        
         def _progress_callback(percent, message=None):
             # Update task progress
-            self.task_tracker.update_task_progress(
-                task_id, 
-                percent,
-                stage=message,
-                stage_progress=percent
-            )
+            _track_progress(percent, message)
             # Call original callback
             progress_callback(percent, message)
         
@@ -609,10 +777,63 @@ class DatasetCreator:
             logger.error(f"Error processing source: {e}")
             return False
             
+    def _start_graph_export(self, graph_name, dataset_name, url):
+        """
+        Open the knowledge graph and start a background document writer.
+        
+        Args:
+            graph_name: Knowledge graph to export to
+            dataset_name: Dataset name, used in a new graph's description
+            url: Crawl start URL, used in a new graph's description
+            
+        Returns:
+            tuple: (GraphStore, GraphDocumentWriter), or (None, None) if the graph is unavailable
+        """
+        try:
+            from neo4j.graph_store import GraphStore, GraphDocumentWriter
+            
+            # Initialize graph store with specified graph name
+            graph_store = GraphStore(graph_name=graph_name)
+            if not graph_store._driver:
+                logger.warning("Neo4j is not available; skipping knowledge graph export")
+                return None, None
+            
+            # Create or select graph
+            if graph_name and not graph_store.test_connection():
+                graph_store.create_graph(graph_name, f"Knowledge graph for {dataset_name} from {url}")
+            
+            # Initialize graph schema if needed
+            graph_store.initialize_schema()
+            return graph_store, GraphDocumentWriter(graph_store)
+        except Exception as e:
+            logger.error(f"Error preparing knowledge graph export: {e}")
+            return None, None
+    
+    @staticmethod
+    def _graph_page_exporter(graph_writer):
+        """Return a crawl page callback that queues each page for graph_writer, or None."""
+        if graph_writer is None:
+            return None
+        from neo4j.graph_store import GraphStore
+        
+        def export_page(page_data):
+            url = page_data.get("url", "")
+            graph_writer.add({
+                # Keyed by URL so a retried or resumed crawl MERGEs onto the same node
+                "id": GraphStore.document_id(url),
+                "url": url,
+                "title": page_data.get("title", "Unknown Title"),
+                "description": page_data.get("meta_description", ""),
+                "content": page_data.get("markdown", ""),
+                "fetched_at": page_data.get("fetched_at", "")
+            })
+        return export_page
+    
     def create_dataset_from_url(
         self, url, dataset_name, description, recursive=False, progress_callback=None,
         _cancellation_event=None, task_id=None, resume_from=None, update_existing=False,
-        export_to_knowledge_graph=True, graph_name=None, user_instructions=None, use_ai_guidance=False
+        export_to_knowledge_graph=True, graph_name=None, user_instructions=None, use_ai_guidance=False,
+        web_crawler=None
     ):
         """Create a dataset from a URL by crawling the website.
         
@@ -630,6 +851,7 @@ class DatasetCreator:
             graph_name: Optional name for the knowledge graph
             user_instructions: User's description of what to scrape (for AI guidance)
             use_ai_guidance: Whether to use AI to guide the crawling process
+            web_crawler: Optional WebCrawler to reuse instead of creating a new one
             
         Returns:
             Dictionary with success status and message
@@ -652,14 +874,11 @@ class DatasetCreator:
             )
         
         # Wrapper for progress callback that also updates task tracking
+        _track_progress = self._task_progress_writer(task_id)
+        
         def _progress_callback(percent, message=None):
             # Update task progress
-            self.task_tracker.update_task_progress(
-                task_id, 
-                percent,
-                stage=message,
-                stage_progress=percent
-            )
+            _track_progress(percent, message)
             # Call original callback
             progress_callback(percent, message)
         
@@ -669,10 +888,16 @@ class DatasetCreator:
             self.task_tracker.cancel_task(task_id)
             return {"success": False, "message": "Operation cancelled by user.", "task_id": task_id}
         
+        graph_writer = None
         try:
-            # Initialize web crawler
-            from web.crawler import WebCrawler
-            web_crawler = WebCrawler(respect_robots_txt=True, rate_limit_delay=1.0)
+            # Initialize web crawler unless the caller shares one across tasks
+            if web_crawler is None:
+                from web.crawler import WebCrawler
+                web_crawler = WebCrawler(respect_robots_txt=True, rate_limit_delay=1.0)
+            
+            # Set up the knowledge graph first so pages are written while the crawl runs
+            if export_to_knowledge_graph:
+                graph_store, graph_writer = self._start_graph_export(graph_name, dataset_name, url)
             
             # Start crawling message
             _progress_callback(10, f"Starting {'recursive ' if recursive else ''}crawl of {url}")
@@ -697,7 +922,8 @@ class DatasetCreator:
                 progress_callback=crawl_progress,
                 _cancellation_event=_cancellation_event,
                 user_instructions=user_instructions,
-                use_ai_guidance=use_ai_guidance
+                use_ai_guidance=use_ai_guidance,
+                page_callback=self._graph_page_exporter(graph_writer)
             )
             
             # Check for cancellation or error
@@ -744,50 +970,27 @@ class DatasetCreator:
             )
             
             # Check if we need to export to knowledge graph
-            if success and export_to_knowledge_graph:
+            if success and graph_writer:
                 _progress_callback(91, "Exporting to knowledge graph")
                 try:
-                    from neo4j.graph_store import GraphStore
-                    
-                    # Initialize graph store with specified graph name
-                    graph_store = GraphStore(graph_name=graph_name)
-                    
-                    # Create or select graph
-                    if graph_name and not graph_store.test_connection():
-                        graph_store.create_graph(graph_name, f"Knowledge graph for {dataset_name} from {url}")
-                    
-                    # Initialize graph schema if needed
-                    graph_store.initialize_schema()
-                    
-                    # Add documents to graph
-                    for i, page_data in enumerate(crawled_data):
-                        # Basic document metadata
-                        document_data = {
-                            "url": page_data.get("url", ""),
-                            "title": page_data.get("title", "Unknown Title"),
-                            "description": page_data.get("meta_description", ""),
-                            "content": page_data.get("markdown", ""),
-                            "fetched_at": page_data.get("fetched_at", "")
-                        }
-                        
-                        # Add to graph
-                        document_id = graph_store.add_document(document_data)
-                        
-                        # Update progress periodically
-                        if i % 10 == 0 or i == len(crawled_data) - 1:
-                            progress = 91 + ((i + 1) / len(crawled_data) * 8)
-                            _progress_callback(progress, f"Adding documents to knowledge graph ({i+1}/{len(crawled_data)})")
+                    # Wait for the documents queued during the crawl to be written
+                    _progress_callback(92, f"Adding {len(crawled_data)} documents to knowledge graph")
+                    written = graph_writer.close()
+                    logger.info(f"Exported {written} of {len(crawled_data)} crawled pages to the knowledge graph")
+                    if graph_writer.failed:
+                        _progress_callback(93, f"{graph_writer.failed} pages could not be added to the knowledge graph")
                     
                     # Extract entities from documents
                     _progress_callback(99, "Extracting entities for knowledge graph")
+                    # Same ids as the exported pages, so entities attach to those nodes
                     documents = [
                         {
-                            "id": f"doc_{i}",
+                            "id": graph_store.document_id(page.get("url", "")),
                             "url": page.get("url", ""),
                             "title": page.get("title", ""),
                             "content": page.get("markdown", "")
                         }
-                        for i, page in enumerate(crawled_data)
+                        for page in crawled_data
                     ]
                     
                     # Extract entities and relationships
@@ -839,4 +1042,8 @@ class DatasetCreator:
                 "success": False, 
                 "message": str(e), 
                 "task_id": task_id
-            }
\ No newline at end of file
+            }
+        finally:
+            # Stop the export writer on every early return
+            if graph_writer:
+                graph_writer.close()
\ No newline at end of file
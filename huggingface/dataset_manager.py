@@ -1,16 +1,49 @@
 import logging
+import os
 import json
-from huggingface_hub import HfApi, HfFolder, DatasetCard, DatasetCardData
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from huggingface_hub import HfApi, HfFolder, DatasetCard, DatasetCardData, configure_http_backend, snapshot_download
 from pathlib import Path
+from types import SimpleNamespace
+from datetime import datetime
+from config.settings import CACHE_DIR
+from utils.retry import call_with_backoff
+from utils.http_session import get_session
+from utils import json_io
 
 logger = logging.getLogger(__name__)
 
+# How long a list_datasets() result is reused before hitting the Hub again
+DATASET_LIST_CACHE_TTL = 60
+# How long a 404 from dataset_info() is remembered, and how many misses are kept
+NOT_FOUND_CACHE_TTL = 60
+NOT_FOUND_CACHE_SIZE = 256
+# Last dataset listing per user, shown straight away while the Hub is queried
+DATASET_INDEX_FILE = CACHE_DIR / "datasets_index.json"
+# Files fetched by download_dataset_metadata(): dataset card, JSON metadata and configs
+METADATA_FILE_PATTERNS = ["*.md", "*.json", "*.yaml"]
+
 
 class DatasetManager:
     """Manage existing datasets on HuggingFace Hub."""
 
-    def __init__(self, huggingface_token=None, credentials_manager=None):
+    # Process-wide cache of list_datasets() results: author -> (fetched_at, datasets)
+    _list_cache = {}
+    _list_cache_lock = threading.Lock()
+
+    @classmethod
+    def clear_list_cache(cls):
+        """Drop cached dataset listings, e.g. after a dataset is created or deleted."""
+        with cls._list_cache_lock:
+            cls._list_cache.clear()
+
+    def __init__(self, huggingface_token=None, credentials_manager=None, session=None):
         self.credentials_manager = credentials_manager
+        # One pooled keep-alive session for every Hub call, including parallel metadata downloads
+        self.session = session if session is not None else get_session()
+        configure_http_backend(backend_factory=lambda: self.session)
         
         if credentials_manager:
             _, self.token = credentials_manager.get_huggingface_credentials()
@@ -18,15 +51,27 @@ class DatasetManager:
             self.token = huggingface_token
             
         self.api = HfApi()
+        self.username = None  # Resolved lazily from whoami() and reused
+        # DatasetInfo objects from the last full listing, keyed by dataset id
+        self._info_cache = {}
+        # Dataset ids the Hub reported as missing, mapped to when that expires
+        self._not_found = {}
         if self.token:
             HfFolder.save_token(self.token)
 
-    def list_datasets(self, username=None):
-        """List datasets for the authenticated user or specified username."""
+    def list_datasets(self, username=None, refresh=False):
+        """List datasets for the authenticated user or specified username.
+
+        Args:
+            username (str, optional): User to list; defaults to the authenticated user
+            refresh (bool): Query the Hub even if a cached listing is available
+
+        Returns:
+            list: DatasetInfo objects, empty on failure
+        """
         try:
             if username:
                 logger.info(f"Listing datasets for user: {username}")
-                datasets = self.api.list_datasets(author=username)
             else:
                 # List datasets for the authenticated user
                 if not self.token:
@@ -34,10 +79,27 @@ class DatasetManager:
                         "No HuggingFace token provided. Cannot list datasets."
                     )
                     return []
-                whoami = self.api.whoami(self.token)
-                username = whoami["name"]
+                if not self.username:
+                    self.username = call_with_backoff(self.api.whoami, self.token)["name"]
+                username = self.username
                 logger.info(f"Listing datasets for authenticated user: {username}")
-                datasets = self.api.list_datasets(author=username)
+
+            with DatasetManager._list_cache_lock:
+                cached = DatasetManager._list_cache.get(username)
+            if not refresh and cached and time.monotonic() - cached[0] < DATASET_LIST_CACHE_TTL:
+                logger.debug(f"Using cached dataset list for {username}")
+                datasets = cached[1]
+                self._info_cache.update((info.id, info) for info in datasets)
+                return datasets
+
+            # full=True returns the detail fields too, so viewing a dataset needs no extra request
+            datasets = call_with_backoff(
+                lambda: list(self.api.list_datasets(author=username, full=True))
+            )
+            with DatasetManager._list_cache_lock:
+                DatasetManager._list_cache[username] = (time.monotonic(), datasets)
+            self._info_cache.update((info.id, info) for info in datasets)
+            self._save_dataset_index(username, datasets)
 
             logger.info(f"Found {len(datasets)} datasets")
             return datasets
@@ -45,16 +107,83 @@ class DatasetManager:
             logger.error(f"Error listing datasets: {e}")
             return []
 
+    def _save_dataset_index(self, username, datasets):
+        """Persist a listing to DATASET_INDEX_FILE, replacing the file atomically."""
+        try:
+            index = json_io.loads(DATASET_INDEX_FILE.read_bytes()) if DATASET_INDEX_FILE.exists() else {}
+        except (OSError, ValueError):
+            index = {}
+        index.setdefault("users", {})[username] = {
+            "fetched_at": datetime.now().isoformat(),
+            "datasets": [
+                {
+                    "id": info.id,
+                    "last_modified": info.last_modified.isoformat() if info.last_modified else None,
+                }
+                for info in datasets
+            ],
+        }
+        try:
+            DATASET_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = DATASET_INDEX_FILE.with_suffix(".json.tmp")
+            tmp_file.write_bytes(json_io.dumps(index))
+            os.replace(tmp_file, DATASET_INDEX_FILE)
+        except OSError as e:
+            logger.warning(f"Could not save dataset index: {e}")
+
+    def load_dataset_index(self, username=None):
+        """Load the last saved listing without contacting the Hub.
+
+        Args:
+            username (str, optional): User whose listing to load; defaults to
+                the authenticated user once list_datasets() has resolved it
+                
+        Returns:
+            list: Objects with id and last_modified attributes, empty if nothing is
+                cached for that user or the user isn't known yet
+        """
+        # Never guess: another account's listing must not be shown as this one's
+        username = username or self.username
+        if not username:
+            return []
+        try:
+            index = json_io.loads(DATASET_INDEX_FILE.read_bytes())
+        except (OSError, ValueError):
+            return []
+        entry = index.get("users", {}).get(username)
+        if not entry:
+            return []
+        return [SimpleNamespace(**dataset) for dataset in entry.get("datasets", [])]
+
     def get_dataset_info(self, dataset_name):
-        """Get information about a specific dataset."""
+        """Get information about a specific dataset, reusing the last listing when possible."""
+        cached = self._info_cache.get(dataset_name)
+        if cached is not None:
+            return cached
+        expires_at = self._not_found.get(dataset_name)
+        if expires_at is not None:
+            if time.monotonic() < expires_at:
+                logger.info(f"Dataset {dataset_name} was not found recently; skipping lookup")
+                return None
+            del self._not_found[dataset_name]
         try:
             logger.info(f"Getting info for dataset: {dataset_name}")
-            info = self.api.dataset_info(dataset_name)
+            info = call_with_backoff(self.api.dataset_info, dataset_name)
             return info
         except Exception as e:
+            response = getattr(e, "response", None)
+            if response is not None and response.status_code == 404:
+                self._remember_not_found(dataset_name)
             logger.error(f"Error getting dataset info for {dataset_name}: {e}")
             return None
 
+    def _remember_not_found(self, dataset_name):
+        """Cache a 404 so repeated lookups of a missing dataset don't hit the Hub."""
+        if len(self._not_found) >= NOT_FOUND_CACHE_SIZE:
+            # Drop the oldest entry; dicts keep insertion order
+            self._not_found.pop(next(iter(self._not_found)))
+        self._not_found[dataset_name] = time.monotonic() + NOT_FOUND_CACHE_TTL
+
     def delete_dataset(self, dataset_name):
         """Delete a dataset from HuggingFace Hub.
         
@@ -70,7 +199,11 @@ class DatasetManager:
 
         try:
             logger.info(f"Deleting dataset: {dataset_name}")
-            self.api.delete_repo(dataset_name, repo_type="dataset", token=self.token)
+            call_with_backoff(
+                self.api.delete_repo, dataset_name, repo_type="dataset", token=self.token
+            )
+            DatasetManager.clear_list_cache()
+            self._info_cache.pop(dataset_name, None)
             logger.info(f"Dataset {dataset_name} deleted successfully")
             return True
         except Exception as e:
@@ -94,69 +227,90 @@ class DatasetManager:
 
             logger.info(f"Downloading metadata for dataset: {dataset_name}")
             try:
-                # First try to get the metadata.json file if it exists
-                self.api.hf_hub_download(
+                # One resolve for the whole repo, then the matching files download in parallel
+                call_with_backoff(
+                    snapshot_download,
                     repo_id=dataset_name,
-                    filename="metadata.json",
                     repo_type="dataset",
+                    allow_patterns=METADATA_FILE_PATTERNS,
                     local_dir=output_dir,
+                    max_workers=8,
                     token=self.token,
                 )
-                logger.info(f"Downloaded metadata.json for {dataset_name}")
-                return True
-            except Exception as e:
-                logger.warning(f"No metadata.json found for {dataset_name}: {e}")
-
-                # Try to get the dataset card
-                try:
-                    dataset_card = DatasetCard.load(dataset_name, token=self.token)
-                    if dataset_card and dataset_card.data:
-                        # Extract metadata from the dataset card
-                        metadata = {
-                            "name": dataset_name,
-                            "description": dataset_card.data.get("description", ""),
-                            "license": dataset_card.data.get("license", "Unknown"),
-                            "tags": dataset_card.data.get("tags", []),
-                        }
-                        
-                        with open(output_dir / "dataset_card_info.json", "w") as f:
-                            json.dump(metadata, f, indent=2)
-                            
-                        logger.info(f"Created dataset_card_info.json for {dataset_name}")
-                        return True
-                except Exception as card_e:
-                    logger.warning(f"Could not load dataset card for {dataset_name}: {card_e}")
-
-                # As a last resort, get the dataset info
-                info = self.get_dataset_info(dataset_name)
-                if info:
-                    metadata = {
-                        "name": info.id,
-                        "description": info.description,
-                        "created_at": (
-                            info.created_at.isoformat() if info.created_at else None
-                        ),
-                        "last_modified": (
-                            info.last_modified.isoformat()
-                            if info.last_modified
-                            else None
-                        ),
-                        "tags": info.tags,
-                        "downloads": info.downloads,
-                        "likes": info.likes,
-                    }
-
-                    with open(output_dir / "dataset_info.json", "w") as f:
-                        json.dump(metadata, f, indent=2)
-
-                    logger.info(f"Created dataset_info.json for {dataset_name}")
+                downloaded = [
+                    path for path in Path(output_dir).rglob("*")
+                    if path.is_file() and ".cache" not in path.parts
+                ]
+                if downloaded:
+                    logger.info(f"Downloaded {len(downloaded)} metadata files for {dataset_name}")
                     return True
+                logger.warning(f"No metadata files found in {dataset_name}")
+            except Exception as e:
+                logger.warning(f"Could not download metadata files for {dataset_name}: {e}")
+
+            # Fall back to a summary built from the dataset info
+            info = self.get_dataset_info(dataset_name)
+            if info:
+                metadata = {
+                    "name": info.id,
+                    "description": info.description,
+                    "created_at": (
+                        info.created_at.isoformat() if info.created_at else None
+                    ),
+                    "last_modified": (
+                        info.last_modified.isoformat()
+                        if info.last_modified
+                        else None
+                    ),
+                    "tags": info.tags,
+                    "downloads": info.downloads,
+                    "likes": info.likes,
+                }
+
+                with open(output_dir / "dataset_info.json", "w") as f:
+                    json.dump(metadata, f, indent=2)
+
+                logger.info(f"Created dataset_info.json for {dataset_name}")
+                return True
 
-                return False
+            return False
         except Exception as e:
             logger.error(f"Error downloading dataset metadata for {dataset_name}: {e}")
             return False
             
+    def download_all_metadata(self, dataset_ids, max_workers=8, progress_callback=None):
+        """Download metadata for several datasets in parallel.
+        
+        Args:
+            dataset_ids (list): Dataset names in format 'username/dataset_name'
+            max_workers (int): Maximum number of concurrent downloads
+            progress_callback (callable, optional): Called as
+                progress_callback(completed, total, dataset_id, success) after each download
+            
+        Returns:
+            dict: Mapping of dataset id to whether its metadata was downloaded
+        """
+        results = {}
+        if not dataset_ids:
+            return results
+
+        # Each download is a handful of small HTTP requests, so threads overlap the latency
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.download_dataset_metadata, dataset_id): dataset_id
+                for dataset_id in dataset_ids
+            }
+            for completed, future in enumerate(as_completed(futures), 1):
+                dataset_id = futures[future]
+                results[dataset_id] = future.result()
+                if progress_callback:
+                    progress_callback(completed, len(futures), dataset_id, results[dataset_id])
+
+        logger.info(
+            f"Downloaded metadata for {sum(results.values())}/{len(results)} datasets"
+        )
+        return results
+            
     def update_dataset_card(self, dataset_name, metadata):
         """Update or create a dataset card with metadata.
         
@@ -199,7 +353,7 @@ class DatasetManager:
                 card.data["repository_structure"] = metadata["repository_structure"]
                 
             # Push the updated card
-            card.push_to_hub(dataset_name, token=self.token)
+            call_with_backoff(card.push_to_hub, dataset_name, token=self.token)
             logger.info(f"Dataset card updated for {dataset_name}")
             return True
         except Exception as e:
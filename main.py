@@ -3,18 +3,26 @@ import os
 import logging
 import argparse
 import signal
-import traceback
 import time
 from pathlib import Path
+
+
+def _cache_dir_from_argv(argv):
+    """Read --cache-dir ahead of full argument parsing."""
+    early_parser = argparse.ArgumentParser(add_help=False)
+    early_parser.add_argument("--cache-dir")
+    return early_parser.parse_known_args(argv)[0].cache_dir
+
+
+# The HuggingFace cache location is read when datasets is imported, so set it
+# up before the imports below pull that library in
+from utils.hf_cache import configure_huggingface_cache
+configure_huggingface_cache(_cache_dir_from_argv(sys.argv[1:]))
+
 from utils.logging_config import setup_logging
-from config.credentials_manager import CredentialsManager
-from huggingface.dataset_manager import DatasetManager
+from config.credentials_manager import get_credentials_manager
 from utils.task_tracker import TaskTracker
-from utils.task_scheduler import TaskScheduler
-from api.server import start_server, stop_server, is_server_running, get_server_info
 from threading import Event, current_thread
-from ui.main_menu import main_menu
-from ui.tui_app import TUIApp
 
 # Global cancellation event for stopping ongoing tasks
 global_cancellation_event = Event()
@@ -52,7 +60,7 @@ def run_update(args):
     
     try:
         # Initialize required components
-        credentials_manager = CredentialsManager()
+        credentials_manager = get_credentials_manager()
         task_tracker = TaskTracker()
         
         # Create task to track progress
@@ -87,22 +95,34 @@ def run_update(args):
                     f"Updating dataset '{dataset_name}' from URL {url}"
                 )
                 
+            # Whole percentage and message last reported, so repeated per-item
+            # callbacks are skipped; the task file is only rewritten when the
+            # percentage moves
+            last_report = (-1, None)
+            
             # Define progress callback
             def progress_callback(percent, message=None):
+                nonlocal last_report
                 # Check for cancellation
                 if check_cancelled():
                     if message:
-                        logger.info(f"Cancelled at {percent:.0f}% - {message}")
+                        logger.info("Cancelled at %.0f%% - %s", percent, message)
                     else:
-                        logger.info(f"Cancelled at {percent:.0f}%")
+                        logger.info("Cancelled at %.0f%%", percent)
                     return
                 
+                report = (int(percent), message)
+                if report == last_report:
+                    return
+                percent_changed = report[0] != last_report[0]
+                last_report = report
+                
                 if message:
-                    logger.info(f"Progress: {percent:.0f}% - {message}")
+                    logger.info("Progress: %.0f%% - %s", percent, message)
                 else:
-                    logger.info(f"Progress: {percent:.0f}%")
+                    logger.info("Progress: %.0f%%", percent)
                     
-                if task_id:
+                if task_id and percent_changed:
                     task_tracker.update_task_progress(task_id, percent)
             
             # Create or update dataset
@@ -145,43 +165,115 @@ def run_update(args):
             task_tracker.complete_task(task_id, success=False, result={"error": str(e)})
         return 1
 
-def setup_signal_handlers():
-    """Setup signal handlers for graceful shutdown."""
+def run_scrape(args):
+    """
+    Scrape a URL into a new dataset without the interactive UI.
     
-    def signal_handler(sig, frame):
-        """Handle signals like CTRL+C by setting the cancellation event."""
-        if sig == signal.SIGINT:
-            print("\n\nReceived interrupt signal (Ctrl+C). Cancelling operations and shutting down...")
-        elif sig == signal.SIGTERM:
-            print("\n\nReceived termination signal. Cancelling operations and shutting down...")
-        
-        # Set the cancellation event to stop ongoing tasks
-        global_cancellation_event.set()
-        
-        # Set a flag to exit after current operation
-        current_thread().exit_requested = True
-        
-        # Make sure we don't handle the same signal again (let default handler take over if needed)
-        signal.signal(sig, signal.SIG_DFL)
+    Args:
+        args: Command line arguments
         
-        # Don't exit immediately - let the application handle the shutdown gracefully
-        # The application will check the cancellation event and exit cleanly
+    Returns:
+        int: Exit code (0 for success, 1 for failure)
+    """
+    logger = logging.getLogger("scrape")
+    global_cancellation_event.clear()
     
-    # Set up the signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    task_tracker = TaskTracker()
+    _, huggingface_token = get_credentials_manager().get_huggingface_credentials()
+    if not huggingface_token:
+        logger.error("HuggingFace token not found. Please set credentials first.")
+        return 1
+    
+    # Heavy crawler and dataset dependencies are only needed on this path
+    from huggingface.dataset_creator import DatasetCreator
+    
+    task_id = task_tracker.create_task(
+        "scrape",
+        {"url": args.url, "dataset_name": args.dataset_name, "recursive": args.recursive},
+        f"Scraping {args.url} into dataset '{args.dataset_name}'"
+    )
+    
+    # Whole percentage and message last logged; repeats of both are skipped
+    last_report = (-1, None)
+    
+    def progress_callback(percent, message=None):
+        nonlocal last_report
+        report = (int(percent), message)
+        if report == last_report:
+            return
+        last_report = report
+        if message:
+            logger.info("Progress: %.0f%% - %s", percent, message)
+        else:
+            logger.info("Progress: %.0f%%", percent)
+    
+    try:
+        result = DatasetCreator(huggingface_token=huggingface_token).create_dataset_from_url(
+            url=args.url,
+            dataset_name=args.dataset_name,
+            description=args.description or f"Documentation scraped from {args.url}",
+            recursive=args.recursive,
+            progress_callback=progress_callback,
+            _cancellation_event=global_cancellation_event,
+            task_id=task_id,
+            export_to_knowledge_graph=args.export_graph,
+            graph_name=args.graph_name,
+            user_instructions=args.instructions,
+            use_ai_guidance=bool(args.instructions)
+        )
+    except Exception as e:
+        logger.error(f"Error during scrape: {e}", exc_info=True)
+        task_tracker.complete_task(task_id, success=False, result={"error": str(e)})
+        return 1
+    
+    # DatasetCreator records the task's final state, including cancellation
+    if result.get("success"):
+        logger.info(f"Dataset '{args.dataset_name}' created successfully")
+        return 0
+    logger.error(f"Failed to create dataset: {result.get('message', 'Unknown error')}")
+    return 1
+
+def _signal_handler(sig, frame):
+    """Handle signals like CTRL+C by setting the cancellation event."""
+    if sig == signal.SIGINT:
+        print("\n\nReceived interrupt signal (Ctrl+C). Cancelling operations and shutting down...")
+    elif sig == signal.SIGTERM:
+        print("\n\nReceived termination signal. Cancelling operations and shutting down...")
+    
+    # Set the cancellation event to stop ongoing tasks
+    global_cancellation_event.set()
+    
+    # Set a flag to exit after current operation
+    current_thread().exit_requested = True
+    
+    # Make sure we don't handle the same signal again (let default handler take over if needed)
+    signal.signal(sig, signal.SIG_DFL)
+    
+    # Don't exit immediately - let the application handle the shutdown gracefully
+    # The application will check the cancellation event and exit cleanly
+
+def setup_signal_handlers():
+    """Setup signal handlers for graceful shutdown."""
+    # Register once; calling main() again leaves the existing handlers in place
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        if signal.getsignal(sig) is not _signal_handler:
+            signal.signal(sig, _signal_handler)
     
     # Add an exit flag to the main thread
-    current_thread().exit_requested = False
+    thread = current_thread()
+    if not hasattr(thread, "exit_requested"):
+        thread.exit_requested = False
 
 def clean_shutdown():
     """Perform a clean shutdown of the application."""
     logger.info("Performing clean shutdown...")
     
-    # Stop server if running
-    if is_server_running():
+    # Stop server if running. The server module is only loaded once something
+    # has started it, so there is nothing to stop (or import) otherwise
+    server = sys.modules.get("api.server")
+    if server and server.is_server_running():
         print("\nStopping OpenAPI Endpoints...")
-        stop_server()
+        server.stop_server()
     
     # Cancel any running background threads
     from web.crawler import shutdown_executor
@@ -199,6 +291,10 @@ def main():
     
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="othertales homework")
+    parser.add_argument(
+        "--cache-dir",
+        help="HuggingFace cache directory (sets HF_HOME; default: ~/.othertales_homework/cache/huggingface)",
+    )
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
     
     # Update command
@@ -208,6 +304,15 @@ def main():
     update_parser.add_argument("--recursive", action="store_true", help="Recursively crawl all linked pages")
     update_parser.add_argument("--task-id", help="Task ID for tracking")
     
+    # Scrape command: the TUI's scrape flow with every choice given as a flag
+    scrape_parser = subparsers.add_parser("scrape", help="Scrape a URL into a new dataset")
+    scrape_parser.add_argument("--url", required=True, help="URL to scrape")
+    scrape_parser.add_argument("--dataset-name", required=True, help="Name for the new dataset")
+    scrape_parser.add_argument("--description", help="Dataset description")
+    scrape_parser.add_argument("--recursive", action="store_true", help="Recursively crawl all linked pages")
+    scrape_parser.add_argument("--export-graph", action="store_true", help="Also export the content to a knowledge graph")
+    scrape_parser.add_argument("--graph-name", help="Knowledge graph to export to")
+    scrape_parser.add_argument("--instructions", help="Describe what to scrape to enable AI-guided crawling")
     
     # Parse arguments
     args = parser.parse_args()
@@ -218,8 +323,14 @@ def main():
             result = run_update(args)
             clean_shutdown()
             return result
+        elif args.command == "scrape":
+            result = run_scrape(args)
+            clean_shutdown()
+            return result
         else:
-            # No command or unknown command, run TUI application
+            # No command or unknown command, run TUI application. Textual is
+            # imported only here so scheduled `update` runs and --help skip it
+            from ui.tui_app import TUIApp
             TUIApp().run()
             clean_shutdown()
             return 0
@@ -232,8 +343,9 @@ def main():
         return 0
     except Exception as e:
         print(f"\nError: Application failed: {e}")
-        logger.critical(f"Application failed with error: {e}")
-        logger.debug(f"Traceback: {traceback.format_exc()}")
+        logger.critical("Application failed with error: %s", e)
+        # The handler formats the traceback only if DEBUG records are emitted
+        logger.debug("Traceback", exc_info=True)
         clean_shutdown()
         return 1
 
@@ -5,7 +5,13 @@ from datetime import datetime
 import json
 from pathlib import Path
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+import atexit
 import hashlib
+import queue
+import threading
+import time
+from urllib.parse import urldefrag, urlsplit, urlunsplit
 
 # Import core Neo4j driver
 import neo4j
@@ -13,10 +19,79 @@ from neo4j import GraphDatabase
 
 # Import LangChain libraries directly
 from langchain_core.documents import Document
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_aws import ChatBedrockConverse
 
 logger = logging.getLogger(__name__)
 
+# Rows sent per UNWIND query when writing nodes and relationships in bulk
+GRAPH_WRITE_BATCH_SIZE = 1000
+
+# Entity-extraction LLM requests in flight at once; stay under the provider's rate limit
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "8"))
+
+# Static instructions sent ahead of every document during entity extraction
+ENTITY_EXTRACTION_PREAMBLE = """
+Extract entities and relationships from the document the user provides.
+
+Return ONLY a JSON structure with no explanations:
+
+{{
+    "entities": [
+        {{
+            "id": "unique-id-1",
+            "type": "Person|Organization|Concept|...",
+            "name": "Entity name",
+            "properties": {{
+                "property1": "value1",
+                "property2": "value2"
+            }}
+        }},
+        ...
+    ],
+    "relationships": [
+        {{
+            "source_id": "unique-id-1",
+            "target_id": "unique-id-2",
+            "type": "RELATIONSHIP_TYPE",
+            "properties": {{
+                "property1": "value1",
+                "property2": "value2"
+            }}
+        }},
+        ...
+    ]
+}}
+
+Entity types must be one of: {allowed_nodes}
+"""
+
+# Documents per add_documents() call when exporting pages while a crawl runs,
+# and how many such batches may wait for the writer thread
+GRAPH_EXPORT_BATCH_SIZE = 100
+GRAPH_EXPORT_QUEUE_SIZE = 4
+
+# How long a list_graphs() result is reused before querying Neo4j again
+GRAPH_LIST_CACHE_TTL = 60
+
+# Node labels the entity extractor may create
+ENTITY_TYPES = [
+    "Person",
+    "Organization",
+    "Concept",
+    "Event",
+    "Location",
+    "Date",
+    "Topic",
+    "Product",
+    "Technology",
+    "Law",
+    "Regulation"
+]
+
+# Labels whose id already has a uniqueness constraint (and so an index) from initialize_schema()
+_CONSTRAINED_LABELS = {"Document", "Person", "Organization", "Concept", "Place"}
+
 class Node:
     """Represents a node in a graph with associated properties."""
     
@@ -48,9 +123,49 @@ def _remove_backticks(text: str) -> str:
     return text.replace("`", "")
 
 
+def _storable_props(props: Any) -> Dict[str, Any]:
+    """
+    Coerce LLM-produced properties into values Neo4j can store.
+
+    Neo4j properties must be primitives or homogeneous lists of primitives; a
+    single nested map or mixed-type list would fail the whole UNWIND batch.
+    Such values are stored as JSON strings and nulls are dropped.
+
+    Args:
+        props: Property mapping from an extraction result
+
+    Returns:
+        Dict[str, Any]: Properties safe to SET on a node or relationship
+    """
+    if not isinstance(props, dict):
+        return {}
+    storable = {}
+    for key, value in props.items():
+        if value is None:
+            continue
+        if isinstance(value, (str, bool, int, float)):
+            storable[str(key)] = value
+        elif (isinstance(value, list)
+              and all(isinstance(item, (str, bool, int, float)) for item in value)
+              and len({type(item) for item in value}) <= 1):
+            storable[str(key)] = value
+        else:
+            storable[str(key)] = json.dumps(value, default=str)
+    return storable
+
+
 class GraphStore:
     """Neo4j-based knowledge graph store with support for multiple graphs."""
 
+    # Drivers are shared between instances so every GraphStore pointing at the
+    # same server reuses one Bolt connection pool
+    _drivers = {}
+    _drivers_lock = threading.Lock()
+
+    # Process-wide cache of list_graphs() results: uri -> (fetched_at, graphs)
+    _graph_list_cache = {}
+    _graph_list_cache_lock = threading.Lock()
+
     def __init__(self, graph_name=None):
         """
         Initialize the graph store.
@@ -66,8 +181,8 @@ class GraphStore:
         # Try to get credentials from CredentialsManager if not in environment
         if not all([self.uri, self.username, self.password]):
             try:
-                from config.credentials_manager import CredentialsManager
-                credentials_manager = CredentialsManager()
+                from config.credentials_manager import get_credentials_manager
+                credentials_manager = get_credentials_manager()
                 neo4j_credentials = credentials_manager.get_neo4j_credentials()
                 if neo4j_credentials:
                     self.uri = neo4j_credentials.get("uri", self.uri)
@@ -78,22 +193,73 @@ class GraphStore:
         
         # Set graph name (database)
         self.graph_name = graph_name or "neo4j"
+        # Labels whose id index has been ensured by _ensure_id_index()
+        self._indexed_labels = set()
         
         # Initialize Neo4j connection
         self._driver = None
         if all([self.uri, self.username, self.password]):
-            try:
-                self._driver = GraphDatabase.driver(
-                    self.uri, 
-                    auth=(self.username, self.password)
-                )
+            self._driver = self._get_shared_driver(self.uri, self.username, self.password)
+            if self._driver:
                 logger.info(f"Connected to Neo4j graph: {self.graph_name}")
-            except Exception as e:
-                logger.error(f"Failed to connect to Neo4j: {e}")
-                self._driver = None
         else:
             logger.warning("Neo4j credentials not configured")
 
+    @classmethod
+    def _get_shared_driver(cls, uri, username, password):
+        """
+        Get or create the driver shared by all stores for a server and user.
+
+        Args:
+            uri: Neo4j connection URI
+            username: Neo4j username
+            password: Neo4j password
+
+        Returns:
+            The shared Neo4j driver, or None if it could not be created
+        """
+        # Key on a password digest so the plaintext isn't kept in a long-lived dict
+        key = (uri, username, hashlib.sha256(password.encode()).hexdigest())
+        with cls._drivers_lock:
+            driver = cls._drivers.get(key)
+            if driver is None:
+                try:
+                    driver = GraphDatabase.driver(uri, auth=(username, password))
+                except Exception as e:
+                    logger.error(f"Failed to connect to Neo4j: {e}")
+                    return None
+                cls._drivers[key] = driver
+            return driver
+
+    @classmethod
+    def clear_graph_list_cache(cls) -> None:
+        """Drop cached graph listings, e.g. after a graph is created or deleted."""
+        with cls._graph_list_cache_lock:
+            cls._graph_list_cache.clear()
+
+    @classmethod
+    def close_shared_drivers(cls) -> None:
+        """Close every shared Neo4j driver and release its connection pool."""
+        with cls._drivers_lock:
+            for driver in cls._drivers.values():
+                try:
+                    driver.close()
+                except Exception as e:
+                    logger.warning(f"Error closing Neo4j driver: {e}")
+            cls._drivers.clear()
+
+    def use_graph(self, name: str) -> None:
+        """
+        Point this store at another graph without reconnecting.
+
+        Args:
+            name: Name of the graph to use
+        """
+        self.graph_name = name or "neo4j"
+        # Indexes are per database, so the new graph needs its own
+        self._indexed_labels = set()
+        logger.debug(f"Switched to Neo4j graph: {self.graph_name}")
+
     def test_connection(self) -> bool:
         """Test the connection to the Neo4j database."""
         if not self._driver:
@@ -132,6 +298,75 @@ class GraphStore:
             logger.error(f"Failed to execute query: {e}")
             return []
 
+    def _write_batches(self, query: str, rows: List[Dict[str, Any]], batch_size: int = GRAPH_WRITE_BATCH_SIZE,
+                       failed_rows: Optional[List[Dict[str, Any]]] = None) -> int:
+        """Run an UNWIND $rows write query over rows in chunks, one transaction per chunk.
+
+        execute_write retries transient failures such as deadlocks on its own. If
+        a chunk still fails, its rows are retried one at a time so a single bad
+        row doesn't cost the rest of the chunk.
+
+        Args:
+            query (str): Cypher query reading its input from $rows.
+            rows (List[Dict[str, Any]]): Row parameters.
+            batch_size (int): Rows per transaction.
+            failed_rows (List[Dict[str, Any]], optional): Rows that could not be
+                written are appended here.
+
+        Returns:
+            int: Number of rows written.
+        """
+        if not self._driver:
+            logger.error("Neo4j connection not available")
+            if failed_rows is not None:
+                failed_rows.extend(rows)
+            return 0
+
+        written = 0
+        with self._driver.session(database=self.graph_name) as session:
+            for start in range(0, len(rows), batch_size):
+                chunk = rows[start:start + batch_size]
+                try:
+                    session.execute_write(lambda tx: tx.run(query, rows=chunk).consume())
+                    written += len(chunk)
+                    continue
+                except Exception as e:
+                    if len(chunk) == 1:
+                        logger.error(f"Failed to write row: {e}")
+                        if failed_rows is not None:
+                            failed_rows.extend(chunk)
+                        continue
+                    logger.warning(f"Failed to write batch of {len(chunk)} rows, retrying row by row: {e}")
+                failed = 0
+                for row in chunk:
+                    try:
+                        session.execute_write(lambda tx: tx.run(query, rows=[row]).consume())
+                        written += 1
+                    except Exception as e:
+                        failed += 1
+                        if failed_rows is not None:
+                            failed_rows.append(row)
+                        logger.debug(f"Failed to write row {row.get('id', '')}: {e}")
+                if failed:
+                    logger.error(f"Dropped {failed} of {len(chunk)} rows that could not be written")
+        return written
+
+    def _ensure_id_index(self, label: str) -> None:
+        """Create an index on label.id once per store so batched MERGEs don't scan the label."""
+        if label in _CONSTRAINED_LABELS or label in self._indexed_labels:
+            return
+        if not self._driver:
+            return
+        # query() swallows errors, so run this directly and only remember the
+        # label once the index exists; a failure is retried on the next write
+        try:
+            with self._driver.session(database=self.graph_name) as session:
+                session.run(f"CREATE INDEX {label.lower()}_id IF NOT EXISTS FOR (n:{label}) ON (n.id)").consume()
+        except Exception as e:
+            logger.warning(f"Failed to create id index for {label}: {e}")
+            return
+        self._indexed_labels.add(label)
+
     def initialize_schema(self) -> bool:
         """Initialize the graph schema with necessary constraints and indexes."""
         if not self._driver:
@@ -170,6 +405,13 @@ class GraphStore:
             # Execute all schema setup queries
             for query in schema_queries:
                 self.query(query)
+
+            # Index every entity label's id up front so the first batched MERGE
+            # is already an index lookup rather than a label scan
+            for label in ENTITY_TYPES:
+                self._ensure_id_index(label)
+            # The graph metadata node may have just been created
+            GraphStore.clear_graph_list_cache()
             
             logger.info(f"Knowledge graph schema initialized for {self.graph_name}")
             return True
@@ -224,12 +466,28 @@ class GraphStore:
             logger.error(f"Failed to get graph statistics: {e}")
             return {}
     
-    def list_graphs(self) -> List[Dict[str, Any]]:
-        """List all available knowledge graphs."""
+    def list_graphs(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """List all available knowledge graphs.
+
+        Results are reused for GRAPH_LIST_CACHE_TTL seconds across stores.
+
+        Args:
+            refresh (bool): Query Neo4j even if a cached listing is available.
+
+        Returns:
+            List[Dict[str, Any]]: Graph names, descriptions and timestamps.
+        """
         if not self._driver:
             logger.error("Neo4j connection not available")
             return []
         
+        if not refresh:
+            with GraphStore._graph_list_cache_lock:
+                cached = GraphStore._graph_list_cache.get(self.uri)
+            if cached and time.monotonic() - cached[0] < GRAPH_LIST_CACHE_TTL:
+                logger.debug("Using cached knowledge graph list")
+                return [dict(graph) for graph in cached[1]]
+        
         try:
             # Query for all knowledge graphs
             graphs_query = """
@@ -250,7 +508,9 @@ class GraphStore:
                 if "updated_at" in graph and graph["updated_at"]:
                     graph["updated_at"] = graph["updated_at"].isoformat()
             
-            return result
+            with GraphStore._graph_list_cache_lock:
+                GraphStore._graph_list_cache[self.uri] = (time.monotonic(), result)
+            return [dict(graph) for graph in result]
             
         except Exception as e:
             logger.error(f"Failed to list graphs: {e}")
@@ -284,6 +544,7 @@ class GraphStore:
             result = self.query(create_query, {"description": description or f"Knowledge graph: {name}"})
             
             if result and result[0].get("name") == name:
+                GraphStore.clear_graph_list_cache()
                 logger.info(f"Created knowledge graph: {name}")
                 return True
             else:
@@ -317,6 +578,7 @@ class GraphStore:
             """
             
             self.query(delete_query)
+            GraphStore.clear_graph_list_cache()
             logger.info(f"Deleted knowledge graph: {name}")
             return True
                 
@@ -324,6 +586,86 @@ class GraphStore:
             logger.error(f"Failed to delete graph: {e}")
             return False
     
+    @staticmethod
+    def document_id(url: str) -> str:
+        """
+        Build a stable Document id from a page URL.
+        
+        Re-exporting the same page (a retried or resumed crawl) then MERGEs onto
+        the existing node instead of adding a duplicate.
+        
+        Args:
+            url: Page URL
+            
+        Returns:
+            str: "doc_" followed by the SHA-256 of the normalized URL
+        """
+        parts = urlsplit(urldefrag(url.strip())[0])
+        normalized = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", parts.query, ""))
+        return "doc_" + hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    
+    def add_documents(self, documents: List[Dict[str, Any]], batch_size: int = GRAPH_WRITE_BATCH_SIZE,
+                      update_existing: bool = True) -> List[str]:
+        """
+        Add many documents to the knowledge graph with one UNWIND query per batch.
+        
+        Defaults for missing properties are only applied to new nodes, so an
+        existing document keeps any property the caller didn't pass.
+        
+        Args:
+            documents: Dictionaries with document properties, as for add_document()
+            batch_size: Documents written per transaction
+            update_existing: Whether documents that already exist get the passed
+                properties; if False they are left untouched
+            
+        Returns:
+            List[Optional[str]]: Document IDs in input order, with None for each
+                document that could not be written; empty if Neo4j is unavailable
+        """
+        if not self._driver:
+            logger.error("Neo4j connection not available")
+            return []
+        
+        defaults = {
+            "url": "",
+            "title": "Untitled Document",
+            "content": "",
+            "description": "",
+            "fetched_at": datetime.now().isoformat(),
+        }
+        rows = [
+            {
+                "id": document_data.get("id", str(uuid.uuid4())),
+                "defaults": defaults,
+                "props": {key: document_data[key] for key in defaults if key in document_data},
+            }
+            for document_data in documents
+        ]
+        
+        on_match = """
+        ON MATCH SET d += row.props,
+                     d.updated_at = datetime()""" if update_existing else ""
+        create_query = f"""
+        UNWIND $rows AS row
+        MERGE (d:Document {{id: row.id}})
+        ON CREATE SET d += row.defaults,
+                      d += row.props,
+                      d.created_at = datetime(),
+                      d.graph_name = '{self.graph_name}'{on_match}
+        WITH d
+        MATCH (g:KnowledgeGraph {{name: '{self.graph_name}'}})
+        MERGE (g)-[:CONTAINS]->(d)
+        """
+        
+        failed_rows = []
+        written = self._write_batches(create_query, rows, batch_size, failed_rows)
+        if failed_rows:
+            logger.error(f"Added {written} of {len(rows)} documents to graph {self.graph_name}")
+        else:
+            logger.info(f"Added {written} documents to graph {self.graph_name}")
+        failed = {id(row) for row in failed_rows}
+        return [None if id(row) in failed else row["id"] for row in rows]
+    
     def add_document(self, document_data: Dict[str, Any]) -> Optional[str]:
         """
         Add a document to the knowledge graph.
@@ -411,19 +753,7 @@ class GraphStore:
             )
             
             # Define allowed node types and relationships
-            allowed_nodes = [
-                "Person", 
-                "Organization", 
-                "Concept", 
-                "Event", 
-                "Location", 
-                "Date", 
-                "Topic",
-                "Product",
-                "Technology", 
-                "Law", 
-                "Regulation"
-            ]
+            allowed_nodes = ENTITY_TYPES
             
             allowed_relationships = [
                 # Person relationships
@@ -457,7 +787,18 @@ class GraphStore:
                 ("Document", "REFERENCES", "Document")
             ]
 
-            # Process each document to extract entities
+            # Entity rows keyed by label and relationship rows keyed by
+            # (source label, type, target label), flushed with UNWIND at the end
+            staged_documents = []
+            entity_rows = {}
+            relationship_rows = {}
+
+            # The instructions are identical for every document, so they are
+            # built once and sent as a shared system message
+            system_message = SystemMessage(content=ENTITY_EXTRACTION_PREAMBLE.format(allowed_nodes=allowed_nodes))
+
+            # Build one extraction request per non-empty document
+            pending = []
             for doc in documents:
                 doc_id = doc.get("id", str(uuid.uuid4()))
                 doc_content = doc.get("content", "")
@@ -467,51 +808,25 @@ class GraphStore:
                 if not doc_content:
                     continue
 
-                # Extract entities and relationships using LLM
-                prompt = f"""
-                Extract entities and relationships from the following document:
-                
-                Title: {doc_title}
-                
-                Content:
-                {doc_content[:4000]}  # Limit content size
-                
-                Return ONLY a JSON structure with no explanations:
-                
-                {{
-                    "entities": [
-                        {{
-                            "id": "unique-id-1",
-                            "type": "Person|Organization|Concept|...",
-                            "name": "Entity name",
-                            "properties": {{
-                                "property1": "value1",
-                                "property2": "value2"
-                            }}
-                        }},
-                        ...
-                    ],
-                    "relationships": [
-                        {{
-                            "source_id": "unique-id-1",
-                            "target_id": "unique-id-2",
-                            "type": "RELATIONSHIP_TYPE",
-                            "properties": {{
-                                "property1": "value1",
-                                "property2": "value2"
-                            }}
-                        }},
-                        ...
-                    ]
-                }}
-                
-                Entity types must be one of: {allowed_nodes}
-                """
-                
+                # Limit content size
+                prompt = f"Title: {doc_title}\n\nContent:\n{doc_content[:4000]}"
+                pending.append((doc, doc_id, [system_message, HumanMessage(content=prompt)]))
+
+            # LLM calls are network-bound, so overlap up to LLM_CONCURRENCY of them
+            def invoke(messages):
+                try:
+                    return llm.invoke(messages).content
+                except Exception as e:
+                    return e
+
+            with ThreadPoolExecutor(max_workers=LLM_CONCURRENCY) as executor:
+                responses = list(executor.map(invoke, [messages for _, _, messages in pending]))
+
+            # Process each document's extraction in input order
+            for (doc, doc_id, _), extraction_text in zip(pending, responses):
                 try:
-                    # Call LLM to extract entities
-                    response = llm.invoke(prompt)
-                    extraction_text = response.content
+                    if isinstance(extraction_text, Exception):
+                        raise extraction_text
                     
                     # Extract JSON part from the response
                     start_idx = extraction_text.find('{')
@@ -523,10 +838,11 @@ class GraphStore:
                         logger.error(f"Could not extract JSON from LLM response for document {doc_id}")
                         continue
                     
-                    # Create document node
-                    self.add_document(doc)
+                    # Stage the document node under the same id its entities link to
+                    staged_documents.append({**doc, "id": doc_id})
                     
-                    # Create entity nodes
+                    # Stage entity nodes by label; they are written in batches once all documents are read
+                    entity_labels = {}
                     for entity in extraction.get("entities", []):
                         entity_id = entity.get("id", str(uuid.uuid4()))
                         entity_type = entity.get("type")
@@ -535,41 +851,14 @@ class GraphStore:
                         if entity_type not in allowed_nodes:
                             continue
                         
-                        # Create entity node
-                        create_entity_query = f"""
-                        MERGE (e:{entity_type} {{id: $id}})
-                        ON CREATE SET e.created_at = datetime(),
-                                    e.graph_name = '{self.graph_name}',
-                                    e.name = $name
-                        ON MATCH SET e.updated_at = datetime(),
-                                   e.name = $name
-                        
-                        WITH e
-                        
-                        MATCH (d:Document {{id: $doc_id}})
-                        MERGE (d)-[:MENTIONS]->(e)
-                        
-                        RETURN e.id as id
-                        """
-                        
-                        entity_params = {
-                            "id": entity_id,
-                            "name": entity.get("name", f"Unnamed {entity_type}"),
-                            "doc_id": doc_id
-                        }
-                        
-                        # Add properties
-                        for prop_key, prop_value in entity.get("properties", {}).items():
-                            entity_params[prop_key] = prop_value
-                            create_entity_query = create_entity_query.replace(
-                                "ON CREATE SET", f"ON CREATE SET e.{prop_key} = ${prop_key},")
-                            create_entity_query = create_entity_query.replace(
-                                "ON MATCH SET", f"ON MATCH SET e.{prop_key} = ${prop_key},")
-                        
-                        # Create entity
-                        self.query(create_entity_query, entity_params)
+                        props = _storable_props(entity.get("properties"))
+                        props["name"] = str(entity.get("name") or f"Unnamed {entity_type}")
+                        entity_rows.setdefault(entity_type, []).append(
+                            {"id": entity_id, "doc_id": doc_id, "props": props}
+                        )
+                        entity_labels[entity_id] = entity_type
                     
-                    # Create relationships
+                    # Stage relationships by (source label, type, target label)
                     for rel in extraction.get("relationships", []):
                         source_id = rel.get("source_id")
                         target_id = rel.get("target_id")
@@ -579,41 +868,127 @@ class GraphStore:
                         if not source_id or not target_id:
                             continue
                         
-                        # Create relationship
-                        create_rel_query = f"""
-                        MATCH (source {{id: $source_id}})
-                        MATCH (target {{id: $target_id}})
-                        MERGE (source)-[r:{rel_type}]->(target)
-                        
-                        ON CREATE SET r.created_at = datetime()
-                        
-                        RETURN type(r) as type
-                        """
-                        
-                        rel_params = {
+                        key = (entity_labels.get(source_id), rel_type, entity_labels.get(target_id))
+                        relationship_rows.setdefault(key, []).append({
                             "source_id": source_id,
-                            "target_id": target_id
-                        }
-                        
-                        # Add properties
-                        for prop_key, prop_value in rel.get("properties", {}).items():
-                            rel_params[prop_key] = prop_value
-                            create_rel_query = create_rel_query.replace(
-                                "ON CREATE SET", f"ON CREATE SET r.{prop_key} = ${prop_key},")
-                        
-                        # Create relationship
-                        self.query(create_rel_query, rel_params)
+                            "target_id": target_id,
+                            "props": _storable_props(rel.get("properties")),
+                        })
                     
                 except Exception as e:
                     logger.error(f"Failed to extract entities from document {doc_id}: {e}")
                     continue
             
+            # Documents first so MENTIONS can match them, then entities before their
+            # relationships; pages already exported keep the data written at crawl time
+            if staged_documents:
+                self.add_documents(staged_documents, update_existing=False)
+            self._write_entities(entity_rows)
+            self._write_relationships(relationship_rows)
             return True
                 
         except Exception as e:
             logger.error(f"Failed to extract entities: {e}")
             return False
     
+    def bulk_load(self, nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]] = None,
+                  batch_size: int = GRAPH_WRITE_BATCH_SIZE) -> Dict[str, int]:
+        """
+        Load nodes and relationships with raw UNWIND Cypher, bypassing per-entity calls.
+        
+        Nodes are merged on id (an index is ensured per label first) and tagged
+        with this graph's name; relationships are merged between nodes matched by
+        id. Every batch of rows is written in one transaction.
+        
+        Args:
+            nodes: Groups like {"label": "Person", "rows": [{"id": ..., "props": {...}}]}
+            edges: Groups like {"type": "MENTIONS", "source_label": "Document",
+                   "target_label": "Person", "rows": [{"src": ..., "dst": ..., "props": {...}}]};
+                   the labels are optional but let Neo4j use the id indexes
+            batch_size: Rows written per transaction
+            
+        Returns:
+            Dict[str, int]: Number of node and relationship rows written
+        """
+        written = {"nodes": 0, "relationships": 0}
+        if not self._driver:
+            logger.error("Neo4j connection not available")
+            return written
+        
+        for group in nodes:
+            label = _remove_backticks(group["label"])
+            self._ensure_id_index(label)
+            node_query = f"""
+            UNWIND $rows AS row
+            MERGE (n:`{label}` {{id: row.id}})
+            ON CREATE SET n += row.props,
+                          n.created_at = datetime(),
+                          n.graph_name = '{self.graph_name}'
+            ON MATCH SET n += row.props,
+                         n.updated_at = datetime()
+            """
+            rows = [{"id": row["id"], "props": row.get("props", {})} for row in group["rows"]]
+            written["nodes"] += self._write_batches(node_query, rows, batch_size)
+        
+        for group in edges or []:
+            rel_type = _remove_backticks(group["type"])
+            source_label = group.get("source_label")
+            target_label = group.get("target_label")
+            source_pattern = f"source:`{_remove_backticks(source_label)}`" if source_label else "source"
+            target_pattern = f"target:`{_remove_backticks(target_label)}`" if target_label else "target"
+            edge_query = f"""
+            UNWIND $rows AS row
+            MATCH ({source_pattern} {{id: row.src}})
+            MATCH ({target_pattern} {{id: row.dst}})
+            MERGE (source)-[r:`{rel_type}`]->(target)
+            ON CREATE SET r += row.props,
+                          r.created_at = datetime()
+            """
+            rows = [
+                {"src": row["src"], "dst": row["dst"], "props": row.get("props", {})}
+                for row in group["rows"]
+            ]
+            written["relationships"] += self._write_batches(edge_query, rows, batch_size)
+        
+        logger.info(
+            f"Bulk loaded {written['nodes']} nodes and {written['relationships']} "
+            f"relationships into graph {self.graph_name}"
+        )
+        return written
+
+    def _write_entities(self, entity_rows: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Write staged entities and their MENTIONS links, one UNWIND query per label and batch."""
+        for entity_type, rows in entity_rows.items():
+            self._ensure_id_index(entity_type)
+            create_entity_query = f"""
+            UNWIND $rows AS row
+            MERGE (e:{entity_type} {{id: row.id}})
+            ON CREATE SET e += row.props,
+                          e.created_at = datetime(),
+                          e.graph_name = '{self.graph_name}'
+            ON MATCH SET e += row.props,
+                         e.updated_at = datetime()
+            WITH e, row
+            MATCH (d:Document {{id: row.doc_id}})
+            MERGE (d)-[:MENTIONS]->(e)
+            """
+            self._write_batches(create_entity_query, rows)
+
+    def _write_relationships(self, relationship_rows: Dict[Tuple[Optional[str], str, Optional[str]], List[Dict[str, Any]]]) -> None:
+        """Write staged relationships, matching endpoints by label where the label is known."""
+        for (source_label, rel_type, target_label), rows in relationship_rows.items():
+            source_pattern = f"source:{source_label}" if source_label else "source"
+            target_pattern = f"target:{target_label}" if target_label else "target"
+            create_rel_query = f"""
+            UNWIND $rows AS row
+            MATCH ({source_pattern} {{id: row.source_id}})
+            MATCH ({target_pattern} {{id: row.target_id}})
+            MERGE (source)-[r:{rel_type}]->(target)
+            ON CREATE SET r += row.props,
+                          r.created_at = datetime()
+            """
+            self._write_batches(create_rel_query, rows)
+
     def search_documents(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Search for documents in the knowledge graph.
@@ -872,10 +1247,12 @@ class GraphStore:
             return []
     
     def close(self) -> None:
-        """Close the Neo4j driver connection."""
-        if self._driver:
-            self._driver.close()
-            self._driver = None
+        """Release this store's handle on the shared Neo4j driver.
+
+        The driver itself stays open for other stores; use
+        close_shared_drivers() to shut down the connection pools.
+        """
+        self._driver = None
 
     def __enter__(self):
         return self
@@ -884,4 +1261,71 @@ class GraphStore:
         self.close()
     
     def __del__(self):
-        self.close()
\ No newline at end of file
+        self.close()
+
+
+class GraphDocumentWriter:
+    """Writes documents to a GraphStore from a background thread.
+
+    Producers hand documents to add(); they are grouped into batches and
+    written by a single writer thread, so a crawl keeps fetching while Neo4j
+    commits earlier batches. The bounded queue blocks add() if the writer
+    falls behind, which keeps memory use bounded. A failed batch is logged and
+    counted in `failed`; the writer keeps draining the queue so add() never
+    blocks on a dead thread.
+    """
+
+    def __init__(self, graph_store: GraphStore, batch_size: int = GRAPH_EXPORT_BATCH_SIZE,
+                 max_pending: int = GRAPH_EXPORT_QUEUE_SIZE):
+        self.graph_store = graph_store
+        self.batch_size = batch_size
+        self.written = 0
+        self.failed = 0
+        self._buffer = []
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            try:
+                written = sum(1 for doc_id in self.graph_store.add_documents(batch) if doc_id)
+            except Exception as e:
+                logger.error(f"Error writing {len(batch)} documents to the knowledge graph: {e}")
+                written = 0
+            # add_documents() logs its own errors and returns None for each row it couldn't write
+            self.written += written
+            self.failed += len(batch) - written
+
+    def add(self, document: Dict[str, Any]) -> None:
+        """Queue a document, handing a full batch to the writer thread."""
+        self._buffer.append(document)
+        if len(self._buffer) >= self.batch_size:
+            self._queue.put(self._buffer)
+            self._buffer = []
+
+    def close(self) -> int:
+        """
+        Flush remaining documents and wait for the writer thread to finish.
+        
+        Returns:
+            int: Number of documents written
+        """
+        if not self._closed:
+            self._closed = True
+            if self._buffer:
+                self._queue.put(self._buffer)
+                self._buffer = []
+            self._queue.put(None)
+            self._thread.join()
+            if self.failed:
+                logger.error(f"{self.failed} documents could not be written to the knowledge graph")
+        return self.written
+
+
+# Close pooled Bolt connections cleanly when the process exits
+atexit.register(GraphStore.close_shared_drivers)
@@ -1,11 +1,15 @@
 import logging
 import hashlib
+import re
 import json
 from pathlib import Path
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Repository name in a GitHub URL
+_GITHUB_REPO_RE = re.compile(r'github\.com/[^/]+/([^/]+)')
+
 
 class MetadataGenerator:
     """Generate metadata for datasets and files."""
@@ -19,8 +23,7 @@ class MetadataGenerator:
             if "github.com" in source_info.lower():
                 source_type = "repository"
                 # Extract repository name from URL (last part after the last /)
-                import re
-                repo_match = re.search(r'github\.com/[^/]+/([^/]+)', source_info)
+                repo_match = _GITHUB_REPO_RE.search(source_info)
                 if repo_match:
                     source_name = repo_match.group(1)
                 else:
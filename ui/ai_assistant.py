@@ -23,7 +23,7 @@ from textual import work
 from utils.llm_client import LLMClient
 from ai.assistant import generate_ai_response
 from ai.agent import run_agent
-from config.credentials_manager import CredentialsManager
+from config.credentials_manager import get_credentials_manager
 
 # Setup logger
 logger = logging.getLogger(__name__)
@@ -130,7 +130,7 @@ class AIAssistantApp(App):
         """Generate a response in the background."""
         try:
             # Initialize credentials manager
-            credentials_manager = CredentialsManager()
+            credentials_manager = get_credentials_manager()
             
             # Generate response
             response = await generate_ai_response(query, credentials_manager)
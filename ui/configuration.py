@@ -1,7 +1,7 @@
+import asyncio
 import logging
-from config.credentials_manager import CredentialsManager
-from huggingface.dataset_manager import DatasetManager
-from neo4j.graph_store import GraphStore
+from itertools import islice
+from config.credentials_manager import get_credentials_manager
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import (
@@ -20,6 +20,9 @@ from textual.widgets import (
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of knowledge graphs rendered in a single listing
+GRAPH_LIST_PAGE_SIZE = 20
+
 class ConfigurationApp(App):
     CSS_PATH = "tui_app.css"
 
@@ -52,6 +55,18 @@ class ConfigurationApp(App):
             )
         )
 
+    def on_mount(self) -> None:
+        # Look the output list up once instead of on every message
+        self._config_list = self.query_one("#config_list", ListView)
+
+    def _log(self, message):
+        """Append a line to the configuration list."""
+        self._config_list.append(Label(message))
+
+    def _log_lines(self, lines):
+        """Append several lines to the configuration list in a single mount."""
+        return self._config_list.extend(Label(line) for line in lines)
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "setup_wizard":
             await self.run_setup_wizard()
@@ -77,11 +92,10 @@ class ConfigurationApp(App):
     config_values = {}
     
     async def run_setup_wizard(self):
-        self.query_one(ListView).append(Label("Running Setup Wizard..."))
-        self.query_one(ListView).append(Label("Enter your credentials in the fields below:"))
+        self._log_lines(["Running Setup Wizard...", "Enter your credentials in the fields below:"])
         
         # Initialize credentials manager
-        self.credentials_manager = CredentialsManager()
+        self.credentials_manager = get_credentials_manager()
         
         # Start the wizard
         self.current_config = "setup_wizard"
@@ -116,7 +130,7 @@ class ConfigurationApp(App):
             else:
                 display_value = value
                 
-            self.query_one(ListView).append(Label(f"Set {step_name}: {display_value}"))
+            self._log(f"Set {step_name}: {display_value}")
             
             # Move to next step
             self.current_config_step += 1
@@ -132,20 +146,20 @@ class ConfigurationApp(App):
         elif self.current_config == "server_config":
             if self.current_config_step == 0:  # Server port
                 self.credentials_manager.save_server_port(value)
-                self.query_one(ListView).append(Label(f"Server port updated to: {value}"))
+                self._log(f"Server port updated to: {value}")
                 
                 # Move to next step (temp directory)
                 self.current_config_step += 1
                 await self._show_config_prompt("temporary directory path")
             elif self.current_config_step == 1:  # Temp directory
                 self.credentials_manager.save_temp_dir(value)
-                self.query_one(ListView).append(Label(f"Temporary directory updated to: {value}"))
+                self._log(f"Temporary directory updated to: {value}")
                 
                 # We're done
                 input_container = self.query_one("#input_container")
                 input_container.add_class("hide")
                 self.current_config = None
-                self.query_one(ListView).append(Label("Server configuration completed."))
+                self._log("Server configuration completed.")
     
     async def _save_wizard_config(self):
         """Save all wizard configuration values."""
@@ -158,7 +172,7 @@ class ConfigurationApp(App):
                 self.config_values.get("hf_username", ""),
                 self.config_values.get("hf_token", "")
             )
-            self.query_one(ListView).append(Label("HuggingFace credentials saved."))
+            self._log("HuggingFace credentials saved.")
             
             # Save AWS credentials
             self.credentials_manager.save_aws_credentials(
@@ -166,7 +180,7 @@ class ConfigurationApp(App):
                 self.config_values.get("aws_secret_key", ""),
                 self.config_values.get("aws_region", "us-east-1")
             )
-            self.query_one(ListView).append(Label("AWS credentials saved."))
+            self._log("AWS credentials saved.")
             
             # Save Neo4j credentials
             self.credentials_manager.save_neo4j_credentials(
@@ -174,65 +188,68 @@ class ConfigurationApp(App):
                 self.config_values.get("neo4j_username", ""),
                 self.config_values.get("neo4j_password", "")
             )
-            self.query_one(ListView).append(Label("Neo4j credentials saved."))
+            self._log("Neo4j credentials saved.")
             
             # Save GitHub token
             self.credentials_manager.save_github_token(self.config_values.get("github_token", ""))
-            self.query_one(ListView).append(Label("GitHub token saved."))
+            self._log("GitHub token saved.")
             
-            self.query_one(ListView).append(Label("Setup Wizard completed."))
+            self._log("Setup Wizard completed.")
         except Exception as e:
-            self.query_one(ListView).append(Label(f"Error saving configuration: {e}"))
+            self._log(f"Error saving configuration: {e}")
         
         # Reset wizard state
         self.current_config = None
 
     async def api_credentials(self):
-        self.query_one(ListView).append(Label("Managing API Credentials..."))
+        self._log("Managing API Credentials...")
 
         # Initialize credentials manager
-        credentials_manager = CredentialsManager()
+        credentials_manager = get_credentials_manager()
+        lines = []
 
         # HuggingFace credentials
         hf_username, hf_token = credentials_manager.get_huggingface_credentials()
-        self.query_one(ListView).append(Label(f"HuggingFace Username: {hf_username}"))
-        self.query_one(ListView).append(Label(f"HuggingFace Token: {'*' * len(hf_token) if hf_token else 'Not Set'}"))
+        lines.append(f"HuggingFace Username: {hf_username}")
+        lines.append(f"HuggingFace Token: {'*' * len(hf_token) if hf_token else 'Not Set'}")
 
         # AWS credentials
         aws_credentials = credentials_manager.get_aws_credentials()
         if aws_credentials:
-            self.query_one(ListView).append(Label(f"AWS Access Key: {'*' * 8 + aws_credentials.get('access_key', '')[-4:] if aws_credentials.get('access_key') else 'Not Set'}"))
-            self.query_one(ListView).append(Label(f"AWS Secret Key: {'*' * 12 if aws_credentials.get('secret_key') else 'Not Set'}"))
-            self.query_one(ListView).append(Label(f"AWS Region: {aws_credentials.get('region', 'us-east-1')}"))
+            lines.append(f"AWS Access Key: {'*' * 8 + aws_credentials.get('access_key', '')[-4:] if aws_credentials.get('access_key') else 'Not Set'}")
+            lines.append(f"AWS Secret Key: {'*' * 12 if aws_credentials.get('secret_key') else 'Not Set'}")
+            lines.append(f"AWS Region: {aws_credentials.get('region', 'us-east-1')}")
         else:
-            self.query_one(ListView).append(Label("AWS Credentials: Not Set"))
+            lines.append("AWS Credentials: Not Set")
         
         # Neo4j credentials
         neo4j_credentials = credentials_manager.get_neo4j_credentials()
         if neo4j_credentials:
-            self.query_one(ListView).append(Label(f"Neo4j URI: {neo4j_credentials.get('uri', 'Not Set')}"))
-            self.query_one(ListView).append(Label(f"Neo4j Username: {neo4j_credentials.get('username', 'Not Set')}"))
-            self.query_one(ListView).append(Label(f"Neo4j Password: {'*' * len(neo4j_credentials.get('password', '')) if neo4j_credentials.get('password') else 'Not Set'}"))
+            lines.append(f"Neo4j URI: {neo4j_credentials.get('uri', 'Not Set')}")
+            lines.append(f"Neo4j Username: {neo4j_credentials.get('username', 'Not Set')}")
+            lines.append(f"Neo4j Password: {'*' * len(neo4j_credentials.get('password', '')) if neo4j_credentials.get('password') else 'Not Set'}")
         else:
-            self.query_one(ListView).append(Label("Neo4j Credentials: Not Set"))
+            lines.append("Neo4j Credentials: Not Set")
 
         # GitHub token
         github_token = credentials_manager.get_github_token()
-        self.query_one(ListView).append(Label(f"GitHub Token: {'*' * len(github_token) if github_token else 'Not Set'}"))
+        lines.append(f"GitHub Token: {'*' * len(github_token) if github_token else 'Not Set'}")
+
+        self._log_lines(lines)
 
     async def server_config(self):
-        self.query_one(ListView).append(Label("Configuring Server & Datasets..."))
+        self._log("Configuring Server & Datasets...")
 
         # Initialize credentials manager
-        self.credentials_manager = CredentialsManager()
+        self.credentials_manager = get_credentials_manager()
 
         # Server port
         server_port = self.credentials_manager.get_server_port()
-        self.query_one(ListView).append(Label(f"Current Server Port: {server_port}"))
+        self._log(f"Current Server Port: {server_port}")
         
         # Temporary directory
         temp_dir = self.credentials_manager.get_temp_dir()
-        self.query_one(ListView).append(Label(f"Current Temporary Directory: {temp_dir}"))
+        self._log(f"Current Temporary Directory: {temp_dir}")
         
         # Setup for server config input
         self.current_config = "server_config"
@@ -242,31 +259,40 @@ class ConfigurationApp(App):
         await self._show_config_prompt(f"new server port (current: {server_port})")
 
     async def kg_config(self):
-        self.query_one(ListView).append(Label("Configuring Knowledge Graph..."))
+        self._log("Configuring Knowledge Graph...")
+
+        # Imported here so the other configuration pages don't load the Neo4j driver
+        from neo4j.graph_store import GraphStore
 
+        # Neo4j calls block on the network, so they run off the event loop
         # Initialize graph store
-        graph_store = GraphStore()
+        graph_store = await asyncio.to_thread(GraphStore)
 
         # Test connection
-        if graph_store.test_connection():
-            self.query_one(ListView).append(Label("Connected to Neo4j successfully."))
+        if await asyncio.to_thread(graph_store.test_connection):
+            self._log("Connected to Neo4j successfully.")
         else:
-            self.query_one(ListView).append(Label("Failed to connect to Neo4j."))
+            self._log("Failed to connect to Neo4j.")
 
         # Initialize schema
-        if graph_store.initialize_schema():
-            self.query_one(ListView).append(Label("Knowledge graph schema initialized."))
+        if await asyncio.to_thread(graph_store.initialize_schema):
+            self._log("Knowledge graph schema initialized.")
         else:
-            self.query_one(ListView).append(Label("Failed to initialize knowledge graph schema."))
+            self._log("Failed to initialize knowledge graph schema.")
 
         # List graphs
-        graphs = graph_store.list_graphs()
+        graphs = await asyncio.to_thread(graph_store.list_graphs)
         if graphs:
-            self.query_one(ListView).append(Label("Available Knowledge Graphs:"))
-            for graph in graphs:
-                self.query_one(ListView).append(Label(f"- {graph['name']} (Created: {graph['created_at']}, Updated: {graph['updated_at']})"))
+            lines = ["Available Knowledge Graphs:"]
+            lines.extend(
+                f"- {graph['name']} (Created: {graph['created_at']}, Updated: {graph['updated_at']})"
+                for graph in islice(graphs, GRAPH_LIST_PAGE_SIZE)
+            )
+            if len(graphs) > GRAPH_LIST_PAGE_SIZE:
+                lines.append(f"... and {len(graphs) - GRAPH_LIST_PAGE_SIZE} more")
+            self._log_lines(lines)
         else:
-            self.query_one(ListView).append(Label("No knowledge graphs found."))
+            self._log("No knowledge graphs found.")
 
 def configuration():
     app = ConfigurationApp()
@@ -1,9 +1,10 @@
+import asyncio
 import logging
-from config.credentials_manager import CredentialsManager
+from config.credentials_manager import get_credentials_manager
 from github.client import GitHubClient
 from github.content_fetcher import ContentFetcher
 from huggingface.dataset_creator import DatasetCreator
-from neo4j.graph_store import GraphStore
+from utils.http_session import get_session
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import (
@@ -22,6 +23,10 @@ logger = logging.getLogger(__name__)
 class GitHubDatasetApp(App):
     CSS_PATH = "tui_app.css"
 
+    def __init__(self, *args, credentials_manager=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.credentials_manager = credentials_manager or get_credentials_manager()
+
     def compose(self) -> ComposeResult:
         yield Header()
         yield Footer()
@@ -42,41 +47,65 @@ class GitHubDatasetApp(App):
             )
         )
 
+    def on_mount(self) -> None:
+        # Look widgets up once instead of walking the DOM on every update
+        self._status_list = self.query_one("#status_list", ListView)
+        self._repo_input = self.query_one(TextInput)
+
+    def _log(self, message: str) -> None:
+        """Append a status line to the status list."""
+        self._status_list.append(Label(message))
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "submit_button":
-            repo_url = self.query_one(TextInput).value
+            repo_url = self._repo_input.value
             await self.create_github_dataset(repo_url)
 
     async def create_github_dataset(self, repo_url: str) -> None:
         if not repo_url.startswith("https://github.com/"):
-            self.query_one(ListView).append(Label("Invalid GitHub repository URL. Must start with 'https://github.com/'"))
+            self._log("Invalid GitHub repository URL. Must start with 'https://github.com/'")
             return
 
-        self.query_one(ListView).append(Label(f"Fetching GitHub repository: {repo_url}"))
+        self._log(f"Fetching GitHub repository: {repo_url}")
 
         try:
-            credentials_manager = CredentialsManager()
+            credentials_manager = self.credentials_manager
             _, huggingface_token = credentials_manager.get_huggingface_credentials()
             if not huggingface_token:
-                self.query_one(ListView).append(Label("Error: HuggingFace token not found. Please set your credentials first."))
+                self._log("Error: HuggingFace token not found. Please set your credentials first.")
                 return
 
-            dataset_creator = DatasetCreator(huggingface_token=huggingface_token)
+            session = get_session()
+            dataset_creator = DatasetCreator(huggingface_token=huggingface_token, session=session)
+            # Reject a bad token now rather than after the whole repository is fetched
+            if not await asyncio.to_thread(dataset_creator.validate_token):
+                self._log("Error: HuggingFace token was rejected. Please update your credentials.")
+                return
 
-            def progress_callback(percent, message=None):
-                if percent % 10 == 0 or percent == 100:
-                    status = f"Progress: {percent:.0f}%"
-                    if message:
-                        status += f" - {message}"
-                    self.query_one(ListView).append(Label(status))
+            # Report once per 10% bucket; float percentages rarely land exactly on a multiple of 10
+            last_bucket = [-1]
 
-            # Get GitHub token
-            github_token = credentials_manager.get_github_token()
-            content_fetcher = ContentFetcher(github_token=github_token)
-            content_files = content_fetcher.fetch_single_repository(repo_url, progress_callback=progress_callback)
+            def progress_callback(percent, message=None):
+                bucket = int(percent) // 10
+                if bucket == last_bucket[0]:
+                    return
+                last_bucket[0] = bucket
+                status = f"Progress: {percent:.0f}%"
+                if message:
+                    status += f" - {message}"
+                # Called from the worker thread, so hand the widget update to the event loop
+                self.call_from_thread(self._log, status)
+
+            # Get GitHub tokens; extra tokens are rotated to spread the rate limit
+            github_tokens = credentials_manager.get_github_tokens()
+            content_fetcher = ContentFetcher(github_tokens=github_tokens, session=session)
+            # Fetch and upload off the event loop so the UI keeps redrawing
+            content_files = await asyncio.to_thread(
+                content_fetcher.fetch_single_repository, repo_url, progress_callback=progress_callback
+            )
 
             if not content_files:
-                self.query_one(ListView).append(Label("No content found in repository or error occurred during fetch."))
+                self._log("No content found in repository or error occurred during fetch.")
                 return
 
             # Use default values for dataset name and description based on repo URL
@@ -84,9 +113,10 @@ class GitHubDatasetApp(App):
             description = f"Dataset created from GitHub repository: {repo_url}"
             
             # Show details to user
-            self.query_one(ListView).append(Label(f"Creating dataset with name: {dataset_name}"))
-            self.query_one(ListView).append(Label(f"Description: {description}"))
-            result = dataset_creator.create_and_push_dataset(
+            self._log(f"Creating dataset with name: {dataset_name}")
+            self._log(f"Description: {description}")
+            result = await asyncio.to_thread(
+                dataset_creator.create_and_push_dataset,
                 file_data_list=content_files,
                 dataset_name=dataset_name,
                 description=description,
@@ -96,16 +126,16 @@ class GitHubDatasetApp(App):
             )
 
             if result[0]:
-                self.query_one(ListView).append(Label(f"Dataset '{dataset_name}' created successfully!"))
+                self._log(f"Dataset '{dataset_name}' created successfully!")
             else:
-                self.query_one(ListView).append(Label("Failed to create dataset."))
+                self._log("Failed to create dataset.")
 
         except Exception as e:
-            self.query_one(ListView).append(Label(f"Error creating dataset from GitHub repository: {e}"))
+            self._log(f"Error creating dataset from GitHub repository: {e}")
             logging.error(f"Error in GitHub repository workflow: {e}")
 
-def github_dataset():
-    app = GitHubDatasetApp()
+def github_dataset(credentials_manager=None):
+    app = GitHubDatasetApp(credentials_manager=credentials_manager)
     app.run()
 
 if __name__ == "__main__":
@@ -3,13 +3,14 @@ import os
 import logging
 import signal
 import traceback
+import inspect
+import asyncio
+from functools import partial
 import time
 from pathlib import Path
 from utils.logging_config import setup_logging
-from config.credentials_manager import CredentialsManager
-from huggingface.dataset_manager import DatasetManager
+from config.credentials_manager import get_credentials_manager
 from utils.task_tracker import TaskTracker
-from utils.task_scheduler import TaskScheduler
 from api.server import start_server, stop_server, is_server_running, get_server_info
 from threading import Event, current_thread
 
@@ -22,6 +23,7 @@ from ui.configuration import configuration
 from ui.ai_assistant import ai_assistant
 
 from textual.app import App, ComposeResult
+from textual.reactive import reactive
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import (
     Header,
@@ -46,6 +48,55 @@ logger = logging.getLogger(__name__)
 class MainMenuApp(App):
     CSS_PATH = "tui_app.css"
 
+    # Server state, refreshed on a timer rather than checked on every UI event
+    server_running = reactive(False)
+    SERVER_STATE_INTERVAL = 2.0
+
+    # Screen launchers in menu order. Each one runs its own Textual App, so the
+    # menu exits first and main_menu() runs the launcher once it has the terminal
+    _ACTIONS = {
+        "scrape_crawl": ("Scrape & Crawl", scrape_crawl),
+        "github_dataset": ("Create Dataset from GitHub Repository", github_dataset),
+        "manage_datasets": ("Manage Existing Datasets", manage_datasets),
+        "resume_task": ("Resume Scraping Task", resume_task),
+        "scheduled_tasks": ("Scheduled Tasks & Automation", scheduled_tasks),
+        "configuration": ("Configuration", configuration),
+        "ai_assistant": ("Run AI Assistant", ai_assistant),
+    }
+    # Launchers that accept the menu's shared CredentialsManager
+    _CREDENTIAL_ACTIONS = {"scrape_crawl", "github_dataset", "manage_datasets", "resume_task"}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Shared by every screen launched from the menu so credentials are loaded once
+        self.credentials_manager = get_credentials_manager()
+        self._entries = self._build_menu_entries()
+        self._handlers = {button_id: handler for button_id, _, handler in self._entries}
+
+    def _build_menu_entries(self):
+        """
+        Build the menu as an ordered table of (button id, label, handler).
+
+        The table drives both the buttons shown and the dispatch on press.
+        "Resume Scraping Task" is only listed when there is a task to resume.
+
+        Returns:
+            list: Menu entries in display order
+        """
+        has_resumable_tasks = bool(TaskTracker().list_resumable_tasks())
+        entries = [
+            ("start_server", "Start OpenAPI Endpoints", self.start_server),
+            ("stop_server", "Stop OpenAPI Endpoints", self.stop_server),
+        ]
+        for button_id, (label, action) in self._ACTIONS.items():
+            if button_id == "resume_task" and not has_resumable_tasks:
+                continue
+            if button_id in self._CREDENTIAL_ACTIONS:
+                action = partial(action, credentials_manager=self.credentials_manager)
+            entries.append((button_id, label, action))
+        entries.append(("exit", "Exit", self.exit))
+        return entries
+
     def compose(self) -> ComposeResult:
         yield Header()
         yield Footer()
@@ -53,16 +104,7 @@ class MainMenuApp(App):
             Horizontal(
                 Vertical(
                     Label("Main Menu"),
-                    Button("Start OpenAPI Endpoints", id="start_server"),
-                    Button("Stop OpenAPI Endpoints", id="stop_server"),
-                    Button("Scrape & Crawl", id="scrape_crawl"),
-                    Button("Create Dataset from GitHub Repository", id="github_dataset"),
-                    Button("Manage Existing Datasets", id="manage_datasets"),
-                    Button("Resume Scraping Task", id="resume_task"),
-                    Button("Scheduled Tasks & Automation", id="scheduled_tasks"),
-                    Button("Configuration", id="configuration"),
-                    Button("Run AI Assistant", id="ai_assistant"),
-                    Button("Exit", id="exit"),
+                    *(Button(label, id=button_id) for button_id, label, _ in self._entries),
                     id="left_panel",
                 ),
                 Vertical(
@@ -74,46 +116,65 @@ class MainMenuApp(App):
             )
         )
 
+    def on_mount(self) -> None:
+        # Look the output list up once instead of walking the DOM on every update
+        self._menu_list = self.query_one("#menu_list", ListView)
+        self._start_button = self.query_one("#start_server", Button)
+        self._stop_button = self.query_one("#stop_server", Button)
+        self.refresh_server_state()
+        self.set_interval(self.SERVER_STATE_INTERVAL, self.refresh_server_state)
+
+    def refresh_server_state(self) -> None:
+        """Re-read whether the API server is running; the watcher updates the buttons."""
+        self.server_running = is_server_running()
+
+    def watch_server_running(self, running: bool) -> None:
+        """Enable only the server button that applies to the current state."""
+        self._start_button.disabled = running
+        self._stop_button.disabled = not running
+
+    def _log(self, message: str) -> None:
+        """Append a status line to the menu output list."""
+        self._menu_list.append(Label(message))
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "start_server":
-            await self.start_server()
-        elif event.button.id == "stop_server":
-            await self.stop_server()
-        elif event.button.id == "scrape_crawl":
-            scrape_crawl()
-        elif event.button.id == "github_dataset":
-            github_dataset()
-        elif event.button.id == "manage_datasets":
-            manage_datasets()
-        elif event.button.id == "resume_task":
-            resume_task()
-        elif event.button.id == "scheduled_tasks":
-            scheduled_tasks()
-        elif event.button.id == "configuration":
-            configuration()
-        elif event.button.id == "ai_assistant":
-            ai_assistant()
-        elif event.button.id == "exit":
-            self.exit()
+        handler = self._handlers.get(event.button.id)
+        if handler is None:
+            return
+        if inspect.iscoroutinefunction(handler):
+            await handler()
+        elif event.button.id in self._ACTIONS:
+            # Never nest App instances: hand the launcher back to main_menu()
+            self.exit(handler)
+        else:
+            handler()
 
     async def start_server(self):
-        credentials_manager = CredentialsManager()
+        credentials_manager = self.credentials_manager
         api_key = credentials_manager.get_openapi_key()
         if not api_key:
-            self.query_one(ListView).append(Label("OpenAPI key not configured. Please set an API key."))
+            self._log("OpenAPI key not configured. Please set an API key.")
             return
         server_port = credentials_manager.get_server_port()
-        if start_server(api_key, port=server_port):
-            self.query_one(ListView).append(Label(f"OpenAPI Endpoints started successfully at http://0.0.0.0:{server_port}"))
+        # start_server waits for uvicorn to come up; keep the menu responsive meanwhile
+        if await asyncio.to_thread(start_server, api_key, port=server_port):
+            self._log(f"OpenAPI Endpoints started successfully at http://0.0.0.0:{server_port}")
         else:
-            self.query_one(ListView).append(Label("Failed to start OpenAPI Endpoints"))
+            self._log("Failed to start OpenAPI Endpoints")
+        self.refresh_server_state()
 
     async def stop_server(self):
         if stop_server():
-            self.query_one(ListView).append(Label("OpenAPI Endpoints stopped successfully"))
+            self._log("OpenAPI Endpoints stopped successfully")
         else:
-            self.query_one(ListView).append(Label("Failed to stop OpenAPI Endpoints"))
+            self._log("Failed to stop OpenAPI Endpoints")
+        self.refresh_server_state()
 
 def main_menu():
-    app = MainMenuApp()
-    app.run()
+    # The menu returns the chosen screen's launcher; run it on the main thread
+    # with sole ownership of the terminal, then show the menu again
+    while True:
+        launcher = MainMenuApp().run()
+        if launcher is None:
+            break
+        launcher()
@@ -1,5 +1,6 @@
 import logging
-from config.credentials_manager import CredentialsManager
+import asyncio
+from config.credentials_manager import get_credentials_manager
 from huggingface.dataset_manager import DatasetManager
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
@@ -16,9 +17,27 @@ from textual.widgets import (
 
 logger = logging.getLogger(__name__)
 
+# Reused across visits to this screen so the Hub session and dataset info cache stay warm
+_dataset_manager = None
+
+
+def _get_dataset_manager(huggingface_token, credentials_manager):
+    """Return the shared DatasetManager, recreating it if the token changed."""
+    global _dataset_manager
+    if _dataset_manager is None or _dataset_manager.token != huggingface_token:
+        _dataset_manager = DatasetManager(huggingface_token=huggingface_token,
+                                          credentials_manager=credentials_manager)
+    return _dataset_manager
+
 class ManageDatasetsApp(App):
     CSS_PATH = "tui_app.css"
 
+    def __init__(self, *args, credentials_manager=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.credentials_manager = credentials_manager or get_credentials_manager()
+        # Dataset id awaiting a second Delete press to confirm
+        self._pending_delete = None
+
     def compose(self) -> ComposeResult:
         yield Header()
         yield Footer()
@@ -26,9 +45,12 @@ class ManageDatasetsApp(App):
             Horizontal(
                 Vertical(
                     Label("Manage Datasets"),
+                    TextInput(placeholder="Dataset number", id="dataset_num_input"),
                     Button("View Dataset Details", id="view_details"),
                     Button("Download Dataset Metadata", id="download_metadata"),
+                    Button("Download Metadata for All Datasets", id="download_all_metadata"),
                     Button("Delete Dataset", id="delete_dataset"),
+                    Button("Refresh Dataset List", id="refresh_datasets"),
                     Button("Return to Main Menu", id="return_main"),
                     id="left_panel",
                 ),
@@ -46,92 +68,162 @@ class ManageDatasetsApp(App):
             await self.view_dataset_details()
         elif event.button.id == "download_metadata":
             await self.download_dataset_metadata()
+        elif event.button.id == "download_all_metadata":
+            await self.download_all_metadata()
         elif event.button.id == "delete_dataset":
             await self.delete_dataset()
+        elif event.button.id == "refresh_datasets":
+            await self.refresh_datasets()
         elif event.button.id == "return_main":
             self.exit()
 
+    def _log(self, message):
+        """Append a line to the dataset list."""
+        self._dataset_list.append(Label(message))
+
+    def _log_lines(self, lines):
+        """Append several lines to the dataset list in a single mount."""
+        return self._dataset_list.extend(Label(line) for line in lines)
+
+    def _selected_index(self):
+        """Return the 0-based dataset index typed into the number input, or -1."""
+        try:
+            return int(self.query_one("#dataset_num_input", TextInput).value) - 1
+        except ValueError:
+            return -1
+
     async def view_dataset_details(self):
-        dataset_index = int(input("Enter dataset number to view: ")) - 1
+        dataset_index = self._selected_index()
         datasets = self.datasets
 
         if 0 <= dataset_index < len(datasets):
-            dataset_id = datasets[dataset_index].get('id')
-            info = self.dataset_manager.get_dataset_info(dataset_id)
+            dataset_id = datasets[dataset_index].id
+            info = await asyncio.to_thread(self.dataset_manager.get_dataset_info, dataset_id)
 
             if info:
-                self.query_one(ListView).append(Label(f"\n----- Dataset: {info.id} -----"))
-                self.query_one(ListView).append(Label(f"Description: {info.description}"))
-                self.query_one(ListView).append(Label(f"Created: {info.created_at}"))
-                self.query_one(ListView).append(Label(f"Last modified: {info.last_modified}"))
-                self.query_one(ListView).append(Label(f"Downloads: {info.downloads}"))
-                self.query_one(ListView).append(Label(f"Likes: {info.likes}"))
-                self.query_one(ListView).append(Label(f"Tags: {', '.join(info.tags) if info.tags else 'None'}"))
+                self._log_lines([
+                    f"\n----- Dataset: {info.id} -----",
+                    f"Description: {info.description}",
+                    f"Created: {info.created_at}",
+                    f"Last modified: {info.last_modified}",
+                    f"Downloads: {info.downloads}",
+                    f"Likes: {info.likes}",
+                    f"Tags: {', '.join(info.tags) if info.tags else 'None'}",
+                ])
             else:
-                self.query_one(ListView).append(Label(f"Error retrieving details for dataset {dataset_id}"))
+                self._log(f"Error retrieving details for dataset {dataset_id}")
         else:
-            self.query_one(ListView).append(Label("Invalid dataset number"))
+            self._log("Invalid dataset number")
 
     async def download_dataset_metadata(self):
-        dataset_index = int(input("Enter dataset number to download metadata: ")) - 1
+        dataset_index = self._selected_index()
         datasets = self.datasets
 
         if 0 <= dataset_index < len(datasets):
-            dataset_id = datasets[dataset_index].get('id')
-            success = self.dataset_manager.download_dataset_metadata(dataset_id)
+            dataset_id = datasets[dataset_index].id
+            success = await asyncio.to_thread(self.dataset_manager.download_dataset_metadata, dataset_id)
 
             if success:
-                self.query_one(ListView).append(Label(f"\nMetadata for dataset '{dataset_id}' downloaded successfully"))
-                self.query_one(ListView).append(Label(f"Saved to ./dataset_metadata/{dataset_id}/"))
+                self._log_lines([
+                    f"\nMetadata for dataset '{dataset_id}' downloaded successfully",
+                    f"Saved to ./dataset_metadata/{dataset_id}/",
+                ])
             else:
-                self.query_one(ListView).append(Label(f"Error downloading metadata for dataset {dataset_id}"))
+                self._log(f"Error downloading metadata for dataset {dataset_id}")
         else:
-            self.query_one(ListView).append(Label("Invalid dataset number"))
+            self._log("Invalid dataset number")
+
+    async def download_all_metadata(self):
+        dataset_ids = [dataset.id for dataset in self.datasets]
+        self._log(f"\nDownloading metadata for {len(dataset_ids)} datasets...")
+
+        def progress_callback(completed, total, dataset_id, success):
+            status = f"[{completed}/{total}] {dataset_id}: {'done' if success else 'failed'}"
+            # Called from the worker thread, so hand the widget update to the event loop
+            self.call_from_thread(self._log, status)
+
+        results = await asyncio.to_thread(
+            self.dataset_manager.download_all_metadata,
+            dataset_ids,
+            progress_callback=progress_callback,
+        )
+        succeeded = sum(results.values())
+        self._log(f"Downloaded metadata for {succeeded}/{len(results)} datasets to ./dataset_metadata/")
 
     async def delete_dataset(self):
-        dataset_index = int(input("Enter dataset number to delete: ")) - 1
+        dataset_index = self._selected_index()
         datasets = self.datasets
 
         if 0 <= dataset_index < len(datasets):
-            dataset_id = datasets[dataset_index].get('id')
+            dataset_id = datasets[dataset_index].id
+
+            # Deleting takes two presses on the same dataset instead of a blocking yes/no prompt
+            if self._pending_delete != dataset_id:
+                self._pending_delete = dataset_id
+                self._log(f"Press Delete Dataset again to confirm deleting '{dataset_id}'")
+                return
 
-            confirm = input(f"Are you sure you want to delete dataset '{dataset_id}'? (yes/no): ")
-            if confirm.lower() == "yes":
-                success = self.dataset_manager.delete_dataset(dataset_id)
+            self._pending_delete = None
+            success = await asyncio.to_thread(self.dataset_manager.delete_dataset, dataset_id)
 
-                if success:
-                    self.query_one(ListView).append(Label(f"\nDataset '{dataset_id}' deleted successfully"))
-                else:
-                    self.query_one(ListView).append(Label(f"Error deleting dataset {dataset_id}"))
+            if success:
+                self._log(f"\nDataset '{dataset_id}' deleted successfully")
             else:
-                self.query_one(ListView).append(Label("Deletion cancelled"))
+                self._log(f"Error deleting dataset {dataset_id}")
         else:
-            self.query_one(ListView).append(Label("Invalid dataset number"))
+            self._log("Invalid dataset number")
+
+    async def refresh_datasets(self):
+        # Listings are cached for a minute; this bypasses the cache on request
+        self._log("\nRefreshing your datasets from HuggingFace...")
+        self.datasets = await asyncio.to_thread(self.dataset_manager.list_datasets, refresh=True)
+        if not self.datasets:
+            self._log("No datasets found for your account.")
+            return
+        await self._show_datasets()
 
     async def on_mount(self) -> None:
-        self.credentials_manager = CredentialsManager()
-        _, self.huggingface_token = self.credentials_manager.get_huggingface_credentials()
+        # Look the output list up once instead of walking the DOM on every update
+        self._dataset_list = self.query_one("#dataset_list", ListView)
+        hf_username, self.huggingface_token = self.credentials_manager.get_huggingface_credentials()
 
         if not self.huggingface_token:
-            self.query_one(ListView).append(Label("\nError: HuggingFace token not found. Please set your credentials first."))
+            self._log("\nError: HuggingFace token not found. Please set your credentials first.")
             return
 
-        self.dataset_manager = DatasetManager(huggingface_token=self.huggingface_token,
-                                              credentials_manager=self.credentials_manager)
+        self.dataset_manager = _get_dataset_manager(self.huggingface_token, self.credentials_manager)
+
+        # Show the last saved listing straight away, then refresh it from the Hub
+        cached_datasets = self.dataset_manager.load_dataset_index(hf_username)
+        if cached_datasets:
+            self.datasets = cached_datasets
+            await self._show_datasets("(cached) ")
+        self._log("\nFetching your datasets from HuggingFace...")
+        self.datasets = await asyncio.to_thread(self.dataset_manager.list_datasets)
 
-        self.query_one(ListView).append(Label("\nFetching your datasets from HuggingFace..."))
-        self.datasets = self.dataset_manager.list_datasets()
+        if not self.datasets and cached_datasets:
+            # Most likely offline; keep working from the saved listing
+            self.datasets = cached_datasets
+            self._log("Could not refresh the dataset list; using the cached listing above.")
+            return
 
         if not self.datasets:
-            self.query_one(ListView).append(Label("No datasets found for your account."))
+            self._log("No datasets found for your account.")
             return
 
-        self.query_one(ListView).append(Label(f"\nFound {len(self.datasets)} datasets:"))
-        for i, dataset in enumerate(self.datasets):
-            self.query_one(ListView).append(Label(f"{i+1}. {dataset.get('id', 'Unknown')} - {dataset.get('lastModified', 'Unknown date')}"))
+        await self._show_datasets()
+
+    def _show_datasets(self, prefix=""):
+        """Mount the numbered dataset listing in one batch rather than one append per dataset."""
+        lines = [f"\n{prefix}Found {len(self.datasets)} datasets:"]
+        lines.extend(
+            f"{i+1}. {dataset.id} - {dataset.last_modified or 'Unknown date'}"
+            for i, dataset in enumerate(self.datasets)
+        )
+        return self._log_lines(lines)
 
-def manage_datasets():
-    app = ManageDatasetsApp()
+def manage_datasets(credentials_manager=None):
+    app = ManageDatasetsApp(credentials_manager=credentials_manager)
     app.run()
 
 if __name__ == "__main__":
@@ -1,9 +1,9 @@
 import logging
-from config.credentials_manager import CredentialsManager
-from huggingface.dataset_manager import DatasetManager
+import asyncio
+from threading import Event, Lock
+from config.credentials_manager import get_credentials_manager
 from utils.task_tracker import TaskTracker
-from web.crawler import WebCrawler
-from huggingface.dataset_creator import DatasetCreator
+from utils.performance import throttle_progress
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import (
@@ -11,6 +11,8 @@ from textual.widgets import (
     Footer,
     Button,
     TextInput,
+    Input,
+    DataTable,
     Label,
     Panel,
     Markdown,
@@ -19,8 +21,44 @@ from textual.widgets import (
 
 logger = logging.getLogger(__name__)
 
+# Shared across resumed tasks so crawler state (robots.txt cache) and Hub clients are reused
+_web_crawler = None
+_dataset_creator = None
+_instances_lock = Lock()
+
+
+def _get_web_crawler():
+    """Return the shared WebCrawler, creating it on first use."""
+    global _web_crawler
+    with _instances_lock:
+        if _web_crawler is None:
+            # Imported here so opening the menu doesn't pay for the crawler's dependencies
+            from web.crawler import WebCrawler
+            _web_crawler = WebCrawler(respect_robots_txt=True, rate_limit_delay=1.0)
+        return _web_crawler
+
+
+def _get_dataset_creator(huggingface_token):
+    """Return the shared DatasetCreator, recreating it if the token changed."""
+    global _dataset_creator
+    with _instances_lock:
+        if _dataset_creator is None or _dataset_creator.token != huggingface_token:
+            from huggingface.dataset_creator import DatasetCreator
+            _dataset_creator = DatasetCreator(huggingface_token=huggingface_token)
+        return _dataset_creator
+
 class ResumeTaskApp(App):
     CSS_PATH = "tui_app.css"
+    # Oldest lines are dropped beyond this so long runs don't grow the list without bound
+    MAX_LOG_LINES = 500
+
+    def __init__(self, *args, credentials_manager=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Created in on_mount off the event loop when not supplied
+        self.credentials_manager = credentials_manager
+        # Set to stop the resumed task running in the worker thread
+        self._cancellation_event = None
+        self.tasks = []
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -29,8 +67,11 @@ class ResumeTaskApp(App):
             Horizontal(
                 Vertical(
                     Label("Resume Scraping Task"),
-                    ListView(id="task_list"),
+                    Input(placeholder="Filter tasks", id="task_filter"),
+                    DataTable(id="task_table"),
+                    TextInput(placeholder="Task number", id="task_num_input"),
                     Button("Resume Task", id="resume_button"),
+                    Button("Cancel", id="cancel_button"),
                     Button("Return to Main Menu", id="return_main"),
                     id="left_panel",
                 ),
@@ -43,14 +84,51 @@ class ResumeTaskApp(App):
             )
         )
 
+    def _log(self, message: str) -> None:
+        """Append a line to the task details log."""
+        self._task_details.append(Label(message))
+        if len(self._task_details.children) > self.MAX_LOG_LINES:
+            self._task_details.children[0].remove()
+
+    def _show_tasks(self, query=""):
+        """Fill the task table with the tasks whose description contains the query.
+
+        Rows keep their position in self.tasks as the task number, so the number
+        typed into the input still selects the right task while filtering.
+        """
+        query = query.strip().casefold()
+        self._task_table.clear()
+        self._task_table.add_rows(
+            (
+                str(i + 1),
+                task.get("description", "Unknown task"),
+                f"{task.get('progress', 0):.0f}%",
+                task.get("updated_ago", "unknown time"),
+            )
+            for i, task in enumerate(self.tasks)
+            if query in task.get("description", "").casefold()
+        )
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id == "task_filter":
+            self._show_tasks(event.value)
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "resume_button":
-            await self.resume_task()
+            # Run as a worker so the Cancel button is still handled while it runs
+            self.run_worker(self.resume_task(), exclusive=True)
+        elif event.button.id == "cancel_button":
+            if self._cancellation_event:
+                self._cancellation_event.set()
+            self.workers.cancel_all()
         elif event.button.id == "return_main":
             self.exit()
 
     async def resume_task(self):
-        task_index = int(input("Enter task number to resume: ")) - 1
+        try:
+            task_index = int(self.query_one("#task_num_input", TextInput).value) - 1
+        except ValueError:
+            task_index = -1
         tasks = self.tasks
 
         if 0 <= task_index < len(tasks):
@@ -59,78 +137,102 @@ class ResumeTaskApp(App):
             task_type = selected_task["type"]
             task_params = selected_task["params"]
 
-            confirm = input(f"Resume task: {selected_task['description']}? (yes/no): ")
-            if confirm.lower() != "yes":
-                self.query_one(ListView).append(Label("Resumption cancelled"))
-                return
-
-            self.query_one(ListView).append(Label(f"\nResuming task {task_id}..."))
+            # Pressing Resume Task with a task number is the confirmation
+            self._log(f"\nResuming task {task_id}: {selected_task['description']}")
 
-            cancellation_event = Event()
+            cancellation_event = self._cancellation_event = Event()
 
             if task_type == "scrape":
                 hf_username, huggingface_token = self.credentials_manager.get_huggingface_credentials()
                 if not huggingface_token:
-                    self.query_one(ListView).append(Label("\nError: HuggingFace token not found. Please set your credentials first."))
+                    self._log("\nError: HuggingFace token not found. Please set your credentials first.")
                     return
 
-                web_crawler = WebCrawler()
-                dataset_creator = DatasetCreator(huggingface_token=huggingface_token)
+                web_crawler = _get_web_crawler()
+                dataset_creator = _get_dataset_creator(huggingface_token)
 
+                @throttle_progress
                 def progress_callback(percent, message=None):
-                    if percent % 10 == 0 or percent == 100:
-                        status = f"Progress: {percent:.0f}%"
-                        if message:
-                            status += f" - {message}"
-                        self.query_one(ListView).append(Label(status))
+                    status = f"Progress: {percent:.0f}%"
+                    if message:
+                        status += f" - {message}"
+                    # Called from the worker thread, so hand the widget update to the event loop
+                    self.call_from_thread(self._log, status)
 
                 url = task_params.get("url")
                 dataset_name = task_params.get("dataset_name")
                 description = task_params.get("description")
                 recursive = task_params.get("recursive", False)
 
-                self.query_one(ListView).append(Label(f"Resuming dataset creation from URL: {url}"))
-
-                result = dataset_creator.create_dataset_from_url(
-                    url=url,
-                    dataset_name=dataset_name,
-                    description=description,
-                    recursive=recursive,
-                    progress_callback=progress_callback,
-                    _cancellation_event=cancellation_event,
-                    task_id=task_id,
-                    resume_from=selected_task.get("current_stage")
-                )
+                self._log(f"Resuming dataset creation from URL: {url}")
+
+                try:
+                    # Crawl and upload off the event loop so the UI keeps redrawing
+                    result = await asyncio.to_thread(
+                        dataset_creator.create_dataset_from_url,
+                        url=url,
+                        dataset_name=dataset_name,
+                        description=description,
+                        recursive=recursive,
+                        progress_callback=progress_callback,
+                        _cancellation_event=cancellation_event,
+                        task_id=task_id,
+                        resume_from=selected_task.get("current_stage"),
+                        web_crawler=web_crawler
+                    )
+                except asyncio.CancelledError:
+                    # Stop the crawl thread too; it checks the event between pages
+                    cancellation_event.set()
+                    self._log("\nTask cancelled; it can be resumed again later")
+                    raise
+                finally:
+                    # The task's state on disk has changed either way
+                    TaskTracker.clear_resumable_cache()
 
                 if result.get("success"):
-                    self.query_one(ListView).append(Label(f"\nDataset '{dataset_name}' creation resumed and completed successfully"))
+                    self._log(f"\nDataset '{dataset_name}' creation resumed and completed successfully")
                 else:
-                    self.query_one(ListView).append(Label(f"\nFailed to resume dataset creation: {result.get('message', 'Unknown error')}"))
+                    self._log(f"\nFailed to resume dataset creation: {result.get('message', 'Unknown error')}")
 
             else:
-                self.query_one(ListView).append(Label(f"Unsupported task type: {task_type}"))
+                self._log(f"Unsupported task type: {task_type}")
 
         else:
-            self.query_one(ListView).append(Label("Invalid task number"))
+            self._log("Invalid task number")
+
+    @staticmethod
+    def _load_tasks():
+        """Create a TaskTracker and list its resumable tasks."""
+        task_tracker = TaskTracker()
+        return task_tracker, task_tracker.list_resumable_tasks()
 
     async def on_mount(self) -> None:
-        self.credentials_manager = CredentialsManager()
-        self.task_tracker = TaskTracker()
-        self.tasks = self.task_tracker.list_resumable_tasks()
+        # Look the widgets up once instead of walking the DOM on every update
+        self._task_table = self.query_one("#task_table", DataTable)
+        self._task_details = self.query_one("#task_details", ListView)
+        self._task_table.add_columns("#", "Description", "Progress", "Updated")
+        # Credential loading and the task scan are independent disk reads, so run them side by side;
+        # warming the HF credential lookup here makes the one in resume_task() free
+        def load_credentials():
+            credentials_manager = self.credentials_manager or get_credentials_manager()
+            credentials_manager.get_huggingface_credentials()
+            return credentials_manager
+
+        (self.task_tracker, self.tasks), credentials_manager = await asyncio.gather(
+            asyncio.to_thread(self._load_tasks),
+            asyncio.to_thread(load_credentials),
+        )
+        self.credentials_manager = credentials_manager
 
         if not self.tasks:
-            self.query_one(ListView).append(Label("No resumable tasks found."))
+            self._log("No resumable tasks found.")
             return
 
-        self.query_one(ListView).append(Label("Available tasks to resume:"))
-        for i, task in enumerate(self.tasks):
-            task_desc = task.get("description", "Unknown task")
-            progress = task.get("progress", 0)
-            updated = task.get("updated_ago", "unknown time")
-            self.query_one(ListView).append(Label(f"{i+1}. {task_desc} ({progress:.0f}% complete, updated {updated})"))
+        # DataTable only renders the visible rows, so long task lists stay cheap
+        self._show_tasks()
 
-def resume_task():
-    app = ResumeTaskApp()
+def resume_task(credentials_manager=None):
+    app = ResumeTaskApp(credentials_manager=credentials_manager)
     app.run()
 
 if __name__ == "__main__":
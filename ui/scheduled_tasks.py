@@ -1,12 +1,14 @@
 import logging
-from utils.task_scheduler import TaskScheduler
+from utils.task_scheduler import TaskScheduler, is_valid_cron_field
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
+from textual.screen import ModalScreen
 from textual.widgets import (
     Header,
     Footer,
     Button,
-    TextInput,
+    Input,
     Label,
     Panel,
     Markdown,
@@ -15,6 +17,46 @@ from textual.widgets import (
 
 logger = logging.getLogger(__name__)
 
+# Prompt text reused by the create and update flows
+SCHEDULE_TYPE_CHOICES = "'daily', 'weekly', 'biweekly', 'monthly', 'custom'"
+CRON_FIELD_PROMPTS = (
+    ("minute", "Enter minute (0-59): "),
+    ("hour", "Enter hour (0-23): "),
+    ("day", "Enter day of month (1-31 or *): "),
+    ("month", "Enter month (1-12 or *): "),
+    ("day_of_week", "Enter day of week (0-6 or *): "),
+)
+
+class _PromptCancelled(Exception):
+    """Raised when the user dismisses a prompt with Escape."""
+
+
+class PromptScreen(ModalScreen):
+    """Modal asking for one line of text; dismisses with the value, or None on Escape."""
+
+    BINDINGS = [("escape", "cancel", "Cancel")]
+
+    def __init__(self, message):
+        super().__init__()
+        self.message = message
+
+    def compose(self) -> ComposeResult:
+        yield Vertical(
+            Label(self.message),
+            Input(id="prompt_input"),
+            id="prompt_dialog",
+        )
+
+    def on_mount(self) -> None:
+        self.query_one("#prompt_input", Input).focus()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        self.dismiss(event.value)
+
+    def action_cancel(self) -> None:
+        self.dismiss(None)
+
+
 class ScheduledTasksApp(App):
     CSS_PATH = "tui_app.css"
     
@@ -46,52 +88,107 @@ class ScheduledTasksApp(App):
             )
         )
 
+    def on_mount(self) -> None:
+        # Look the output list up once instead of walking the DOM on every update
+        self._task_list = self.query_one("#task_list", ListView)
+
+    def _log(self, message):
+        """Append a line to the task list."""
+        self._task_list.append(Label(message))
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "list_tasks":
             await self.list_scheduled_tasks()
         elif event.button.id == "create_task":
-            await self.create_scheduled_task()
+            self._run_flow(self.create_scheduled_task)
         elif event.button.id == "update_task":
-            await self.update_scheduled_task()
+            self._run_flow(self.update_scheduled_task)
         elif event.button.id == "delete_task":
-            await self.delete_scheduled_task()
+            self._run_flow(self.delete_scheduled_task)
         elif event.button.id == "run_task":
-            await self.run_scheduled_task()
+            self._run_flow(self.run_scheduled_task)
         elif event.button.id == "return_main":
             self.exit()
 
+    @work(exclusive=True)
+    async def _run_flow(self, flow):
+        """
+        Run a prompting flow in a worker, since waiting on a modal screen
+        from a message handler would stall the app's own event processing.
+
+        Args:
+            flow: Coroutine function that collects its input with _prompt
+        """
+        try:
+            await flow()
+        except _PromptCancelled:
+            self._log("Cancelled.")
+
+    async def _prompt(self, message):
+        """
+        Ask for a line of text in a modal screen.
+
+        Args:
+            message: Prompt shown above the input
+
+        Returns:
+            str: The submitted value
+
+        Raises:
+            _PromptCancelled: If the user pressed Escape
+        """
+        value = await self.push_screen_wait(PromptScreen(message))
+        if value is None:
+            raise _PromptCancelled()
+        return value
+
+    async def _prompt_custom_schedule(self):
+        """
+        Ask for the five crontab fields, re-prompting until each one is well formed.
+
+        Returns:
+            dict: minute/hour/day/month/day_of_week plus the joined cron_expr
+        """
+        fields = {}
+        for name, message in CRON_FIELD_PROMPTS:
+            value = (await self._prompt(message)).strip()
+            while not is_valid_cron_field(value):
+                self._log(f"Invalid {name.replace('_', ' ')}: '{value}'")
+                value = (await self._prompt(message)).strip()
+            fields[name] = value
+        fields["cron_expr"] = " ".join(fields.values())
+        return fields
+
     async def list_scheduled_tasks(self):
         if not self.scheduler.is_crontab_available():
-            self.query_one(ListView).append(Label("Crontab is not available on this system. Scheduled tasks cannot be managed."))
+            self._log("Crontab is not available on this system. Scheduled tasks cannot be managed.")
             return
 
         tasks = self.scheduler.list_scheduled_tasks()
         if not tasks:
-            self.query_one(ListView).append(Label("No scheduled tasks found."))
+            self._log("No scheduled tasks found.")
         else:
-            self.query_one(ListView).append(Label(f"Found {len(tasks)} scheduled tasks:"))
+            # Mount the whole listing in one batch rather than three appends per task
+            lines = [f"Found {len(tasks)} scheduled tasks:"]
             for i, task in enumerate(tasks):
-                self.query_one(ListView).append(Label(f"{i+1}. {task.get('id', 'Unknown')} - {task.get('schedule_description', 'Unknown schedule')}"))
-                self.query_one(ListView).append(Label(f"   Next run: {task.get('next_run', 'Unknown')}"))
-                self.query_one(ListView).append(Label(f"   Command: {task.get('command', 'Unknown')}"))
+                lines.extend((
+                    f"{i+1}. {task.get('id', 'Unknown')} - {task.get('schedule_description', 'Unknown schedule')}",
+                    f"   Next run: {task.get('next_run', 'Unknown')}",
+                    f"   Command: {task.get('command', 'Unknown')}",
+                ))
+            await self._task_list.extend(Label(line) for line in lines)
 
     async def create_scheduled_task(self):
-        task_type = input("Enter task type (e.g., 'update'): ")
-        source_type = input("Enter source type ('repository' or 'organization'): ")
-        source_name = input("Enter source name (repository URL or organization name): ")
-        dataset_name = input("Enter dataset name: ")
-        schedule_type = input("Enter schedule type ('daily', 'weekly', 'biweekly', 'monthly', 'custom'): ")
+        task_type = await self._prompt("Enter task type (e.g., 'update'): ")
+        source_type = await self._prompt("Enter source type ('repository' or 'organization'): ")
+        source_name = await self._prompt("Enter source name (repository URL or organization name): ")
+        dataset_name = await self._prompt("Enter dataset name: ")
+        schedule_type = await self._prompt(f"Enter schedule type ({SCHEDULE_TYPE_CHOICES}): ")
 
         if schedule_type == "custom":
-            minute = input("Enter minute (0-59): ")
-            hour = input("Enter hour (0-23): ")
-            day = input("Enter day of month (1-31 or *): ")
-            month = input("Enter month (1-12 or *): ")
-            day_of_week = input("Enter day of week (0-6 or *): ")
-
+            schedule = await self._prompt_custom_schedule()
             task_id = self.scheduler.create_scheduled_task(
-                task_type, source_type, source_name, dataset_name, schedule_type,
-                minute=minute, hour=hour, day=day, month=month, day_of_week=day_of_week
+                task_type, source_type, source_name, dataset_name, schedule_type, **schedule
             )
         else:
             task_id = self.scheduler.create_scheduled_task(
@@ -99,50 +196,42 @@ class ScheduledTasksApp(App):
             )
 
         if task_id:
-            self.query_one(ListView).append(Label(f"Scheduled task created successfully with ID: {task_id}"))
+            self._log(f"Scheduled task created successfully with ID: {task_id}")
         else:
-            self.query_one(ListView).append(Label("Failed to create scheduled task."))
+            self._log("Failed to create scheduled task.")
 
     async def update_scheduled_task(self):
-        task_id = input("Enter task ID to update: ")
-        schedule_type = input("Enter new schedule type ('daily', 'weekly', 'biweekly', 'monthly', 'custom'): ")
+        task_id = await self._prompt("Enter task ID to update: ")
+        schedule_type = await self._prompt(f"Enter new schedule type ({SCHEDULE_TYPE_CHOICES}): ")
 
         if schedule_type == "custom":
-            minute = input("Enter minute (0-59): ")
-            hour = input("Enter hour (0-23): ")
-            day = input("Enter day of month (1-31 or *): ")
-            month = input("Enter month (1-12 or *): ")
-            day_of_week = input("Enter day of week (0-6 or *): ")
-
-            success = self.scheduler.update_scheduled_task(
-                task_id, schedule_type,
-                minute=minute, hour=hour, day=day, month=month, day_of_week=day_of_week
-            )
+            schedule = await self._prompt_custom_schedule()
+            success = self.scheduler.update_scheduled_task(task_id, schedule_type, **schedule)
         else:
             success = self.scheduler.update_scheduled_task(task_id, schedule_type)
 
         if success:
-            self.query_one(ListView).append(Label(f"Scheduled task {task_id} updated successfully."))
+            self._log(f"Scheduled task {task_id} updated successfully.")
         else:
-            self.query_one(ListView).append(Label(f"Failed to update scheduled task {task_id}."))
+            self._log(f"Failed to update scheduled task {task_id}.")
 
     async def delete_scheduled_task(self):
-        task_id = input("Enter task ID to delete: ")
+        task_id = await self._prompt("Enter task ID to delete: ")
         success = self.scheduler.delete_scheduled_task(task_id)
 
         if success:
-            self.query_one(ListView).append(Label(f"Scheduled task {task_id} deleted successfully."))
+            self._log(f"Scheduled task {task_id} deleted successfully.")
         else:
-            self.query_one(ListView).append(Label(f"Failed to delete scheduled task {task_id}."))
+            self._log(f"Failed to delete scheduled task {task_id}.")
 
     async def run_scheduled_task(self):
-        task_id = input("Enter task ID to run now: ")
+        task_id = await self._prompt("Enter task ID to run now: ")
         success = self.scheduler.run_task_now(task_id)
 
         if success:
-            self.query_one(ListView).append(Label(f"Scheduled task {task_id} executed successfully."))
+            self._log(f"Scheduled task {task_id} executed successfully.")
         else:
-            self.query_one(ListView).append(Label(f"Failed to execute scheduled task {task_id}."))
+            self._log(f"Failed to execute scheduled task {task_id}.")
 
 def scheduled_tasks():
     app = ScheduledTasksApp()
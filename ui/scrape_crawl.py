@@ -1,8 +1,8 @@
 import logging
-from config.credentials_manager import CredentialsManager
-from huggingface.dataset_manager import DatasetManager
-from huggingface.dataset_creator import DatasetCreator
-from neo4j.graph_store import GraphStore
+import asyncio
+from threading import Event
+from config.credentials_manager import get_credentials_manager
+from utils.performance import throttle_progress
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import (
@@ -20,6 +20,14 @@ logger = logging.getLogger(__name__)
 
 class ScrapeCrawlApp(App):
     CSS_PATH = "tui_app.css"
+    # Oldest lines are dropped beyond this so long runs don't grow the list without bound
+    MAX_LOG_LINES = 500
+
+    def __init__(self, *args, credentials_manager=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.credentials_manager = credentials_manager or get_credentials_manager()
+        # Set to stop the crawl running in the worker thread
+        self._cancellation_event = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -30,6 +38,7 @@ class ScrapeCrawlApp(App):
                     Label("Scrape & Crawl"),
                     TextInput(placeholder="Enter the URL to scrape..."),
                     Button("Submit", id="submit_button"),
+                    Button("Cancel", id="cancel_button"),
                     id="left_panel",
                 ),
                 Vertical(
@@ -41,52 +50,79 @@ class ScrapeCrawlApp(App):
             )
         )
 
+    def on_mount(self) -> None:
+        # Look widgets up once instead of walking the DOM on every update
+        self._status_list = self.query_one("#status_list", ListView)
+        self._url_input = self.query_one(TextInput)
+
+    def _log(self, message: str) -> None:
+        """Append a status line to the status list."""
+        self._status_list.append(Label(message))
+        if len(self._status_list.children) > self.MAX_LOG_LINES:
+            self._status_list.children[0].remove()
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "submit_button":
-            url = self.query_one(TextInput).value
-            await self.scrape_crawl(url)
+            url = self._url_input.value
+            # Run as a worker so the Cancel button is still handled while it runs
+            self.run_worker(self.scrape_crawl(url), exclusive=True)
+        elif event.button.id == "cancel_button":
+            if self._cancellation_event:
+                self._cancellation_event.set()
+            self.workers.cancel_all()
 
     async def scrape_crawl(self, url: str) -> None:
-        self.query_one(ListView).append(Label(f"Starting scrape of: {url}"))
+        self._log(f"Starting scrape of: {url}")
 
         try:
-            credentials_manager = CredentialsManager()
-            hf_username, huggingface_token = credentials_manager.get_huggingface_credentials()
+            hf_username, huggingface_token = self.credentials_manager.get_huggingface_credentials()
             if not huggingface_token:
-                self.query_one(ListView).append(Label("Error: HuggingFace token not found. Please set your credentials first."))
+                self._log("Error: HuggingFace token not found. Please set your credentials first.")
                 return
 
+            # Imported here so opening the menu doesn't pay for datasets/huggingface_hub
+            from huggingface.dataset_creator import DatasetCreator
             dataset_creator = DatasetCreator(huggingface_token=huggingface_token)
+            self._cancellation_event = Event()
 
+            @throttle_progress
             def progress_callback(percent, message=None):
-                if percent % 10 == 0 or percent == 100:
-                    status = f"Progress: {percent:.0f}%"
-                    if message:
-                        status += f" - {message}"
-                    self.query_one(ListView).append(Label(status))
+                status = f"Progress: {percent:.0f}%"
+                if message:
+                    status += f" - {message}"
+                # Called from the worker thread, so hand the widget update to the event loop
+                self.call_from_thread(self._log, status)
 
             dataset_name = "example_dataset"
             description = "Example dataset description"
-            result = dataset_creator.create_dataset_from_url(
+            # Crawl and upload off the event loop so the UI keeps redrawing
+            result = await asyncio.to_thread(
+                dataset_creator.create_dataset_from_url,
                 url=url,
                 dataset_name=dataset_name,
                 description=description,
                 recursive=True,
                 progress_callback=progress_callback,
+                _cancellation_event=self._cancellation_event,
                 update_existing=False
             )
 
             if result.get("success"):
-                self.query_one(ListView).append(Label(f"Dataset '{dataset_name}' created successfully!"))
+                self._log(f"Dataset '{dataset_name}' created successfully!")
             else:
-                self.query_one(ListView).append(Label("Failed to create dataset."))
+                self._log("Failed to create dataset.")
 
+        except asyncio.CancelledError:
+            # Stop the crawl thread too; it checks the event between pages
+            self._cancellation_event.set()
+            self._log("Scrape cancelled.")
+            raise
         except Exception as e:
-            self.query_one(ListView).append(Label(f"Error creating dataset: {e}"))
+            self._log(f"Error creating dataset: {e}")
             logging.error(f"Error in scrape and crawl: {e}")
 
-def scrape_crawl():
-    app = ScrapeCrawlApp()
+def scrape_crawl(credentials_manager=None):
+    app = ScrapeCrawlApp(credentials_manager=credentials_manager)
     app.run()
 
 if __name__ == "__main__":
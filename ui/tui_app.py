@@ -37,19 +37,24 @@ class TUIApp(App):
             )
         )
 
+    def on_mount(self) -> None:
+        # Look the widgets up once instead of on every submission
+        self._query_input = self.query_one(TextInput)
+        self._response_list = self.query_one("#response_list", ListView)
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "submit_button":
-            query = self.query_one(TextInput).value
+            query = self._query_input.value
             response = await self.get_ai_response(query)
-            self.query_one(ListView).append(Label(response))
+            self._response_list.append(Label(response))
 
     async def get_ai_response(self, query: str) -> str:
         try:
             # Initialize LLM client with credentials manager
             from utils.llm_client import LLMClient
-            from config.credentials_manager import CredentialsManager
+            from config.credentials_manager import get_credentials_manager
             
-            credentials_manager = CredentialsManager()
+            credentials_manager = get_credentials_manager()
             llm_client = LLMClient(credentials_manager=credentials_manager)
             
             # Check if we have an API key
@@ -1,10 +1,80 @@
 import os
+import re
+import mmap
+import threading
 import dotenv
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+# KEY=value lines in a .env file
+_ENV_LINE_RE = re.compile(rb"^([A-Z_][A-Z0-9_]*)=(.*)$", re.M)
+
+# Files larger than this are scanned through mmap; smaller ones are cheaper to read()
+ENV_MMAP_THRESHOLD = 4096
+
+# Parsed .env files: (absolute path, mtime_ns) -> {name: value}
+_ENV_CACHE = {}
+_env_cache_lock = threading.Lock()
+
+
+def read_env_file(path=".env"):
+    """
+    Parse a .env file into a dict, re-reading it only when its mtime changes.
+
+    Unlike load_environment_variables() this does not touch os.environ, so it
+    can be used to see what a .env file defines.
+
+    Args:
+        path (str | Path): Path to the .env file
+
+    Returns:
+        dict: Variable name -> value (empty if unreadable), or None if there is no such file
+    """
+    path = os.path.abspath(path)
+    # The stat doubles as the existence check, so a missing file costs one syscall
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Error reading {path}: {e}")
+        return {}
+    key = (path, stat.st_mtime_ns)
+    with _env_cache_lock:
+        values = _ENV_CACHE.get(key)
+        if values is not None:
+            return values
+
+        values = {}
+        try:
+            with open(path, "rb") as f:
+                # Scan large files through mmap rather than copying them into memory
+                if stat.st_size > ENV_MMAP_THRESHOLD:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    data = f.read()
+                try:
+                    for match in _ENV_LINE_RE.finditer(data):
+                        # The first definition wins
+                        values.setdefault(
+                            match.group(1).decode(),
+                            match.group(2).decode("utf-8", "replace").strip(),
+                        )
+                finally:
+                    if isinstance(data, mmap.mmap):
+                        data.close()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Error reading {path}: {e}")
+            return {}
+
+        # Drop the entry for an older version of this file
+        for stale in [k for k in _ENV_CACHE if k[0] == path]:
+            del _ENV_CACHE[stale]
+        _ENV_CACHE[key] = values
+        return values
+
 
 def load_environment_variables():
     """
@@ -35,24 +105,29 @@ def load_environment_variables():
     
     env_loaded = False
     
-    for env_file in env_paths:
-        if env_file.exists():
-            try:
-                logger.info(f"Loading environment variables from {env_file.absolute()}")
-                dotenv.load_dotenv(str(env_file.absolute()))
-                logger.info(f"Loaded environment variables from {env_file}")
-                env_loaded = True
-                
-                # Check for OPENAI_API_KEY immediately after loading this .env file
-                if "OPENAI_API_KEY" in os.environ:
-                    masked_key = os.environ["OPENAI_API_KEY"][:4] + "..." + os.environ["OPENAI_API_KEY"][-4:] if len(os.environ["OPENAI_API_KEY"]) > 8 else "***"
-                    logger.info(f"Found OPENAI_API_KEY in environment after loading {env_file}: {masked_key}")
-                    # Set in environment (just to be extra sure)
-                    if not os.environ.get("OPENAI_API_KEY_SET"):
-                        os.environ["OPENAI_API_KEY_SET"] = "true"
-                
-            except Exception as e:
-                logger.error(f"Error loading environment from {env_file}: {e}")
+    # Several candidates usually point at the same file; load each one once
+    for env_file in dict.fromkeys(os.path.abspath(path) for path in env_paths):
+        try:
+            # Open directly; a missing file is skipped without a separate exists() check
+            with open(env_file, encoding="utf-8") as stream:
+                logger.info(f"Loading environment variables from {env_file}")
+                dotenv.load_dotenv(stream=stream)
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            logger.error(f"Error loading environment from {env_file}: {e}")
+            continue
+
+        logger.info(f"Loaded environment variables from {env_file}")
+        env_loaded = True
+        
+        # Check for OPENAI_API_KEY immediately after loading this .env file
+        if "OPENAI_API_KEY" in os.environ:
+            masked_key = os.environ["OPENAI_API_KEY"][:4] + "..." + os.environ["OPENAI_API_KEY"][-4:] if len(os.environ["OPENAI_API_KEY"]) > 8 else "***"
+            logger.info(f"Found OPENAI_API_KEY in environment after loading {env_file}: {masked_key}")
+            # Set in environment (just to be extra sure)
+            if not os.environ.get("OPENAI_API_KEY_SET"):
+                os.environ["OPENAI_API_KEY_SET"] = "true"
     
     if not env_loaded:
         logger.warning("No .env files were successfully loaded")
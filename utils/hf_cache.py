@@ -0,0 +1,42 @@
+import os
+import logging
+import importlib.util
+from pathlib import Path
+from config.settings import HF_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+
+def configure_huggingface_cache(cache_dir=None):
+    """
+    Point the HuggingFace libraries at a persistent cache directory.
+
+    datasets and huggingface_hub read HF_HOME and HF_DATASETS_CACHE when they
+    are first imported, so this must run before either is imported. Values
+    already set in the environment are left alone. hf_transfer is enabled for
+    downloads when it is installed.
+
+    Args:
+        cache_dir (str, optional): Directory to use instead of HF_CACHE_DIR
+
+    Returns:
+        Path: The HF_HOME directory in effect
+    """
+    if cache_dir:
+        os.environ["HF_HOME"] = str(Path(cache_dir).expanduser())
+    else:
+        os.environ.setdefault("HF_HOME", str(HF_CACHE_DIR))
+    hf_home = Path(os.environ["HF_HOME"])
+    os.environ.setdefault("HF_DATASETS_CACHE", str(hf_home / "datasets"))
+
+    # Rust-backed parallel downloads; huggingface_hub errors if this is enabled without the package
+    if importlib.util.find_spec("hf_transfer") is not None:
+        os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+    for directory in (hf_home, Path(os.environ["HF_DATASETS_CACHE"])):
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not create HuggingFace cache directory {directory}: {e}")
+
+    return hf_home
@@ -0,0 +1,53 @@
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Shared session reused by GitHub and HuggingFace calls within one process
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Get or create the process-wide pooled requests session.
+
+    The session keeps connections to api.github.com, huggingface.co and
+    crawled sites alive between calls, so only the first request to each host
+    pays for the TCP/TLS handshake.
+
+    Returns:
+        requests.Session: The shared session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=32,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=[502, 503, 504],
+                    ),
+                )
+                # Crawled sites may be plain HTTP, so pool those connections too
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                logger.debug("Created shared HTTP session")
+                _session = session
+    return _session
+
+
+def close_session():
+    """Close the shared session and release its pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
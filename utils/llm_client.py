@@ -9,7 +9,6 @@ from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
 
-from neo4j.graph_store import GraphStore
 from github.client import GitHubClient
 from utils.task_tracker import TaskTracker
 
@@ -155,7 +154,8 @@ class LLMClient:
             }
             
         try:
-            # Initialize Neo4j graph store
+            # Initialize Neo4j graph store; only this path needs the driver
+            from neo4j.graph_store import GraphStore
             graph_store = GraphStore(graph_name=graph_name)
             if not graph_store.test_connection():
                 return {
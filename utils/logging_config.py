@@ -1,5 +1,6 @@
 import logging
 import logging.handlers
+import re
 import sys
 from pathlib import Path
 from config.settings import (
@@ -71,21 +72,24 @@ def setup_logging(tui_callback=None, secure_logging=True):
         class SensitiveDataFilter(logging.Filter):
             def __init__(self):
                 super().__init__()
+                # Compiled once here since the filter runs on every log record
                 self.patterns = [
-                    (r'token=[^&\s]+', 'token=***REDACTED***'),
-                    (r'password=[^&\s]+', 'password=***REDACTED***'),
-                    (r'key=[^&\s]+', 'key=***REDACTED***'),
-                    (r'Authorization: Bearer [^\s]+', 'Authorization: Bearer ***REDACTED***'),
-                    (r'api_key=[^&\s]+', 'api_key=***REDACTED***'),
-                    (r'\"password\": \"[^\"]+\"', '\"password\": \"***REDACTED***\"'),
-                    (r'\"token\": \"[^\"]+\"', '\"token\": \"***REDACTED***\"')
+                    (re.compile(pattern), replacement)
+                    for pattern, replacement in [
+                        (r'token=[^&\s]+', 'token=***REDACTED***'),
+                        (r'password=[^&\s]+', 'password=***REDACTED***'),
+                        (r'key=[^&\s]+', 'key=***REDACTED***'),
+                        (r'Authorization: Bearer [^\s]+', 'Authorization: Bearer ***REDACTED***'),
+                        (r'api_key=[^&\s]+', 'api_key=***REDACTED***'),
+                        (r'\"password\": \"[^\"]+\"', '\"password\": \"***REDACTED***\"'),
+                        (r'\"token\": \"[^\"]+\"', '\"token\": \"***REDACTED***\"')
+                    ]
                 ]
                 
             def filter(self, record):
                 if isinstance(record.msg, str):
                     for pattern, replacement in self.patterns:
-                        import re
-                        record.msg = re.sub(pattern, replacement, record.msg)
+                        record.msg = pattern.sub(replacement, record.msg)
                 return True
                 
         sensitive_filter = SensitiveDataFilter()
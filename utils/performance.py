@@ -28,6 +28,38 @@ def timing_decorator(func):
     return wrapper
 
 
+def throttle_progress(callback, interval=0.2, min_step=1.0):
+    """Wrap a progress callback so it fires at most every `interval` seconds.
+
+    Updates that move the percentage by at least `min_step`, and the final
+    100% update, are always passed through.
+
+    Args:
+        callback: Function called as callback(percent, message=None)
+        interval: Minimum seconds between updates at the same percentage
+        min_step: Percentage change that is always reported
+
+    Returns:
+        The throttled callback
+    """
+    last_emit = [0.0]
+    last_percent = [-min_step]
+
+    @wraps(callback)
+    def wrapper(percent, message=None):
+        now = time.monotonic()
+        if (
+            now - last_emit[0] > interval
+            or abs(percent - last_percent[0]) >= min_step
+            or percent >= 100
+        ):
+            last_emit[0] = now
+            last_percent[0] = percent
+            callback(percent, message)
+
+    return wrapper
+
+
 class BackgroundTask:
     """Manages a task running in the background."""
 
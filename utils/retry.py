@@ -0,0 +1,97 @@
+import time
+import random
+import logging
+import functools
+from email.utils import parsedate_to_datetime
+import requests
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _retry_after_seconds(response):
+    """Return the delay requested by a Retry-After header, or None."""
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_retryable(exception):
+    """Whether an exception is a transient network or rate-limit failure."""
+    if isinstance(exception, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(exception, requests.HTTPError):
+        response = exception.response
+        return response is not None and response.status_code in RETRY_STATUS_CODES
+    return False
+
+
+def retry_with_backoff(max_attempts=5, initial=1.0, factor=2.0, max_delay=60.0, jitter=True):
+    """
+    Retry a function on rate limiting (429) and transient HTTP errors.
+
+    Delays grow exponentially from `initial`, capped at `max_delay`, with
+    random jitter so parallel callers do not retry in lockstep. A Retry-After
+    header on the response takes precedence over the computed delay.
+    huggingface_hub's HfHubHTTPError subclasses requests.HTTPError, so Hub
+    calls are covered too.
+
+    Args:
+        max_attempts (int): Total number of attempts, including the first
+        initial (float): Delay in seconds before the first retry
+        factor (float): Multiplier applied to the delay after each retry
+        max_delay (float): Upper bound for a single delay in seconds
+        jitter (bool): Whether to add up to `initial` seconds of random delay
+
+    Returns:
+        callable: The decorator
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == max_attempts or not _is_retryable(e):
+                        raise
+                    delay = _retry_after_seconds(getattr(e, "response", None))
+                    if delay is None:
+                        delay = initial * factor ** (attempt - 1)
+                        if jitter:
+                            delay += random.uniform(0, initial)
+                    delay = min(delay, max_delay)
+                    logger.warning(
+                        f"{getattr(func, '__name__', 'call')} failed ({e}); retrying in {delay:.1f}s "
+                        f"(attempt {attempt}/{max_attempts})"
+                    )
+                    time.sleep(delay)
+        return wrapper
+    return decorator
+
+
+def call_with_backoff(func, *args, **kwargs):
+    """
+    Call func once with the default retry_with_backoff() policy.
+
+    Args:
+        func (callable): Function to call
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The return value of func
+    """
+    return retry_with_backoff()(func)(*args, **kwargs)
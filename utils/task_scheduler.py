@@ -1,12 +1,14 @@
 import os
 import sys
 import logging
-import json
 import datetime
 import subprocess
+import re
+import time
 from pathlib import Path
 from crontab import CronTab
 from config.settings import APP_DIR
+from utils import json_io
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +16,42 @@ logger = logging.getLogger(__name__)
 SCHEDULES_DIR = APP_DIR / "schedules"
 SCHEDULES_DIR.mkdir(exist_ok=True, parents=True)
 
+# Per-user crontab files; usually only readable by root, in which case a TTL is used instead
+CRON_SPOOL_DIRS = (Path("/var/spool/cron/crontabs"), Path("/var/spool/cron"), Path("/usr/lib/cron/tabs"))
+# Seconds before the crontab is re-read when its spool file cannot be checked
+CRON_CACHE_TTL = 5
+
+_TASK_ID_RE = re.compile(r"--task-id\s+(\S+)")
+
+# One crontab field: "*", a number, range or step, or a comma-separated list of those
+CRON_FIELD_RE = re.compile(r"^(\*(/[0-9]+)?|[0-9]+(-[0-9]+)?(/[0-9]+)?)(,([0-9]+(-[0-9]+)?(/[0-9]+)?))*$")
+
+
+def is_valid_cron_field(value):
+    """
+    Check one crontab field (minute, hour, day, month or day of week) for valid syntax.
+
+    Args:
+        value (str): Field value as typed by the user
+
+    Returns:
+        bool: Whether the value is a well-formed crontab field
+    """
+    return bool(CRON_FIELD_RE.match(value.strip()))
+
+
+def _custom_cron_expression(kwargs):
+    """Return the cron expression for a custom schedule from its kwargs."""
+    if kwargs.get("cron_expr"):
+        return kwargs["cron_expr"]
+    return " ".join((
+        kwargs.get("minute", "0"),
+        kwargs.get("hour", "0"),
+        kwargs.get("day", "*"),
+        kwargs.get("month", "*"),
+        kwargs.get("day_of_week", "*"),
+    ))
+
 class TaskScheduler:
     """Manages scheduled tasks for automatic dataset updates."""
     
@@ -34,6 +72,64 @@ class TaskScheduler:
         except Exception as e:
             logger.error(f"Failed to initialize crontab: {e}")
             self.crontab = None
+
+        # Jobs by task ID, rebuilt only when the crontab changes
+        self._cron_cache = None
+        self._cron_stat = self._crontab_signature()
+        self._cron_loaded_at = time.monotonic()
+
+    def _crontab_signature(self):
+        """Return (mtime, size) of the user's crontab spool file, or None if it cannot be read."""
+        for spool_dir in CRON_SPOOL_DIRS:
+            try:
+                stat = (spool_dir / self.username).stat()
+                return stat.st_mtime_ns, stat.st_size
+            except (OSError, TypeError):
+                continue
+        return None
+
+    def _refresh_crontab(self):
+        """Re-read the crontab if it changed on disk, or after CRON_CACHE_TTL when that cannot be checked."""
+        signature = self._crontab_signature()
+        if signature is not None:
+            if signature == self._cron_stat:
+                return
+        elif time.monotonic() - self._cron_loaded_at < CRON_CACHE_TTL:
+            return
+
+        try:
+            self.crontab.read()
+        except Exception as e:
+            logger.warning(f"Failed to re-read crontab: {e}")
+            return
+        self._cron_stat = signature
+        self._cron_loaded_at = time.monotonic()
+        self._cron_cache = None
+
+    def _invalidate_cron_cache(self):
+        """Drop cached job lookups after this scheduler wrote the crontab."""
+        self._cron_cache = None
+        self._cron_stat = self._crontab_signature()
+        self._cron_loaded_at = time.monotonic()
+
+    def _jobs_by_task_id(self):
+        """
+        Map task IDs to their cron jobs, re-reading the crontab only when needed.
+
+        Returns:
+            dict: Task ID to CronTab job
+        """
+        if not self.crontab:
+            return {}
+        self._refresh_crontab()
+        if self._cron_cache is None:
+            jobs = {}
+            for job in self.crontab:
+                match = _TASK_ID_RE.search(job.command)
+                if match:
+                    jobs.setdefault(match.group(1), job)
+            self._cron_cache = jobs
+        return self._cron_cache
     
     def list_scheduled_tasks(self):
         """
@@ -43,27 +139,24 @@ class TaskScheduler:
             list: List of scheduled task configurations
         """
         scheduled_tasks = []
+        jobs = self._jobs_by_task_id()
         
         # Read all task configuration files
         for task_file in self.schedules_dir.glob("*.json"):
             try:
-                with open(task_file, "r") as f:
-                    task_data = json.load(f)
+                task_data = json_io.loads(task_file.read_bytes())
                     
                 # Add human-readable next run time
-                task_id = task_data.get("id")
-                if task_id and self.crontab:
-                    for job in self.crontab:
-                        if f"--task-id {task_id}" in job.command:
-                            # Calculate next run time
-                            schedule = job.schedule(date_from=datetime.datetime.now())
-                            next_run = schedule.get_next()
-                            if next_run:
-                                task_data["next_run"] = next_run.strftime("%Y-%m-%d %H:%M:%S")
-                            
-                            # Get schedule description
-                            task_data["schedule_description"] = self._get_schedule_description(job)
-                            break
+                job = jobs.get(task_data.get("id"))
+                if job is not None:
+                    # Calculate next run time
+                    schedule = job.schedule(date_from=datetime.datetime.now())
+                    next_run = schedule.get_next()
+                    if next_run:
+                        task_data["next_run"] = next_run.strftime("%Y-%m-%d %H:%M:%S")
+                    
+                    # Get schedule description
+                    task_data["schedule_description"] = self._get_schedule_description(job)
                 
                 scheduled_tasks.append(task_data)
             except Exception as e:
@@ -160,15 +253,10 @@ class TaskScheduler:
             job.setall("0 0 1 * *")
             schedule_desc = "Monthly on the 1st at midnight"
         elif schedule_type == "custom":
-            # Custom schedule using provided values
-            minute = kwargs.get("minute", "0")
-            hour = kwargs.get("hour", "0")
-            day = kwargs.get("day", "*")
-            month = kwargs.get("month", "*")
-            day_of_week = kwargs.get("day_of_week", "*")
-            
-            job.setall(f"{minute} {hour} {day} {month} {day_of_week}")
-            schedule_desc = f"Custom schedule: {minute} {hour} {day} {month} {day_of_week}"
+            # Custom schedule using provided values; callers may pass a prebuilt cron_expr
+            cron_expr = _custom_cron_expression(kwargs)
+            job.setall(cron_expr)
+            schedule_desc = f"Custom schedule: {cron_expr}"
         else:
             logger.error(f"Invalid schedule type: {schedule_type}")
             return None
@@ -176,6 +264,7 @@ class TaskScheduler:
         # Save the crontab
         try:
             self.crontab.write()
+            self._invalidate_cron_cache()
             logger.info(f"Added cron job for task {task_id}: {schedule_desc}")
         except Exception as e:
             logger.error(f"Failed to write crontab: {e}")
@@ -208,8 +297,7 @@ class TaskScheduler:
         # Save task configuration
         task_file = self.schedules_dir / f"{task_id}.json"
         try:
-            with open(task_file, "w") as f:
-                json.dump(task_data, f, indent=2)
+            task_file.write_bytes(json_io.dumps(task_data))
             logger.info(f"Saved task configuration to {task_file}")
             return task_id
         except Exception as e:
@@ -217,6 +305,7 @@ class TaskScheduler:
             # Try to remove the cron job if config save fails
             self.crontab.remove_all(comment=f"Dataset update: {dataset_name}")
             self.crontab.write()
+            self._invalidate_cron_cache()
             return None
     
     def delete_scheduled_task(self, task_id):
@@ -244,6 +333,7 @@ class TaskScheduler:
         if found:
             try:
                 self.crontab.write()
+                self._invalidate_cron_cache()
                 logger.info(f"Removed cron job for task {task_id}")
             except Exception as e:
                 logger.error(f"Failed to write crontab after removing job: {e}")
@@ -285,8 +375,7 @@ class TaskScheduler:
             return False
         
         try:
-            with open(task_file, "r") as f:
-                task_data = json.load(f)
+            task_data = json_io.loads(task_file.read_bytes())
         except Exception as e:
             logger.error(f"Failed to read task configuration: {e}")
             return False
@@ -309,14 +398,9 @@ class TaskScheduler:
                     job.setall("0 0 1 * *")
                     schedule_desc = "Monthly on the 1st at midnight"
                 elif schedule_type == "custom":
-                    minute = kwargs.get("minute", "0")
-                    hour = kwargs.get("hour", "0")
-                    day = kwargs.get("day", "*")
-                    month = kwargs.get("month", "*")
-                    day_of_week = kwargs.get("day_of_week", "*")
-                    
-                    job.setall(f"{minute} {hour} {day} {month} {day_of_week}")
-                    schedule_desc = f"Custom schedule: {minute} {hour} {day} {month} {day_of_week}"
+                    cron_expr = _custom_cron_expression(kwargs)
+                    job.setall(cron_expr)
+                    schedule_desc = f"Custom schedule: {cron_expr}"
                 else:
                     logger.error(f"Invalid schedule type: {schedule_type}")
                     return False
@@ -331,6 +415,7 @@ class TaskScheduler:
         # Save the updated crontab
         try:
             self.crontab.write()
+            self._invalidate_cron_cache()
             logger.info(f"Updated cron job for task {task_id}: {schedule_desc}")
         except Exception as e:
             logger.error(f"Failed to write crontab after updating job: {e}")
@@ -355,8 +440,7 @@ class TaskScheduler:
         
         # Save updated task configuration
         try:
-            with open(task_file, "w") as f:
-                json.dump(task_data, f, indent=2)
+            task_file.write_bytes(json_io.dumps(task_data))
             logger.info(f"Updated task configuration: {task_file}")
             return True
         except Exception as e:
@@ -379,18 +463,15 @@ class TaskScheduler:
             return None
         
         try:
-            with open(task_file, "r") as f:
-                task_data = json.load(f)
+            task_data = json_io.loads(task_file.read_bytes())
                 
             # Add next run time if available
-            if self.crontab:
-                for job in self.crontab:
-                    if f"--task-id {task_id}" in job.command:
-                        schedule = job.schedule(date_from=datetime.datetime.now())
-                        next_run = schedule.get_next()
-                        if next_run:
-                            task_data["next_run"] = next_run.strftime("%Y-%m-%d %H:%M:%S")
-                        break
+            job = self._jobs_by_task_id().get(task_id)
+            if job is not None:
+                schedule = job.schedule(date_from=datetime.datetime.now())
+                next_run = schedule.get_next()
+                if next_run:
+                    task_data["next_run"] = next_run.strftime("%Y-%m-%d %H:%M:%S")
                 
             return task_data
         except Exception as e:
@@ -1,10 +1,12 @@
-import json
 import logging
 import os
 import shutil
+import time
+import threading
 from pathlib import Path
 from datetime import datetime
 from config.settings import CACHE_DIR, APP_DIR
+from utils import json_io
 
 logger = logging.getLogger(__name__)
 
@@ -12,9 +14,22 @@ logger = logging.getLogger(__name__)
 TASKS_DIR = APP_DIR / "tasks"
 TASKS_DIR.mkdir(exist_ok=True, parents=True)
 
+# How long a list_resumable_tasks() scan is reused before re-reading the task files
+RESUMABLE_TASKS_CACHE_TTL = 5
+
 
 class TaskTracker:
     """Tracks dataset creation tasks and manages resumption capabilities."""
+
+    # Process-wide cache of list_resumable_tasks(): (fetched_at, tasks) or None
+    _resumable_cache = None
+    _resumable_cache_lock = threading.Lock()
+
+    @classmethod
+    def clear_resumable_cache(cls):
+        """Drop the cached resumable task list after any task changes."""
+        with cls._resumable_cache_lock:
+            cls._resumable_cache = None
     
     def __init__(self):
         """Initialize the task tracker."""
@@ -51,8 +66,8 @@ class TaskTracker:
         
         # Save task data
         task_file = self.tasks_dir / f"{task_id}.json"
-        with open(task_file, "w") as f:
-            json.dump(task_data, f, indent=2)
+        task_file.write_bytes(json_io.dumps(task_data))
+        TaskTracker.clear_resumable_cache()
         
         logger.info(f"Created task {task_id}: {description}")
         return task_id
@@ -85,8 +100,8 @@ class TaskTracker:
             
             # Save task data
             task_file = self.tasks_dir / f"{task_id}.json"
-            with open(task_file, "w") as f:
-                json.dump(task_data, f, indent=2)
+            task_file.write_bytes(json_io.dumps(task_data))
+            TaskTracker.clear_resumable_cache()
             
             logger.info(f"Added task {task_id} of type {task_type}")
             return True
@@ -116,8 +131,7 @@ class TaskTracker:
         
         try:
             # Load current task data
-            with open(task_file, "r") as f:
-                task_data = json.load(f)
+            task_data = json_io.loads(task_file.read_bytes())
             
             # Update fields
             if status:
@@ -136,8 +150,8 @@ class TaskTracker:
             task_data["updated_at"] = datetime.now().isoformat()
             
             # Save updated task data
-            with open(task_file, "w") as f:
-                json.dump(task_data, f, indent=2)
+            task_file.write_bytes(json_io.dumps(task_data))
+            TaskTracker.clear_resumable_cache()
             
             return True
             
@@ -162,8 +176,7 @@ class TaskTracker:
         try:
             for task_file in self.tasks_dir.glob("*.json"):
                 try:
-                    with open(task_file, "r") as f:
-                        task_data = json.load(f)
+                    task_data = json_io.loads(task_file.read_bytes())
                     
                     # Apply filters
                     if status and task_data.get("status") != status:
@@ -240,8 +253,7 @@ class TaskTracker:
         
         try:
             # Load current task data
-            with open(task_file, "r") as f:
-                task_data = json.load(f)
+            task_data = json_io.loads(task_file.read_bytes())
             
             # Update progress
             task_data["progress"] = progress
@@ -267,8 +279,8 @@ class TaskTracker:
                 task_data["stage_progress"] = stage_progress
             
             # Save updated task data
-            with open(task_file, "w") as f:
-                json.dump(task_data, f, indent=2)
+            task_file.write_bytes(json_io.dumps(task_data))
+            TaskTracker.clear_resumable_cache()
             
             return True
             
@@ -301,8 +313,7 @@ class TaskTracker:
         
         try:
             # Load current task data
-            with open(task_file, "r") as f:
-                task_data = json.load(f)
+            task_data = json_io.loads(task_file.read_bytes())
             
             # Update task status
             task_data["status"] = "completed" if success else "failed"
@@ -321,8 +332,8 @@ class TaskTracker:
                 task_data["current_stage"] = None
             
             # Save updated task data
-            with open(task_file, "w") as f:
-                json.dump(task_data, f, indent=2)
+            task_file.write_bytes(json_io.dumps(task_data))
+            TaskTracker.clear_resumable_cache()
             
             return True
             
@@ -353,16 +364,15 @@ class TaskTracker:
         
         try:
             # Load current task data
-            with open(task_file, "r") as f:
-                task_data = json.load(f)
+            task_data = json_io.loads(task_file.read_bytes())
             
             # Update task status
             task_data["status"] = "cancelled"
             task_data["cancelled_at"] = datetime.now().isoformat()
             
             # Save updated task data
-            with open(task_file, "w") as f:
-                json.dump(task_data, f, indent=2)
+            task_file.write_bytes(json_io.dumps(task_data))
+            TaskTracker.clear_resumable_cache()
             
             return True
             
@@ -387,8 +397,7 @@ class TaskTracker:
             return None
         
         try:
-            with open(task_file, "r") as f:
-                return json.load(f)
+            return json_io.loads(task_file.read_bytes())
         except Exception as e:
             logger.error(f"Error reading task {task_id}: {e}")
             # For testing purposes, return a mock task object if the file can't be read
@@ -406,16 +415,30 @@ class TaskTracker:
         """
         List tasks that can be resumed.
         
+        The scan is cached for RESUMABLE_TASKS_CACHE_TTL seconds and dropped
+        whenever this tracker writes a task file.
+        
         Returns:
             list: List of resumable task data dictionaries
         """
+        with TaskTracker._resumable_cache_lock:
+            cached = TaskTracker._resumable_cache
+        if cached and time.monotonic() - cached[0] < RESUMABLE_TASKS_CACHE_TTL:
+            return list(cached[1])
+
+        resumable_tasks = self._scan_resumable_tasks()
+        with TaskTracker._resumable_cache_lock:
+            TaskTracker._resumable_cache = (time.monotonic(), resumable_tasks)
+        return list(resumable_tasks)
+
+    def _scan_resumable_tasks(self):
+        """Read every task file and return the ones that can still be resumed."""
         resumable_tasks = []
         
         try:
             for task_file in self.tasks_dir.glob("*.json"):
                 try:
-                    with open(task_file, "r") as f:
-                        task_data = json.load(f)
+                    task_data = json_io.loads(task_file.read_bytes())
                     
                     # Only include tasks that are not completed or failed
                     if task_data.get("status") not in ["completed", "failed"]:
@@ -5,17 +5,36 @@ import signal
 import time
 import os
 import json
+import hashlib
+import threading
 from pathlib import Path
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse, urljoin, urldefrag
 from concurrent.futures import ThreadPoolExecutor
 import requests
 from urllib.robotparser import RobotFileParser
 from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
 from utils.task_tracker import TaskTracker
+from utils.http_session import get_session
 
 logger = logging.getLogger(__name__)
 
+# Graph labels for the dslim/bert-base-NER entity groups
+NER_ENTITY_LABELS = {"PER": "Person", "ORG": "Organization", "LOC": "Location", "MISC": "Concept"}
+
+# Pages fetched at once during a crawl over plain HTTP; per-domain rate limiting
+# still spaces out request starts
+CRAWL_CONCURRENCY = 8
+
+# Headless Chromium instances running at once; each fetch_page() with Playwright
+# launches its own browser, which costs far more memory than an HTTP request.
+# This is the effective crawl concurrency when pages are rendered with Playwright.
+PLAYWRIGHT_CONCURRENCY = 2
+
+# Chat-completions endpoint and model used to turn a user's request into crawl instructions
+OPENAI_API_ENDPOINT = os.getenv("OPENAI_API_ENDPOINT", "https://api.openai.com/v1/chat/completions")
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
+
 # Global executor for background tasks
 _global_executor = None
 
@@ -48,13 +67,19 @@ for sig in (signal.SIGINT, signal.SIGTERM):
 class WebCrawler:
     """Crawls websites and extracts content for dataset creation."""
 
-    def __init__(self, respect_robots_txt=True, rate_limit_delay=1.0):
+    def __init__(self, respect_robots_txt=True, rate_limit_delay=1.0, max_concurrency=CRAWL_CONCURRENCY,
+                 use_playwright=True):
         """
         Initialize the web crawler.
         
         Args:
             respect_robots_txt: Whether to respect robots.txt rules
             rate_limit_delay: Delay between requests in seconds
+            max_concurrency: Maximum number of pages fetched at the same time
+                over plain HTTP; Playwright fetches are capped at PLAYWRIGHT_CONCURRENCY
+            use_playwright: Whether pages are rendered with Playwright by default;
+                False fetches them over the pooled HTTP session, which is faster
+                but skips JavaScript
         """
         self.task_tracker = TaskTracker()
         self.temp_dir = Path("./temp")
@@ -63,6 +88,9 @@ class WebCrawler:
         # Store all visited URLs to avoid duplicates
         self.visited_urls = set()
         
+        # SHA-256 digests of page bodies already crawled, to skip mirrored content
+        self._content_hashes = set()
+        
         # Configure default headers for requests
         self.user_agent = 'othertales-serper/1.0 (https://othertales.com/serper; contact@othertales.com)'
         self.headers = {
@@ -76,6 +104,12 @@ class WebCrawler:
         # Rate limiting
         self.rate_limit_delay = rate_limit_delay
         self.domain_last_access = {}  # Track when we last accessed each domain
+        self._rate_limit_lock = threading.Lock()
+        self.max_concurrency = max(1, max_concurrency)
+        self.use_playwright = use_playwright
+        # Sync Playwright objects are bound to the thread that created them, so
+        # browsers can't be shared across the fetch pool; cap launches instead
+        self._browser_slots = threading.BoundedSemaphore(min(self.max_concurrency, PLAYWRIGHT_CONCURRENCY))
         
         # Status display variables
         self.status_thread = None
@@ -109,7 +143,7 @@ class WebCrawler:
 
     def _get_absolute_url(self, url, base_url):
         """
-        Convert a relative URL to an absolute URL.
+        Convert a relative URL to an absolute URL without its fragment.
         
         Args:
             url: URL to convert
@@ -118,7 +152,8 @@ class WebCrawler:
         Returns:
             str: Absolute URL
         """
-        return urljoin(base_url, url)
+        # page#a and page#b are the same document, so drop the fragment
+        return urldefrag(urljoin(base_url, url))[0]
 
     def _get_robots_parser(self, url):
         """
@@ -181,20 +216,35 @@ class WebCrawler:
         # Extract domain
         domain = urlparse(url).netloc
         
-        # Check if we need to wait
-        current_time = time.time()
-        if domain in self.domain_last_access:
-            last_access_time = self.domain_last_access[domain]
-            elapsed = current_time - last_access_time
-            
-            if elapsed < self.rate_limit_delay:
-                # Need to wait
-                wait_time = self.rate_limit_delay - elapsed
-                logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
-                time.sleep(wait_time)
+        # Reserve the next start slot for this domain; concurrent fetches queue up behind each other
+        with self._rate_limit_lock:
+            current_time = time.time()
+            last_access_time = self.domain_last_access.get(domain)
+            start_time = current_time
+            if last_access_time is not None:
+                start_time = max(current_time, last_access_time + self.rate_limit_delay)
+            self.domain_last_access[domain] = start_time
         
-        # Update last access time
-        self.domain_last_access[domain] = time.time()
+        wait_time = start_time - current_time
+        if wait_time > 0:
+            logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
+            time.sleep(wait_time)
+    
+    def _is_duplicate_content(self, html):
+        """
+        Record a page body and report whether an identical one was already crawled.
+        
+        Args:
+            html: Page HTML
+            
+        Returns:
+            bool: Whether the same content was seen earlier in this crawl
+        """
+        digest = hashlib.sha256(html.encode("utf-8", "replace")).digest()
+        if digest in self._content_hashes:
+            return True
+        self._content_hashes.add(digest)
+        return False
     
     def _extract_urls(self, soup, base_url, url_patterns=None, current_depth=0, max_depth=None):
         """
@@ -215,6 +265,9 @@ class WebCrawler:
             logger.info(f"Reached maximum depth ({max_depth}), stopping extraction of new URLs")
             return []
 
+        # Compile the URL filters once rather than for every link
+        compiled_patterns = [re.compile(pattern) for pattern in url_patterns or []]
+
         urls = []
         for link in soup.find_all('a', href=True):
             url = link['href']
@@ -227,11 +280,10 @@ class WebCrawler:
                     continue
                 
                 # Apply URL pattern filtering if specified
-                if url_patterns:
-                    import re
+                if compiled_patterns:
                     matches = False
-                    for pattern in url_patterns:
-                        if re.search(pattern, absolute_url):
+                    for pattern in compiled_patterns:
+                        if pattern.search(absolute_url):
                             matches = True
                             break
                     
@@ -251,18 +303,21 @@ class WebCrawler:
                 
         return unique_urls
 
-    def fetch_page(self, url, use_playwright=True):
+    def fetch_page(self, url, use_playwright=None):
         """
         Fetch a web page using either requests or Playwright.
         
         Args:
             url: URL to fetch
-            use_playwright: Whether to use Playwright (for JavaScript rendering)
+            use_playwright: Whether to use Playwright (for JavaScript rendering);
+                defaults to the crawler's use_playwright setting
             
         Returns:
             dict: Dictionary with status, content, and soup object
         """
         logger.info(f"Fetching page: {url}")
+        if use_playwright is None:
+            use_playwright = self.use_playwright
         
         # Check robots.txt permissions
         if self.respect_robots_txt and not self._can_fetch(url):
@@ -290,7 +345,7 @@ class WebCrawler:
         try:
             if use_playwright:
                 # Use Playwright for JavaScript-rendered pages
-                with sync_playwright() as p:
+                with self._browser_slots, sync_playwright() as p:
                     browser = p.chromium.launch(headless=True)
                     page = browser.new_page(
                         user_agent=self.user_agent
@@ -333,7 +388,7 @@ class WebCrawler:
                         result["canonical_url"] = canonical['href']
             else:
                 # Use requests for simpler pages
-                response = requests.get(url, headers=self.headers, timeout=30)
+                response = get_session().get(url, headers=self.headers, timeout=30)
                 response.raise_for_status()
                 
                 html = response.text
@@ -364,6 +419,23 @@ class WebCrawler:
             
         return result
 
+    def _fetch_pages(self, urls):
+        """
+        Fetch several pages concurrently.
+        
+        Args:
+            urls: URLs to fetch
+            
+        Returns:
+            list: fetch_page() results in the same order as urls
+        """
+        if len(urls) == 1:
+            return [self.fetch_page(urls[0])]
+        # Playwright fetches queue on the browser slots, so extra threads would only wait
+        concurrency = min(self.max_concurrency, PLAYWRIGHT_CONCURRENCY) if self.use_playwright else self.max_concurrency
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(urls))) as executor:
+            return list(executor.map(self.fetch_page, urls))
+
     def html_to_markdown(self, html, url):
         """
         Convert HTML to markdown using jinaai/Reader-LMv2 model.
@@ -501,7 +573,6 @@ class WebCrawler:
         Returns:
             dict: A dictionary of crawling instructions
         """
-        import requests
         import json
         import os
         
@@ -521,8 +592,8 @@ class WebCrawler:
             api_key = os.environ.get("OPENAI_API_KEY")
             if not api_key:
                 try:
-                    from config.credentials_manager import CredentialsManager
-                    credentials_manager = CredentialsManager()
+                    from config.credentials_manager import get_credentials_manager
+                    credentials_manager = get_credentials_manager()
                     api_key = credentials_manager.get_openai_key()
                 except (ImportError, AttributeError):
                     logger.warning("OpenAI API key not found for crawl instructions. Using default settings.")
@@ -544,10 +615,8 @@ class WebCrawler:
                 "Authorization": f"Bearer {api_key}"
             }
             
-            endpoint = os.environ.get("OPENAI_API_ENDPOINT", "https://api.openai.com/v1/chat/completions")
-            
             payload = {
-                "model": os.environ.get("OPENAI_MODEL", "gpt-3.5-turbo"),
+                "model": OPENAI_MODEL,
                 "messages": messages,
                 "temperature": 0.2,
                 "response_format": {"type": "json_object"}
@@ -555,7 +624,7 @@ class WebCrawler:
             
             logger.debug(f"Requesting crawl instructions for URL: {url}")
             response = requests.post(
-                endpoint,
+                OPENAI_API_ENDPOINT,
                 headers=headers,
                 json=payload,
                 timeout=30
@@ -599,7 +668,7 @@ class WebCrawler:
             
     def crawl_website(self, start_url, recursive=False, max_pages=None, progress_callback=None, 
                       _cancellation_event=None, cleanup_temp=False, user_instructions=None, use_ai_guidance=False,
-                      max_depth=None, content_filters=None, url_patterns=None):
+                      max_depth=None, content_filters=None, url_patterns=None, page_callback=None):
         """
         Crawl a website starting from the provided URL.
         
@@ -615,6 +684,7 @@ class WebCrawler:
             max_depth: Maximum depth to crawl from the start URL (None means no limit)
             content_filters: List of keywords or patterns to filter content by (inclusive)
             url_patterns: List of regex patterns for URLs to include
+            page_callback: Function called with each page's data as soon as it is crawled
             
         Returns:
             list: List of crawled page data
@@ -647,8 +717,9 @@ class WebCrawler:
             else:
                 progress_callback(0, "Starting crawl")
         
-        # Reset visited URLs
+        # Reset visited URLs and seen content
         self.visited_urls = set()
+        self._content_hashes = set()
         
         # Queue of URLs to visit (with depth tracking)
         to_visit = [(start_url, 0)]  # (url, depth)
@@ -673,173 +744,181 @@ class WebCrawler:
                 progress_percent = min(95, page_count / max(1, len(to_visit) + page_count) * 100)
                 progress_callback(progress_percent, f"Crawled {page_count} pages, {len(to_visit)} in queue")
             
-            # Get next URL to visit (and its depth if available)
-            url_info = to_visit.pop(0)
-            if isinstance(url_info, tuple) and len(url_info) == 2:
-                url, current_depth = url_info
-            else:
-                url = url_info
-                current_depth = 0
-            
-            # Skip if already visited
-            if url in self.visited_urls:
-                continue
-            
-            # Mark as visited
-            self.visited_urls.add(url)
-            
-            # Fetch the page
-            page_data = self.fetch_page(url)
-            # Add depth information
-            page_data["depth"] = current_depth
+            # Take the next batch of unvisited URLs (and their depths) from the queue
+            batch_size = self.max_concurrency
+            if max_pages is not None:
+                batch_size = min(batch_size, max_pages - page_count)
+            batch = []
+            while to_visit and len(batch) < batch_size:
+                url_info = to_visit.pop(0)
+                if isinstance(url_info, tuple) and len(url_info) == 2:
+                    url, current_depth = url_info
+                else:
+                    url = url_info
+                    current_depth = 0
+                
+                # Skip if already visited
+                if url in self.visited_urls:
+                    continue
+                
+                # Mark as visited
+                self.visited_urls.add(url)
+                batch.append((url, current_depth))
             
-            if page_data["status"] == "success":
-                # Convert HTML to markdown
-                markdown = self.html_to_markdown(page_data["html"], url)
+            # Fetch the batch concurrently, then process pages in queue order
+            batch_pages = self._fetch_pages([url for url, _ in batch]) if batch else []
+            for (url, current_depth), page_data in zip(batch, batch_pages):
+                # Add depth information
+                page_data["depth"] = current_depth
                 
-                # Generate unique filename
-                parsed_url = urlparse(url)
-                filename = parsed_url.netloc + parsed_url.path.replace('/', '_')
-                if not filename.endswith('.md'):
-                    filename += '.md'
+                if page_data["status"] == "success" and self._is_duplicate_content(page_data["html"]):
+                    logger.info(f"Skipping {url}: same content as an already crawled page")
+                elif page_data["status"] == "success":
+                    # Convert HTML to markdown
+                    markdown = self.html_to_markdown(page_data["html"], url)
                 
-                # Save to temp directory
-                file_path = self.temp_dir / filename
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(markdown)
+                    # Generate unique filename
+                    parsed_url = urlparse(url)
+                    filename = parsed_url.netloc + parsed_url.path.replace('/', '_')
+                    if not filename.endswith('.md'):
+                        filename += '.md'
                 
-                # Apply content selectors from AI instructions if available
-                if ai_instructions and ai_instructions.get("content_selectors"):
-                    try:
-                        # Create a new soup from the markdown for further processing
-                        filtered_content = ""
-                        soup_copy = page_data["soup"]
+                    # Save to temp directory
+                    file_path = self.temp_dir / filename
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        f.write(markdown)
+                
+                    # Apply content selectors from AI instructions if available
+                    if ai_instructions and ai_instructions.get("content_selectors"):
+                        try:
+                            # Create a new soup from the markdown for further processing
+                            filtered_content = ""
+                            soup_copy = page_data["soup"]
                         
-                        # Apply each selector
-                        for selector in ai_instructions["content_selectors"]:
-                            try:
-                                selected_elements = soup_copy.select(selector)
-                                if selected_elements:
-                                    for element in selected_elements:
-                                        filtered_content += str(element) + "\n\n"
+                            # Apply each selector
+                            for selector in ai_instructions["content_selectors"]:
+                                try:
+                                    selected_elements = soup_copy.select(selector)
+                                    if selected_elements:
+                                        for element in selected_elements:
+                                            filtered_content += str(element) + "\n\n"
                                         
-                                    logger.debug(f"Applied selector '{selector}' found {len(selected_elements)} elements")
-                            except Exception as selector_error:
-                                logger.warning(f"Error applying selector '{selector}': {str(selector_error)}")
+                                        logger.debug(f"Applied selector '{selector}' found {len(selected_elements)} elements")
+                                except Exception as selector_error:
+                                    logger.warning(f"Error applying selector '{selector}': {str(selector_error)}")
                         
-                        # If we extracted content with selectors, reconvert it to markdown
-                        if filtered_content and len(filtered_content) > 10:
-                            logger.info(f"Using AI-selected content for {url}")
+                            # If we extracted content with selectors, reconvert it to markdown
+                            if filtered_content and len(filtered_content) > 10:
+                                logger.info(f"Using AI-selected content for {url}")
                             
-                            # Convert the filtered HTML to markdown
-                            filtered_markdown = self.html_to_markdown(filtered_content, url)
+                                # Convert the filtered HTML to markdown
+                                filtered_markdown = self.html_to_markdown(filtered_content, url)
                             
-                            # If we got good filtered content, replace the original markdown
-                            if filtered_markdown and len(filtered_markdown) > 20:
-                                page_data["ai_filtered"] = True
-                                page_data["original_markdown"] = markdown
-                                markdown = filtered_markdown
-                                page_data["markdown"] = markdown
+                                # If we got good filtered content, replace the original markdown
+                                if filtered_markdown and len(filtered_markdown) > 20:
+                                    page_data["ai_filtered"] = True
+                                    page_data["original_markdown"] = markdown
+                                    markdown = filtered_markdown
+                                    page_data["markdown"] = markdown
                                 
-                                if progress_callback:
-                                    progress_callback(
-                                        page_count / max(1, total_pages) * 100,
-                                        f"Applied {len(ai_instructions['content_selectors'])} AI-guided content selectors"
-                                    )
-                    except Exception as e:
-                        logger.error(f"Error applying AI content selectors: {str(e)}")
+                                    if progress_callback:
+                                        progress_callback(
+                                            page_count / max(1, total_pages) * 100,
+                                            f"Applied {len(ai_instructions['content_selectors'])} AI-guided content selectors"
+                                        )
+                        except Exception as e:
+                            logger.error(f"Error applying AI content selectors: {str(e)}")
                 
-                # Add to results
-                page_data["markdown"] = markdown
-                page_data["local_path"] = str(file_path)
+                    # Add to results
+                    page_data["markdown"] = markdown
+                    page_data["local_path"] = str(file_path)
                 
-                # Add AI guidance information if applicable
-                if ai_instructions:
-                    page_data["ai_guided"] = True
-                    page_data["extraction_goal"] = ai_instructions.get("extraction_goal", "general")
+                    # Add AI guidance information if applicable
+                    if ai_instructions:
+                        page_data["ai_guided"] = True
+                        page_data["extraction_goal"] = ai_instructions.get("extraction_goal", "general")
                     
-                results.append(page_data)
+                    results.append(page_data)
+                    if page_callback:
+                        page_callback(page_data)
                 
-                # Increment page count
-                page_count += 1
+                    # Increment page count
+                    page_count += 1
                 
-                # Apply content filtering if specified
-                if content_filters and page_data.get("markdown"):
-                    content_match = False
-                    for filter_pattern in content_filters:
-                        if filter_pattern.lower() in page_data["markdown"].lower():
-                            content_match = True
-                            logger.info(f"Content filter '{filter_pattern}' matched for {url}")
-                            break
+                    # Apply content filtering if specified
+                    if content_filters and page_data.get("markdown"):
+                        content_match = False
+                        for filter_pattern in content_filters:
+                            if filter_pattern.lower() in page_data["markdown"].lower():
+                                content_match = True
+                                logger.info(f"Content filter '{filter_pattern}' matched for {url}")
+                                break
                     
-                    if not content_match:
-                        logger.info(f"Page content didn't match any content filters, excluding: {url}")
-                        page_data["filtered_out"] = True
-                        # Keep tracking the URL as visited but don't include in final results
-                        continue
+                        if not content_match:
+                            logger.info(f"Page content didn't match any content filters, excluding: {url}")
+                            page_data["filtered_out"] = True
+                            # Keep tracking the URL as visited but don't include in final results
+                            continue
 
-                # Extract URLs and add to queue if recursive
-                if recursive:
-                    if page_data["soup"]:
-                        # Track current depth for this page
-                        current_depth = page_data.get("depth", 0)
+                    # Extract URLs and add to queue if recursive
+                    if recursive:
+                        if page_data["soup"]:
+                            # Track current depth for this page
+                            current_depth = page_data.get("depth", 0)
                         
-                        # Extract URLs with depth and pattern awareness
-                        new_urls = self._extract_urls(
-                            page_data["soup"], 
-                            url, 
-                            url_patterns=url_patterns,
-                            current_depth=current_depth,
-                            max_depth=max_depth
-                        )
+                            # Extract URLs with depth and pattern awareness
+                            new_urls = self._extract_urls(
+                                page_data["soup"], 
+                                url, 
+                                url_patterns=url_patterns,
+                                current_depth=current_depth,
+                                max_depth=max_depth
+                            )
                         
-                        # Filter out already visited or queued URLs
-                        filtered_urls = [u for u in new_urls if u not in self.visited_urls and u not in to_visit]
+                            # Filter out already visited or queued URLs
+                            filtered_urls = [u for u in new_urls if u not in self.visited_urls and u not in to_visit]
                         
-                        # Apply AI prioritization if available
-                        if ai_instructions and ai_instructions.get("priority_content"):
-                            prioritized_urls = []
-                            other_urls = []
+                            # Apply AI prioritization if available
+                            if ai_instructions and ai_instructions.get("priority_content"):
+                                prioritized_urls = []
+                                other_urls = []
                             
-                            for link in filtered_urls:
-                                # Check if link matches any priority content patterns
-                                is_priority = False
-                                for pattern in ai_instructions["priority_content"]:
-                                    if pattern.lower() in link.lower():
-                                        is_priority = True
-                                        break
+                                for link in filtered_urls:
+                                    # Check if link matches any priority content patterns
+                                    is_priority = False
+                                    for pattern in ai_instructions["priority_content"]:
+                                        if pattern.lower() in link.lower():
+                                            is_priority = True
+                                            break
                                 
-                                if is_priority:
-                                    prioritized_urls.append(link)
-                                else:
-                                    other_urls.append(link)
+                                    if is_priority:
+                                        prioritized_urls.append(link)
+                                    else:
+                                        other_urls.append(link)
                             
-                            # Create URL objects with depth information
-                            prioritized_with_depth = [(url, current_depth + 1) for url in prioritized_urls]
-                            other_with_depth = [(url, current_depth + 1) for url in other_urls]
+                                # Create URL objects with depth information
+                                prioritized_with_depth = [(url, current_depth + 1) for url in prioritized_urls]
+                                other_with_depth = [(url, current_depth + 1) for url in other_urls]
                             
-                            # Add prioritized links first
-                            to_visit_with_depth = [(u, d) for u, d in prioritized_with_depth if u not in [x[0] for x in to_visit]]
-                            to_visit_with_depth.extend([(u, d) for u, d in to_visit_with_depth + other_with_depth if u not in [x[0] for x in to_visit]])
+                                # Add prioritized links first
+                                to_visit_with_depth = [(u, d) for u, d in prioritized_with_depth if u not in [x[0] for x in to_visit]]
+                                to_visit_with_depth.extend([(u, d) for u, d in to_visit_with_depth + other_with_depth if u not in [x[0] for x in to_visit]])
                             
-                            # Update to_visit with the new structure
-                            to_visit = to_visit_with_depth
+                                # Update to_visit with the new structure
+                                to_visit = to_visit_with_depth
                             
-                            if prioritized_urls and progress_callback:
-                                progress_callback(
-                                    page_count / max(1, total_pages) * 100, 
-                                    f"Found {len(prioritized_urls)} priority links matching AI criteria"
-                                )
-                        else:
-                            # Standard link handling with depth tracking
-                            url_with_depth = [(url, current_depth + 1) for url in filtered_urls]
-                            to_visit.extend(url_with_depth)
+                                if prioritized_urls and progress_callback:
+                                    progress_callback(
+                                        page_count / max(1, total_pages) * 100, 
+                                        f"Found {len(prioritized_urls)} priority links matching AI criteria"
+                                    )
+                            else:
+                                # Standard link handling with depth tracking
+                                url_with_depth = [(url, current_depth + 1) for url in filtered_urls]
+                                to_visit.extend(url_with_depth)
                         
-                        # Update total pages estimate
-                        total_pages = max(total_pages, page_count + len(to_visit))
-            
-            # Respect rate limiting
-            time.sleep(1)
+                            # Update total pages estimate
+                            total_pages = max(total_pages, page_count + len(to_visit))
         
         # Complete progress
         if progress_callback:
@@ -864,7 +943,7 @@ class WebCrawler:
                             # Fetch the missed page
                             missed_page = self.fetch_page(url)
                             
-                            if missed_page["status"] == "success":
+                            if missed_page["status"] == "success" and not self._is_duplicate_content(missed_page["html"]):
                                 # Convert HTML to markdown
                                 markdown = self.html_to_markdown(missed_page["html"], url)
                                 
@@ -883,6 +962,8 @@ class WebCrawler:
                                 missed_page["markdown"] = markdown
                                 missed_page["local_path"] = str(file_path)
                                 results.append(missed_page)
+                                if page_callback:
+                                    page_callback(missed_page)
                                 
                                 # Mark as visited
                                 self.visited_urls.add(url)
@@ -960,20 +1041,34 @@ class WebCrawler:
             # Initialize graph store
             graph_store = GraphStore()
             
-            # Add documents to graph
-            for page in crawled_data:
-                # Basic document metadata
-                document_data = {
+            # Add all documents to the graph in batched UNWIND writes, keyed by URL
+            # so re-exporting a page updates its node instead of duplicating it
+            fetched_at = time.strftime("%Y-%m-%d %H:%M:%S")
+            document_ids = graph_store.add_documents([
+                {
+                    "id": GraphStore.document_id(page["url"]),
                     "url": page["url"],
                     "title": page["title"] or "Unknown Title",
                     "description": page["meta_description"] or "",
                     "content": page["markdown"],
-                    "fetched_at": time.strftime("%Y-%m-%d %H:%M:%S")
+                    "fetched_at": fetched_at
                 }
-                
-                # Add document to graph
-                document_id = graph_store.add_document(document_data)
-                
+                for page in crawled_data
+            ])
+            
+            if crawled_data and not any(document_ids):
+                logger.error("No crawled pages were added to the knowledge graph; skipping entity export")
+                return False
+            skipped = document_ids.count(None)
+            if skipped:
+                logger.warning(f"Skipping entity export for {skipped} pages that could not be added to the knowledge graph")
+            
+            # Stage NER entities and their MENTIONS links, then write them in one bulk load
+            entity_rows = {}
+            mention_rows = {}
+            for page, document_id in zip(crawled_data, document_ids):
+                if document_id is None:
+                    continue
                 # Extract concepts and entities if available
                 try:
                     from transformers import pipeline
@@ -993,10 +1088,13 @@ class WebCrawler:
                                 grouped_entities[entity_type] = []
                             grouped_entities[entity_type].append(entity["word"])
                     
-                    # Add entities to graph
+                    # Stage entities for the graph
                     for entity_type, entity_words in grouped_entities.items():
+                        label = NER_ENTITY_LABELS.get(entity_type, "Concept")
                         for word in entity_words:
-                            graph_store.add_entity(word, entity_type, document_id)
+                            entity_id = f"{label.lower()}:{word.lower()}"
+                            entity_rows.setdefault(label, {})[entity_id] = {"id": entity_id, "props": {"name": word}}
+                            mention_rows.setdefault(label, []).append({"src": document_id, "dst": entity_id})
                             
                 except ImportError:
                     logger.warning("transformers not installed, skipping entity extraction")
@@ -1004,6 +1102,18 @@ class WebCrawler:
                 except Exception as e:
                     logger.error(f"Error extracting entities: {e}")
             
+            if entity_rows:
+                graph_store.bulk_load(
+                    nodes=[
+                        {"label": label, "rows": list(rows.values())}
+                        for label, rows in entity_rows.items()
+                    ],
+                    edges=[
+                        {"type": "MENTIONS", "source_label": "Document", "target_label": label, "rows": rows}
+                        for label, rows in mention_rows.items()
+                    ],
+                )
+            
             return True
             
         except ImportError: